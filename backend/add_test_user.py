@@ -2,9 +2,9 @@
 import sqlite3
 from datetime import datetime
 
-# Simple bcrypt hash for password "test1234"
-# Generated with: python3 -c "from passlib.context import CryptContext; print(CryptContext(schemes=['bcrypt']).hash('test1234'))"
-HASHED_PASSWORD = "$2b$12$LQv3c1yqBWVHxkd0LHAkCOYz6TtxMQJqhN8/lewJO.7ILWs1Q1Jpu"
+# SHA-256 pre-hashed, cost-10 bcrypt hash for password "test1234"
+# Generated with: python3 -c "from app.auth.password import hash_password; print(hash_password('test1234'))"
+HASHED_PASSWORD = "$sha256$2b$10$d4VF1F5j6HyLH5eWpeAmiu8dCn7zFte9yhFCY3MF63hMqo2.cJeHy"
 
 conn = sqlite3.connect('arbitrage.db')
 cursor = conn.cursor()
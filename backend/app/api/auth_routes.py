@@ -4,14 +4,23 @@ from __future__ import annotations
 from datetime import timedelta
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from pydantic import BaseModel, EmailStr, ConfigDict
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.auth.dependencies import get_current_user
+from app.api.etag import compute_etag, not_modified
+from app.auth.dependencies import get_current_user, invalidate_user
 from app.auth.jwt import ACCESS_TOKEN_EXPIRE_MINUTES, create_access_token
-from app.auth.password import hash_password, verify_password
+from app.auth.password import (
+    hash_password_async,
+    is_recent_login,
+    password_needs_rehash,
+    remember_login,
+    verify_password_async,
+)
 from app.db.session import get_db
 from app.models.db_models import RiskLimit, User
 
@@ -43,7 +52,7 @@ class Token(BaseModel):
 class UserResponse(BaseModel):
     """User info response / 사용자 정보 응답."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, extra="ignore")
 
     id: int
     email: str
@@ -60,34 +69,32 @@ async def register(user_data: UserCreate, db: AsyncSession = Depends(get_db)) ->
     Creates user account with default risk limits.
     기본 리스크 한도와 함께 사용자 계정 생성.
     """
-    # Check if user already exists
-    result = await db.execute(select(User).where(User.email == user_data.email))
-    existing_user = result.scalar_one_or_none()
+    hashed_pwd = await hash_password_async(user_data.password)
+
+    # Insert unless the email is taken, in a single roundtrip / 이메일 중복 시 무시하는 단일 INSERT
+    insert = pg_insert if db.bind.dialect.name == "postgresql" else sqlite_insert
+    new_user = await db.scalar(
+        insert(User)
+        .values(
+            email=user_data.email,
+            hashed_password=hashed_pwd,
+            full_name=user_data.full_name,
+            is_active=True,
+            is_superuser=False,
+        )
+        .on_conflict_do_nothing(index_elements=[User.email])
+        .returning(User)
+    )
 
-    if existing_user:
+    if new_user is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered / 이미 등록된 이메일입니다",
         )
 
-    # Create new user
-    hashed_pwd = hash_password(user_data.password)
-    new_user = User(
-        email=user_data.email,
-        hashed_password=hashed_pwd,
-        full_name=user_data.full_name,
-        is_active=True,
-        is_superuser=False,
-    )
-    db.add(new_user)
-    await db.flush()  # Get user ID
-
-    # Create default risk limits
-    default_limits = RiskLimit(user_id=new_user.id)
-    db.add(default_limits)
-
+    # Default risk limits are flushed with the commit / 기본 리스크 한도는 커밋 시 함께 저장
+    db.add(RiskLimit(user=new_user))
     await db.commit()
-    await db.refresh(new_user)
 
     return new_user
 
@@ -110,12 +117,17 @@ async def login(credentials: UserLogin, db: AsyncSession = Depends(get_db)) -> d
             detail="Incorrect email or password / 이메일 또는 비밀번호가 잘못되었습니다",
         )
 
-    # Verify password
-    if not verify_password(credentials.password, user.hashed_password):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Incorrect email or password / 이메일 또는 비밀번호가 잘못되었습니다",
-        )
+    # Verify password (repeat logins within a short window skip bcrypt)
+    if not is_recent_login(credentials.email, credentials.password, user.id, user.hashed_password):
+        if not await verify_password_async(credentials.password, user.hashed_password):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Incorrect email or password / 이메일 또는 비밀번호가 잘못되었습니다",
+            )
+        if password_needs_rehash(user.hashed_password):
+            user.hashed_password = await hash_password_async(credentials.password)
+            invalidate_user(user.id)
+        remember_login(credentials.email, credentials.password, user.id, user.hashed_password)
 
     # Check if active
     if not user.is_active:
@@ -134,11 +146,25 @@ async def login(credentials: UserLogin, db: AsyncSession = Depends(get_db)) -> d
 
 
 @router.get("/me", response_model=UserResponse)
-async def get_current_user_info(current_user: User = Depends(get_current_user)) -> User:
+async def get_current_user_info(
+    request: Request,
+    current_user: User = Depends(get_current_user),
+) -> Response:
     """
     Get current user information / 현재 사용자 정보 가져오기.
 
     Requires valid JWT token in Authorization header.
     Authorization 헤더에 유효한 JWT 토큰 필요.
+
+    Supports ``If-None-Match``; the ETag is derived from the user id and last update.
+    ``If-None-Match`` 지원 (사용자 ID와 수정 시각 기반 ETag).
     """
-    return current_user
+    etag = compute_etag(current_user.id, current_user.updated_at)
+    cached = not_modified(request, etag)
+    if cached:
+        return cached
+    return Response(
+        content=UserResponse.model_validate(current_user).model_dump_json(),
+        media_type="application/json",
+        headers={"ETag": etag},
+    )
@@ -4,18 +4,13 @@ from __future__ import annotations
 import logging
 from typing import Any, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Request
-from pydantic import BaseModel
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from pydantic import BaseModel, ConfigDict, field_validator
 
+from app.api.etag import compute_etag, not_modified
 from app.auth.dependencies import get_current_user
 from app.models.db_models import User
-from app.services.auto_trader import (
-    AggressiveStrategy,
-    AutoTraderManager,
-    ConservativeStrategy,
-    FundingRateStrategy,
-    get_auto_trader_manager,
-)
+from app.services.auto_trader import get_auto_trader_manager, make_strategy
 
 logger = logging.getLogger(__name__)
 router = APIRouter(tags=["autotrading"])
@@ -31,13 +26,26 @@ class StartAutoTradingRequest(BaseModel):
     # Strategy-specific parameters
     min_spread_bps: Optional[float] = None
     min_expected_pnl_pct: Optional[float] = None
+    # No longer supported; rejected rather than silently ignored / 더 이상 지원하지 않으며 무시 대신 거부
     max_notional: Optional[float] = None
     min_funding_rate_apr: Optional[float] = None
 
+    @field_validator("max_notional")
+    @classmethod
+    def _reject_max_notional(cls, value: Optional[float]) -> None:
+        if value is not None:
+            raise ValueError(
+                "max_notional is not supported; position size is capped by the risk limit "
+                "max_position_size_usd / max_notional은 지원하지 않습니다 (리스크 한도 사용)"
+            )
+        return None
+
 
 class AutoTradingStatus(BaseModel):
     """Auto trading status / 자동 거래 상태."""
 
+    model_config = ConfigDict(extra="ignore")
+
     user_id: int
     is_active: bool
     strategy: Optional[str] = None
@@ -69,25 +77,15 @@ async def start_auto_trading(
             detail="Auto trading already active for this user / 이미 자동 거래가 활성화되어 있습니다",
         )
 
-    # Create strategy based on request
-    if req.strategy == "conservative":
-        strategy = ConservativeStrategy(
-            min_spread_bps=req.min_spread_bps or 50.0,
-            min_expected_pnl_pct=req.min_expected_pnl_pct or 0.5,
-            max_notional=req.max_notional or 1000.0,
-        )
-    elif req.strategy == "aggressive":
-        strategy = AggressiveStrategy(
-            min_spread_bps=req.min_spread_bps or 20.0,
-            min_expected_pnl_pct=req.min_expected_pnl_pct or 0.2,
-            max_notional=req.max_notional or 5000.0,
+    # Create strategy based on request (identical parameters share one instance)
+    try:
+        strategy = make_strategy(
+            req.strategy,
+            min_spread_bps=req.min_spread_bps,
+            min_expected_pnl_pct=req.min_expected_pnl_pct,
+            min_funding_rate_apr=req.min_funding_rate_apr,
         )
-    elif req.strategy == "funding_rate":
-        strategy = FundingRateStrategy(
-            min_funding_rate_apr=req.min_funding_rate_apr or 10.0,
-            max_notional=req.max_notional or 10000.0,
-        )
-    else:
+    except ValueError:
         raise HTTPException(
             status_code=400,
             detail=f"Invalid strategy: {req.strategy}. Must be 'conservative', 'aggressive', or 'funding_rate'",
@@ -99,6 +97,7 @@ async def start_auto_trading(
         strategy=strategy,
         check_interval=req.check_interval,
         dry_run=req.dry_run,
+        strategy_name=req.strategy,
     )
 
     logger.info(
@@ -162,14 +161,17 @@ async def stop_auto_trading(
     }
 
 
-@router.get("/status")
+@router.get("/status", response_model=AutoTradingStatus)
 async def get_auto_trading_status(
     request: Request,
     current_user: User = Depends(get_current_user),
-) -> AutoTradingStatus:
+) -> Response:
     """
     Get auto trading status for current user.
     현재 사용자의 자동 거래 상태 조회.
+
+    Supports ``If-None-Match`` so pollers get 304 while the status is unchanged.
+    상태가 변하지 않으면 ``If-None-Match``에 304로 응답.
     """
     # Get opportunity engine from app state
     engine = getattr(request.app.state, "opportunity_engine", None)
@@ -183,25 +185,26 @@ async def get_auto_trading_status(
     trader = manager.get_trader(current_user.id)
 
     if not trader:
-        return AutoTradingStatus(
+        status = AutoTradingStatus(
             user_id=current_user.id,
             is_active=False,
         )
+    else:
+        status = AutoTradingStatus(
+            user_id=current_user.id,
+            is_active=True,
+            strategy=trader.strategy_name,
+            dry_run=trader.dry_run,
+        )
 
-    # Determine strategy type
-    strategy_name = "unknown"
-    if isinstance(trader.strategy, ConservativeStrategy):
-        strategy_name = "conservative"
-    elif isinstance(trader.strategy, AggressiveStrategy):
-        strategy_name = "aggressive"
-    elif isinstance(trader.strategy, FundingRateStrategy):
-        strategy_name = "funding_rate"
-
-    return AutoTradingStatus(
-        user_id=current_user.id,
-        is_active=True,
-        strategy=strategy_name,
-        dry_run=trader.dry_run,
+    etag = compute_etag(status.user_id, status.is_active, status.strategy, status.dry_run)
+    cached = not_modified(request, etag)
+    if cached:
+        return cached
+    return Response(
+        content=status.model_dump_json(),
+        media_type="application/json",
+        headers={"ETag": etag},
     )
 
 
@@ -0,0 +1,28 @@
+"""ETag helpers for conditional GET responses / 조건부 GET 응답용 ETag 헬퍼."""
+from __future__ import annotations
+
+import hashlib
+from typing import Any
+
+import orjson
+from fastapi import Request, Response
+
+
+def compute_etag(*parts: Any) -> str:
+    """Build a quoted ETag from JSON-serializable parts / JSON 직렬화 가능한 값으로 ETag 생성."""
+    digest = hashlib.blake2b(orjson.dumps(parts, default=str), digest_size=8).hexdigest()
+    return f'"{digest}"'
+
+
+def not_modified(request: Request, etag: str) -> Response | None:
+    """
+    Return a 304 response if the client already holds ``etag``.
+    클라이언트가 동일한 ETag를 가지고 있으면 304 응답 반환.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return None
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    if etag in candidates or "*" in candidates:
+        return Response(status_code=304, headers={"ETag": etag})
+    return None
@@ -1,16 +1,21 @@
 """Execution API routes / 실행 API 라우트."""
 from __future__ import annotations
 
+import hmac
+from collections.abc import AsyncIterator
+from datetime import datetime
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException, Request
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
+from sqlalchemy import select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth.dependencies import get_current_user
 from app.db.session import get_db
-from app.models.db_models import User
-from app.models.opportunity import Opportunity
+from app.models.db_models import ExecutionLog, User
 from app.services.opportunity_engine import OpportunityEngine
 from app.services.order_executor import OrderExecutor
 
@@ -63,12 +68,13 @@ async def execute_opportunity(
         raise HTTPException(status_code=503, detail="Engine not available")
 
     # Find the opportunity
-    opportunities = engine.latest()
-    opportunity: Opportunity | None = None
-    for opp in opportunities:
-        if opp.id == request_data.opportunity_id:
-            opportunity = opp
-            break
+    opportunity = engine.get(request_data.opportunity_id)
+
+    # Constant-time re-check of the user-supplied id / 사용자 입력 ID 상수 시간 재확인
+    if opportunity and not hmac.compare_digest(
+        opportunity.id.encode(), request_data.opportunity_id.encode()
+    ):
+        opportunity = None
 
     if not opportunity:
         raise HTTPException(
@@ -88,35 +94,63 @@ async def execute_opportunity(
 
 @router.get("/history")
 async def get_execution_history(
-    limit: int = 50,
+    before: datetime | None = None,
+    before_id: int | None = None,
+    limit: int = Query(50, ge=1, le=500),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
-) -> dict[str, Any]:
+) -> StreamingResponse:
     """
     Get execution history for current user.
     현재 사용자의 실행 히스토리 조회.
-    """
-    from sqlalchemy import select
 
-    from app.models.db_models import ExecutionLog
+    Rows are streamed from the database and encoded one at a time, keeping the
+    usual ``{"executions": [...], "next_cursor": ...}`` JSON framing.
+    행 단위로 스트리밍 인코딩하며 기존 JSON 형식을 유지합니다.
 
-    result = await db.execute(
-        select(ExecutionLog)
-        .where(ExecutionLog.user_id == current_user.id)
-        .order_by(ExecutionLog.timestamp.desc())
-        .limit(limit)
-    )
-    logs = list(result.scalars().all())
-
-    return {
-        "executions": [
-            {
-                "opportunity_id": log.opportunity_id,
-                "action": log.action,
-                "status": log.status,
-                "details": log.details,
-                "timestamp": log.timestamp.isoformat(),
-            }
-            for log in logs
-        ]
-    }
+    Args:
+        before: Cursor timestamp; only entries older than this are returned.
+        before_id: Cursor id; with ``before``, entries sharing that timestamp
+            and a lower id are included, so no row is skipped between pages.
+        limit: Page size.
+
+    Returns:
+        Page of executions plus ``next_cursor`` / ``next_cursor_id`` for the
+        following page (None at the end)
+    """
+    query = select(ExecutionLog).where(ExecutionLog.user_id == current_user.id)
+    if before is not None:
+        if before_id is not None:
+            # Composite keyset so rows sharing a timestamp are not skipped / 동일 시각 행 누락 방지
+            query = query.where(tuple_(ExecutionLog.timestamp, ExecutionLog.id) < tuple_(before, before_id))
+        else:
+            query = query.where(ExecutionLog.timestamp < before)
+    query = query.order_by(ExecutionLog.timestamp.desc(), ExecutionLog.id.desc()).limit(limit)
+
+    async def encode() -> AsyncIterator[bytes]:
+        yield b'{"executions":['
+        count = 0
+        last_timestamp: datetime | None = None
+        last_id: int | None = None
+        async for log in await db.stream_scalars(query):
+            if count:
+                yield b","
+            yield orjson.dumps(
+                {
+                    "opportunity_id": log.opportunity_id,
+                    "action": log.action,
+                    "status": log.status,
+                    "details": log.details,
+                    "timestamp": log.timestamp,
+                }
+            )
+            count += 1
+            last_timestamp, last_id = log.timestamp, log.id
+        if count < limit:
+            last_timestamp = last_id = None
+        yield (
+            b'],"next_cursor":' + orjson.dumps(last_timestamp)
+            + b',"next_cursor_id":' + orjson.dumps(last_id) + b"}"
+        )
+
+    return StreamingResponse(encode(), media_type="application/json")
@@ -1,12 +1,14 @@
 """Position management API routes / 포지션 관리 API 라우트."""
 from __future__ import annotations
 
+from datetime import datetime
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException
-from pydantic import BaseModel
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, HTTPException, Query
+from pydantic import BaseModel, ConfigDict
+from sqlalchemy import and_, case, func, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer_group
 
 from app.auth.dependencies import get_current_user
 from app.db.session import get_db
@@ -19,6 +21,8 @@ router = APIRouter(tags=["positions"])
 class PositionResponse(BaseModel):
     """Position response model / 포지션 응답 모델."""
 
+    model_config = ConfigDict(from_attributes=True, extra="ignore")
+
     id: int
     opportunity_id: str
     position_type: str
@@ -37,9 +41,6 @@ class PositionResponse(BaseModel):
     realized_pnl_usd: float | None
     exit_reason: str | None
 
-    class Config:
-        from_attributes = True
-
 
 class ClosePositionRequest(BaseModel):
     """Request to close a position / 포지션 종료 요청."""
@@ -50,6 +51,9 @@ class ClosePositionRequest(BaseModel):
 @router.get("/list")
 async def list_positions(
     status: str | None = None,
+    before: datetime | None = None,
+    before_id: int | None = None,
+    limit: int = Query(50, ge=1, le=500),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ) -> dict[str, Any]:
@@ -59,12 +63,36 @@ async def list_positions(
 
     Args:
         status: Filter by status (open, closing, closed, failed). If None, returns all.
+        before: Cursor entry time; only positions entered before this are returned.
+        before_id: Cursor id; with ``before``, positions sharing that entry time
+            and a lower id are included, so no row is skipped between pages.
+        limit: Page size.
 
     Returns:
-        List of positions with PnL details
+        Page of positions with PnL details plus ``next_cursor`` / ``next_cursor_id``
+        (None at the end)
     """
-    # Build query
-    query = select(Position).where(Position.user_id == current_user.id)
+    # Build query over only the columns we return / 반환할 컬럼만 조회
+    query = select(
+        Position.id,
+        Position.opportunity_id,
+        Position.position_type,
+        Position.symbol,
+        Position.status,
+        Position.entry_time,
+        Position.entry_notional,
+        Position.current_pnl_pct,
+        Position.current_pnl_usd,
+        Position.target_profit_pct,
+        Position.stop_loss_pct,
+        Position.entry_legs,
+        Position.exit_legs,
+        Position.exit_time,
+        Position.realized_pnl_pct,
+        Position.realized_pnl_usd,
+        Position.exit_reason,
+        Position.last_update,
+    ).where(Position.user_id == current_user.id)
 
     if status:
         try:
@@ -76,41 +104,32 @@ async def list_positions(
                 detail=f"Invalid status: {status}. Must be one of: open, closing, closed, failed",
             )
 
-    # Order by entry time descending (newest first)
-    query = query.order_by(Position.entry_time.desc())
+    if before is not None:
+        if before_id is not None:
+            # Composite keyset so rows sharing an entry time are not skipped / 동일 시각 행 누락 방지
+            query = query.where(tuple_(Position.entry_time, Position.id) < tuple_(before, before_id))
+        else:
+            query = query.where(Position.entry_time < before)
+
+    # Newest first; id breaks entry-time ties / 최신순, 동일 시각은 id로 정렬
+    query = query.order_by(Position.entry_time.desc(), Position.id.desc()).limit(limit)
 
     result = await db.execute(query)
-    positions = list(result.scalars().all())
 
     # Convert to response format
     positions_data = []
-    for pos in positions:
-        positions_data.append(
-            {
-                "id": pos.id,
-                "opportunity_id": pos.opportunity_id,
-                "position_type": pos.position_type,
-                "symbol": pos.symbol,
-                "status": pos.status.value,
-                "entry_time": pos.entry_time.isoformat() if pos.entry_time else None,
-                "entry_notional": pos.entry_notional,
-                "current_pnl_pct": pos.current_pnl_pct,
-                "current_pnl_usd": pos.current_pnl_usd,
-                "target_profit_pct": pos.target_profit_pct,
-                "stop_loss_pct": pos.stop_loss_pct,
-                "entry_legs": pos.entry_legs or [],
-                "exit_legs": pos.exit_legs,
-                "exit_time": pos.exit_time.isoformat() if pos.exit_time else None,
-                "realized_pnl_pct": pos.realized_pnl_pct,
-                "realized_pnl_usd": pos.realized_pnl_usd,
-                "exit_reason": pos.exit_reason,
-                "last_update": pos.last_update.isoformat() if pos.last_update else None,
-            }
-        )
+    for row in result.mappings():
+        pos = dict(row)
+        pos["status"] = row["status"].value
+        pos["entry_legs"] = row["entry_legs"] or []
+        positions_data.append(pos)
 
+    last = positions_data[-1] if len(positions_data) == limit else None
     return {
         "count": len(positions_data),
         "positions": positions_data,
+        "next_cursor": last["entry_time"] if last else None,
+        "next_cursor_id": last["id"] if last else None,
     }
 
 
@@ -125,10 +144,12 @@ async def get_position(
     특정 포지션의 상세 정보 조회.
     """
     result = await db.execute(
-        select(Position).where(
+        select(Position)
+        .where(
             Position.id == position_id,
             Position.user_id == current_user.id,
         )
+        .options(undefer_group("legs"))
     )
     position = result.scalar_one_or_none()
 
@@ -141,7 +162,7 @@ async def get_position(
         "position_type": position.position_type,
         "symbol": position.symbol,
         "status": position.status.value,
-        "entry_time": position.entry_time.isoformat() if position.entry_time else None,
+        "entry_time": position.entry_time,
         "entry_notional": position.entry_notional,
         "current_pnl_pct": position.current_pnl_pct,
         "current_pnl_usd": position.current_pnl_usd,
@@ -149,12 +170,12 @@ async def get_position(
         "stop_loss_pct": position.stop_loss_pct,
         "entry_legs": position.entry_legs or [],
         "exit_legs": position.exit_legs,
-        "exit_time": position.exit_time.isoformat() if position.exit_time else None,
+        "exit_time": position.exit_time,
         "realized_pnl_pct": position.realized_pnl_pct,
         "realized_pnl_usd": position.realized_pnl_usd,
         "exit_reason": position.exit_reason,
         "position_metadata": position.position_metadata,
-        "last_update": position.last_update.isoformat() if position.last_update else None,
+        "last_update": position.last_update,
     }
 
 
@@ -208,48 +229,52 @@ async def get_position_stats(
         - Total PnL (open + closed)
         - Win rate
     """
-    # Get all positions
-    result = await db.execute(select(Position).where(Position.user_id == current_user.id))
-    positions = list(result.scalars().all())
-
-    if not positions:
-        return {
-            "total_positions": 0,
-            "open_positions": 0,
-            "closed_positions": 0,
-            "total_pnl_usd": 0.0,
-            "open_pnl_usd": 0.0,
-            "realized_pnl_usd": 0.0,
-            "win_rate": 0.0,
-            "avg_pnl_pct": 0.0,
-        }
-
-    open_positions = [p for p in positions if p.status == PositionStatus.OPEN]
-    closed_positions = [p for p in positions if p.status == PositionStatus.CLOSED]
+    # Conditional aggregates in a single scan / 단일 스캔 조건부 집계
+    is_open = Position.status == PositionStatus.OPEN
+    is_closed = Position.status == PositionStatus.CLOSED
+    result = await db.execute(
+        select(
+            func.count(),
+            func.sum(case((is_open, 1), else_=0)),
+            func.sum(case((is_closed, 1), else_=0)),
+            func.sum(case((is_open, Position.current_pnl_usd), else_=0)),
+            func.sum(case((is_closed, Position.realized_pnl_usd), else_=0)),
+            func.sum(case((and_(is_closed, Position.realized_pnl_usd > 0), 1), else_=0)),
+            # AVG skips NULLs, matching open current % and closed realized %
+            func.avg(
+                case(
+                    (is_open, Position.current_pnl_pct),
+                    (is_closed, Position.realized_pnl_pct),
+                    else_=None,
+                )
+            ),
+        ).where(Position.user_id == current_user.id)
+    )
+    (
+        total_positions,
+        open_count,
+        closed_count,
+        open_pnl_usd,
+        realized_pnl_usd,
+        winning_count,
+        avg_pnl_pct,
+    ) = result.one()
 
     # Calculate stats
-    open_pnl_usd = sum(p.current_pnl_usd for p in open_positions if p.current_pnl_usd)
-    realized_pnl_usd = sum(p.realized_pnl_usd for p in closed_positions if p.realized_pnl_usd)
+    open_pnl_usd = open_pnl_usd or 0.0
+    realized_pnl_usd = realized_pnl_usd or 0.0
     total_pnl_usd = open_pnl_usd + realized_pnl_usd
 
     # Win rate (only for closed positions)
-    winning_positions = [p for p in closed_positions if (p.realized_pnl_usd or 0) > 0]
-    win_rate = (len(winning_positions) / len(closed_positions) * 100) if closed_positions else 0.0
-
-    # Average PnL percentage
-    all_pnl_pcts = [
-        p.current_pnl_pct for p in open_positions if p.current_pnl_pct is not None
-    ] + [p.realized_pnl_pct for p in closed_positions if p.realized_pnl_pct is not None]
-
-    avg_pnl_pct = (sum(all_pnl_pcts) / len(all_pnl_pcts)) if all_pnl_pcts else 0.0
+    win_rate = (winning_count / closed_count * 100) if closed_count else 0.0
 
     return {
-        "total_positions": len(positions),
-        "open_positions": len(open_positions),
-        "closed_positions": len(closed_positions),
+        "total_positions": total_positions,
+        "open_positions": open_count or 0,
+        "closed_positions": closed_count or 0,
         "total_pnl_usd": total_pnl_usd,
         "open_pnl_usd": open_pnl_usd,
         "realized_pnl_usd": realized_pnl_usd,
         "win_rate": win_rate,
-        "avg_pnl_pct": avg_pnl_pct,
+        "avg_pnl_pct": avg_pnl_pct or 0.0,
     }
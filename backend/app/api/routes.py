@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-import asyncio
 from typing import Annotated
 
+import orjson
 from fastapi import (
     APIRouter,
     Depends,
@@ -12,12 +12,26 @@ from fastapi import (
     WebSocketDisconnect,
     WebSocketException,
 )
+from fastapi.responses import Response
 
-from app.models.opportunity import Opportunity, OpportunityType
+from app.models.opportunity import Opportunity, OpportunityListAdapter, OpportunityType
 from app.services.opportunity_engine import OpportunityEngine
 
 router = APIRouter()
 
+# Close code for clients too slow to keep up / 느린 클라이언트 종료 코드 (Try Again Later)
+WS_CLOSE_SLOW_CONSUMER = 1013
+
+# Static health payload, encoded once / 고정 헬스체크 응답 (한 번만 인코딩)
+_HEALTH_BODY = orjson.dumps({"status": "ok / 정상"})
+
+
+def _opportunities_response(opportunities: list[Opportunity]) -> Response:
+    return Response(
+        content=OpportunityListAdapter.dump_json(opportunities),
+        media_type="application/json",
+    )
+
 
 def _resolve_engine_from_app(app: any) -> OpportunityEngine:
     engine: OpportunityEngine | None = getattr(app.state, "opportunity_engine", None)
@@ -35,44 +49,46 @@ def get_engine(request: Request) -> OpportunityEngine:
 
 
 @router.get("/health")
-async def health() -> dict[str, str]:
-    return {"status": "ok / 정상"}
+async def health() -> Response:
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 @router.get("/opportunities", response_model=list[Opportunity])
 async def list_opportunities(
     request: Request,
     limit: int = 25,
-) -> list[Opportunity]:
+) -> Response:
     engine = get_engine(request)
-    return engine.latest()[:limit]
+    return _opportunities_response(engine.latest()[:limit])
 
 
 @router.get("/signals/tether-bot", response_model=list[Opportunity])
 async def tether_bot_signals(
     request: Request,
     limit: int = 5,
-) -> list[Opportunity]:
+) -> Response:
     engine = get_engine(request)
     signals = [opp for opp in engine.latest() if opp.type == OpportunityType.KIMCHI_PREMIUM]
-    return signals[:limit]
+    return _opportunities_response(signals[:limit])
 
 
 async def _serve_opportunities_ws(
     websocket: WebSocket, engine: OpportunityEngine
 ) -> None:
     await websocket.accept()
-    queue = engine.subscribe()
+    subscription = engine.subscribe()
     try:
-        await websocket.send_json([opp.model_dump(mode='json') for opp in engine.latest()])
+        await websocket.send_text(engine.latest_message())
         while True:
-            opportunities = await queue.get()
-            await websocket.send_json([opp.model_dump(mode='json') for opp in opportunities])
+            if subscription.backlogged:
+                await websocket.close(code=WS_CLOSE_SLOW_CONSUMER, reason="Client too slow")
+                break
+            # Only the newest pending snapshot is sent / 최신 스냅샷만 전송
+            await websocket.send_text(await subscription.next())
     except WebSocketDisconnect:
         pass
     finally:
-        engine.unsubscribe(queue)
-        await _drain_queue(queue)
+        engine.unsubscribe(subscription)
 
 
 @router.websocket("/ws/opportunities")
@@ -86,14 +102,6 @@ async def opportunities_ws(
     await _serve_opportunities_ws(websocket, engine)
 
 
-async def _drain_queue(queue: asyncio.Queue[list[Opportunity]]) -> None:
-    while not queue.empty():
-        try:
-            queue.get_nowait()
-        except asyncio.QueueEmpty:
-            break
-
-
 @router.websocket("/ws")
 async def opportunities_ws_alias(
     websocket: WebSocket,
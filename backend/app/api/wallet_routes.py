@@ -4,19 +4,39 @@ from __future__ import annotations
 import hashlib
 import hmac
 import logging
+import time
 import uuid
 from base64 import urlsafe_b64encode
+from functools import lru_cache
 from typing import Any
 
 import httpx
-from fastapi import APIRouter, HTTPException, Query
+import orjson
+from fastapi import APIRouter, HTTPException, Query, Request, Response
 
+from app.api.etag import compute_etag, not_modified
 from app.core.config import get_settings
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
+# Static HS256 JWT header, encoded once / 고정 JWT 헤더는 한 번만 인코딩
+_JWT_HEADER_B64 = urlsafe_b64encode(b'{"alg":"HS256","typ":"JWT"}').rstrip(b"=")
+
+
+@lru_cache(maxsize=1)
+def _hmac_template(secret_key: str) -> hmac.HMAC:
+    """Keyed HMAC-SHA256 to copy per signature / 서명마다 복사해 쓰는 HMAC 템플릿."""
+    return hmac.new(secret_key.encode(), digestmod=hashlib.sha256)
+
+
+@lru_cache(maxsize=1)
+def _payload_prefix(access_key: str) -> bytes:
+    """JSON payload up to the nonce value / nonce 값 직전까지의 JSON 페이로드."""
+    return b'{"access_key":' + orjson.dumps(access_key) + b',"nonce":"'
+
+
 def _generate_upbit_jwt() -> str | None:
     """Generate Upbit JWT token for API authentication"""
     settings = get_settings()
@@ -26,73 +46,102 @@ def _generate_upbit_jwt() -> str | None:
     if not access_key or not secret_key:
         return None
 
-    import json
-
-    payload = {
-        "access_key": access_key,
-        "nonce": str(uuid.uuid4()),
-    }
+    # Only the nonce varies per call / 호출마다 nonce만 달라짐
+    payload = _payload_prefix(access_key) + str(uuid.uuid4()).encode() + b'"}'
 
     # Manual JWT construction (HS256)
-    header = urlsafe_b64encode(json.dumps({"alg": "HS256", "typ": "JWT"}).encode()).rstrip(b"=").decode()
-    body = urlsafe_b64encode(json.dumps(payload).encode()).rstrip(b"=").decode()
-    signature = urlsafe_b64encode(
-        hmac.new(secret_key.encode(), f"{header}.{body}".encode(), hashlib.sha256).digest()
-    ).rstrip(b"=").decode()
+    signing_input = _JWT_HEADER_B64 + b"." + urlsafe_b64encode(payload).rstrip(b"=")
+    mac = _hmac_template(secret_key).copy()
+    mac.update(signing_input)
+    signature = urlsafe_b64encode(mac.digest()).rstrip(b"=")
+
+    return (signing_input + b"." + signature).decode()
+
 
-    return f"{header}.{body}.{signature}"
+# wallet_state -> (deposit, withdraw) / 지갑 상태별 입출금 가능 여부
+_WALLET_STATE_FLAGS: dict[str, tuple[bool, bool]] = {
+    "working": (True, True),
+    "deposit_only": (True, False),
+    "withdraw_only": (False, True),
+    "paused": (False, False),
+    "unsupported": (False, False),
+}
+
+
+def _wallet_flags(wallet_state: str) -> dict[str, Any]:
+    deposit, withdraw = _WALLET_STATE_FLAGS.get(wallet_state, (False, False))
+    return {"deposit": deposit, "withdraw": withdraw, "state": wallet_state}
+
+
+# Wallet states change minutes apart, so the transformed body is cached briefly.
+# 지갑 상태는 자주 바뀌지 않으므로 변환 결과를 잠시 캐시합니다.
+WALLET_CACHE_TTL_SECONDS = 30
+
+_wallet_cache: tuple[float, bytes, str] | None = None  # (expires_at, body, etag)
+
+
+def _wallet_response(request: Request, body: bytes, etag: str) -> Response:
+    headers = {"ETag": etag, "Cache-Control": f"max-age={WALLET_CACHE_TTL_SECONDS}"}
+    cached = not_modified(request, etag)
+    if cached:
+        cached.headers.update(headers)
+        return cached
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @router.get("/upbit/wallet-status")
-async def get_upbit_wallet_status(token: str = Query(None, description="Auth token")) -> dict[str, Any]:
+async def get_upbit_wallet_status(
+    request: Request,
+    token: str = Query(None, description="Auth token"),
+) -> Response:
     """
     Proxy for Upbit wallet status API.
     This endpoint runs on a server with fixed IP registered with Upbit.
+    Responses are cached for ``WALLET_CACHE_TTL_SECONDS`` and honour ``If-None-Match``.
     """
+    global _wallet_cache
+
     # Simple token auth (optional)
     settings = get_settings()
     expected_token = settings.wallet_proxy_token
     if expected_token and token != expected_token:
         raise HTTPException(status_code=401, detail="Invalid token")
 
+    if _wallet_cache is not None and _wallet_cache[0] > time.monotonic():
+        return _wallet_response(request, _wallet_cache[1], _wallet_cache[2])
+
     jwt_token = _generate_upbit_jwt()
     if not jwt_token:
         raise HTTPException(status_code=500, detail="Upbit API keys not configured")
 
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        try:
-            response = await client.get(
-                "https://api.upbit.com/v1/status/wallet",
-                headers={"Authorization": f"Bearer {jwt_token}"},
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            # Transform to simpler format
-            result = {}
-            for item in data:
-                currency = item.get("currency", "")
-                wallet_state = item.get("wallet_state", "")
-
-                # wallet_state: working, withdraw_only, deposit_only, paused, unsupported
-                deposit_enabled = wallet_state in ("working", "deposit_only")
-                withdraw_enabled = wallet_state in ("working", "withdraw_only")
-
-                result[currency] = {
-                    "deposit": deposit_enabled,
-                    "withdraw": withdraw_enabled,
-                    "state": wallet_state,
-                }
-
-            return {
-                "success": True,
-                "count": len(result),
-                "data": result,
-            }
-
-        except httpx.HTTPStatusError as e:
-            logger.error(f"Upbit API error: {e.response.status_code} - {e.response.text}")
-            raise HTTPException(status_code=e.response.status_code, detail=str(e))
-        except Exception as e:
-            logger.error(f"Upbit wallet status fetch failed: {e}")
-            raise HTTPException(status_code=500, detail=str(e))
+    client: httpx.AsyncClient = request.app.state.http_client
+    try:
+        response = await client.get(
+            "https://api.upbit.com/v1/status/wallet",
+            headers={"Authorization": f"Bearer {jwt_token}"},
+            timeout=10.0,
+        )
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+
+        # Transform to simpler format
+        result = {
+            item.get("currency", ""): _wallet_flags(item.get("wallet_state", ""))
+            for item in data
+        }
+
+        body = orjson.dumps({
+            "success": True,
+            "count": len(result),
+            "data": result,
+        })
+        etag = compute_etag(result)
+        _wallet_cache = (time.monotonic() + WALLET_CACHE_TTL_SECONDS, body, etag)
+        return _wallet_response(request, body, etag)
+
+    except httpx.HTTPStatusError as e:
+        logger.error(f"Upbit API error: {e.response.status_code} - {e.response.text}")
+        raise HTTPException(status_code=e.response.status_code, detail=str(e))
+    except Exception as e:
+        logger.error(f"Upbit wallet status fetch failed: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
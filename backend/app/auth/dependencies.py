@@ -1,6 +1,8 @@
 """FastAPI authentication dependencies / FastAPI 인증 의존성."""
 from __future__ import annotations
 
+import time
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy import select
@@ -12,6 +14,87 @@ from app.models.db_models import User
 
 security = HTTPBearer()
 
+# Verified bearer tokens are cached for a short window so hot endpoints skip
+# the JWT signature check and the user lookup.
+# 검증된 토큰을 잠시 캐시하여 JWT 검증과 사용자 조회를 생략합니다.
+TOKEN_CACHE_TTL_SECONDS = 60.0
+TOKEN_CACHE_MAX_SIZE = 4096
+
+# User rows are cached by id so fresh tokens for a known user skip the lookup.
+# 사용자 ID 기준으로 캐시하여 새 토큰이어도 DB 조회를 생략합니다.
+USER_CACHE_TTL_SECONDS = 30.0
+USER_CACHE_MAX_SIZE = 10_000
+
+_token_cache: dict[str, tuple[User, float]] = {}  # token -> (user, expires_at)
+_user_cache: dict[int, tuple[User, float]] = {}  # user_id -> (user, expires_at)
+
+
+def _make_room(cache: dict, max_size: int, now: float) -> None:
+    """Purge expired entries, then the oldest one, once a cache is full."""
+    if len(cache) < max_size:
+        return
+    for key in [key for key, (_, exp) in cache.items() if exp <= now]:
+        del cache[key]
+    if len(cache) >= max_size:
+        # Evict the oldest entry (dicts keep insertion order)
+        cache.pop(next(iter(cache)))
+
+
+def _get_cached_user(token: str) -> User | None:
+    """Return the cached user for a token if the entry is still valid / 유효한 캐시 사용자 반환."""
+    entry = _token_cache.get(token)
+    if entry is None:
+        return None
+    user, expires_at = entry
+    if expires_at <= time.time():
+        _token_cache.pop(token, None)
+        return None
+    return user
+
+
+def _cache_user(token: str, user: User, token_exp: float | None) -> None:
+    """Cache a verified token until the TTL or the token expiry, whichever is first."""
+    now = time.time()
+    expires_at = now + TOKEN_CACHE_TTL_SECONDS
+    if token_exp is not None:
+        expires_at = min(expires_at, token_exp)
+    if expires_at <= now:
+        return
+
+    _make_room(_token_cache, TOKEN_CACHE_MAX_SIZE, now)
+    _token_cache[token] = (user, expires_at)
+
+
+def _get_cached_user_by_id(user_id: int) -> User | None:
+    """Return the cached user row for an id if still fresh / 유효한 사용자 캐시 반환."""
+    entry = _user_cache.get(user_id)
+    if entry is None:
+        return None
+    user, expires_at = entry
+    if expires_at <= time.time():
+        _user_cache.pop(user_id, None)
+        return None
+    return user
+
+
+def _cache_user_by_id(user: User) -> None:
+    """Cache a loaded user row for ``USER_CACHE_TTL_SECONDS`` / 사용자 행 캐시."""
+    now = time.time()
+    _make_room(_user_cache, USER_CACHE_MAX_SIZE, now)
+    _user_cache[user.id] = (user, now + USER_CACHE_TTL_SECONDS)
+
+
+def invalidate_token(token: str) -> None:
+    """Drop a token from the verification cache / 토큰 캐시 무효화."""
+    _token_cache.pop(token, None)
+
+
+def invalidate_user(user_id: int) -> None:
+    """Drop the cached row and every cached token of a user / 사용자 캐시 및 토큰 캐시 무효화."""
+    _user_cache.pop(user_id, None)
+    for key in [key for key, (user, _) in _token_cache.items() if user.id == user_id]:
+        del _token_cache[key]
+
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
@@ -22,6 +105,10 @@ async def get_current_user(
     JWT 토큰으로부터 현재 인증된 사용자 가져오기.
     """
     token = credentials.credentials
+    cached_user = _get_cached_user(token)
+    if cached_user is not None:
+        return cached_user
+
     payload = decode_access_token(token)
 
     if payload is None:
@@ -31,15 +118,22 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    user_id: int | None = payload.get("sub")
+    try:
+        user_id = int(payload["sub"])
+    except (KeyError, TypeError, ValueError):
+        user_id = None
     if user_id is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid token payload / 잘못된 토큰 페이로드",
         )
 
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
+    user = _get_cached_user_by_id(user_id)
+    if user is None:
+        result = await db.execute(select(User).where(User.id == user_id))
+        user = result.scalar_one_or_none()
+        if user is not None:
+            _cache_user_by_id(user)
 
     if user is None:
         raise HTTPException(
@@ -53,6 +147,7 @@ async def get_current_user(
             detail="Inactive user / 비활성화된 사용자",
         )
 
+    _cache_user(token, user, payload.get("exp"))
     return user
 
 
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import base64
+from functools import lru_cache
 
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
@@ -11,9 +12,18 @@ from app.core.config import get_settings
 
 settings = get_settings()
 
+# Every Fernet token starts with version byte 0x80, i.e. "gAAAAA" in base64
+_FERNET_TOKEN_PREFIX = b"gAAAAA"
 
+
+@lru_cache(maxsize=1)
 def _get_fernet() -> Fernet:
-    """Get Fernet cipher using app secret key / 앱 시크릿 키로 Fernet 암호화 객체 생성."""
+    """
+    Get Fernet cipher using app secret key / 앱 시크릿 키로 Fernet 암호화 객체 생성.
+
+    The PBKDF2 derivation is deliberately slow, so it runs once per process.
+    의도적으로 느린 PBKDF2 유도는 프로세스당 한 번만 수행.
+    """
     # Derive a key from the secret_key
     kdf = PBKDF2HMAC(
         algorithm=hashes.SHA256(),
@@ -27,14 +37,14 @@ def _get_fernet() -> Fernet:
 
 def encrypt_api_key(api_key: str) -> str:
     """Encrypt an API key / API 키 암호화."""
-    f = _get_fernet()
-    encrypted = f.encrypt(api_key.encode())
-    return base64.b64encode(encrypted).decode()
+    # Fernet tokens are already URL-safe base64 / Fernet 토큰은 이미 base64 형식
+    return _get_fernet().encrypt(api_key.encode()).decode()
 
 
 def decrypt_api_key(encrypted_key: str) -> str:
     """Decrypt an API key / API 키 복호화."""
-    f = _get_fernet()
-    encrypted_bytes = base64.b64decode(encrypted_key.encode())
-    decrypted = f.decrypt(encrypted_bytes)
-    return decrypted.decode()
+    token = encrypted_key.encode()
+    if not token.startswith(_FERNET_TOKEN_PREFIX):
+        # Keys stored before the extra base64 layer was dropped / 이전 이중 base64 형식 호환
+        token = base64.b64decode(token)
+    return _get_fernet().decrypt(token).decode()
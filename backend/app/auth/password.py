@@ -1,14 +1,139 @@
 """Password hashing utilities / 비밀번호 해싱 유틸리티."""
-from passlib.context import CryptContext
+from __future__ import annotations
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+import asyncio
+import base64
+import hashlib
+import hmac
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import bcrypt
+
+from app.core.config import get_settings
+
+# Cost 10 (~50ms) instead of passlib's default 12 (~200ms) keeps interactive
+# logins fast, within OWASP's guidance for bcrypt. Older cost-12 hashes still
+# verify and are re-hashed on the next successful login.
+# 대화형 로그인 속도를 위해 bcrypt cost 10 사용 (기존 해시는 다음 로그인 시 재해싱).
+BCRYPT_ROUNDS = 10
+BCRYPT_IDENT = "$2b$"
+# bcrypt only reads the first 72 bytes / bcrypt는 앞 72바이트만 사용
+BCRYPT_MAX_BYTES = 72
+
+# Passwords are pre-hashed to a fixed 44-char SHA-256 digest before bcrypt, which
+# sidesteps bcrypt's 72-byte truncation. Such hashes carry this prefix so legacy
+# hashes of the raw password can still be told apart and verified.
+# bcrypt 72바이트 제한을 피하기 위해 SHA-256으로 선해싱 (접두사로 구분).
+PREHASH_PREFIX = "$sha256"
+
+# Dedicated pool for bcrypt so login bursts neither block the event loop nor
+# exhaust the default executor. / bcrypt 전용 스레드 풀.
+_bcrypt_executor = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1,
+    thread_name_prefix="bcrypt",
+)
+
+# Recent successful logins, so repeat logins within a short window skip bcrypt.
+# Keys are HMAC digests of "email:password"; plaintext is never stored.
+# 최근 로그인 성공 캐시 (짧은 시간 내 재로그인 시 bcrypt 생략).
+LOGIN_CACHE_TTL_SECONDS = 30.0
+LOGIN_CACHE_MAX_SIZE = 1024
+
+_login_cache: dict[bytes, tuple[int, str, float]] = {}  # digest -> (user_id, hash, expires_at)
+
+
+def _prehash(password: str) -> str:
+    return base64.b64encode(hashlib.sha256(password.encode()).digest()).decode()
+
+
+def _checkpw(secret: bytes, bcrypt_hash: str) -> bool:
+    try:
+        return bcrypt.checkpw(secret[:BCRYPT_MAX_BYTES], bcrypt_hash.encode())
+    except ValueError:
+        # Malformed or non-bcrypt hash / 잘못된 형식의 해시
+        return False
 
 
 def hash_password(password: str) -> str:
-    """Hash a password using bcrypt / bcrypt로 비밀번호 해싱."""
-    return pwd_context.hash(password)
+    """Hash a password using SHA-256 + bcrypt / SHA-256 + bcrypt로 비밀번호 해싱."""
+    salt = bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
+    return PREHASH_PREFIX + bcrypt.hashpw(_prehash(password).encode(), salt).decode()
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a password against its hash / 비밀번호 해시 검증."""
-    return pwd_context.verify(plain_password, hashed_password)
+    """Verify a password against its hash / 비밀번호 해시 검증.
+
+    bcrypt compares the computed digest in constant time.
+    """
+    if hashed_password.startswith(PREHASH_PREFIX):
+        return _checkpw(_prehash(plain_password).encode(), hashed_password[len(PREHASH_PREFIX):])
+    # Legacy hash of the raw password / 기존 원문 비밀번호 해시
+    return _checkpw(plain_password.encode(), hashed_password)
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Check whether a stored hash uses outdated parameters / 재해싱 필요 여부 확인."""
+    if not hashed_password.startswith(PREHASH_PREFIX):
+        return True
+    bcrypt_hash = hashed_password[len(PREHASH_PREFIX):]
+    # Modular crypt format: $2b$<rounds>$<salt+digest>
+    return not bcrypt_hash.startswith(f"{BCRYPT_IDENT}{BCRYPT_ROUNDS:02d}$")
+
+
+async def hash_password_async(password: str) -> str:
+    """Hash a password off the event loop / 이벤트 루프 밖에서 비밀번호 해싱."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_bcrypt_executor, hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password off the event loop / 이벤트 루프 밖에서 비밀번호 검증."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _bcrypt_executor, verify_password, plain_password, hashed_password
+    )
+
+
+def _login_cache_key(email: str, password: str) -> bytes:
+    secret = get_settings().secret_key.encode()
+    return hmac.new(secret, f"{email}:{password}".encode(), hashlib.sha256).digest()
+
+
+def is_recent_login(email: str, password: str, user_id: int, hashed_password: str) -> bool:
+    """Check whether these credentials were verified recently / 최근 검증된 자격 증명인지 확인.
+
+    The entry only matches while the stored hash is unchanged, so a password
+    change invalidates it without an explicit eviction.
+    """
+    key = _login_cache_key(email, password)
+    entry = _login_cache.get(key)
+    if entry is None:
+        return False
+    cached_user_id, cached_hash, expires_at = entry
+    if expires_at <= time.monotonic():
+        _login_cache.pop(key, None)
+        return False
+    return cached_user_id == user_id and hmac.compare_digest(cached_hash, hashed_password)
+
+
+def remember_login(email: str, password: str, user_id: int, hashed_password: str) -> None:
+    """Record credentials that just passed bcrypt verification / bcrypt 검증 통과 기록."""
+    now = time.monotonic()
+    if len(_login_cache) >= LOGIN_CACHE_MAX_SIZE:
+        for key in [key for key, (_, _, exp) in _login_cache.items() if exp <= now]:
+            del _login_cache[key]
+        if len(_login_cache) >= LOGIN_CACHE_MAX_SIZE:
+            _login_cache.pop(next(iter(_login_cache)))
+    _login_cache[_login_cache_key(email, password)] = (
+        user_id,
+        hashed_password,
+        now + LOGIN_CACHE_TTL_SECONDS,
+    )
+
+
+def forget_logins(user_id: int) -> None:
+    """Evict cached logins for a user (e.g. after a password change) / 사용자 로그인 캐시 제거."""
+    for key in [key for key, (uid, _, _) in _login_cache.items() if uid == user_id]:
+        del _login_cache[key]
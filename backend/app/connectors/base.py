@@ -1,10 +1,70 @@
 from __future__ import annotations
 
 import abc
-from typing import Sequence
+import asyncio
+import logging
+import random
+from collections import OrderedDict
+from typing import Any, Iterable, Sequence
 
+import httpx
+import orjson
+
+from app.connectors.stream import BookStream
+from app.core.http import create_http_client
 from app.models.opportunity import MarketQuote
 
+logger = logging.getLogger(__name__)
+
+# Failures a REST fetch is expected to hit: transport/HTTP status errors and
+# malformed payloads (orjson.JSONDecodeError is a ValueError). Anything else is a bug.
+# REST 조회에서 예상되는 실패 (전송/HTTP 오류, 잘못된 응답). 그 외는 버그로 간주.
+FETCH_ERRORS: tuple[type[Exception], ...] = (httpx.HTTPError, KeyError, IndexError, TypeError, ValueError)
+
+# Transient statuses retried with backoff / 백오프 후 재시도하는 일시적 상태 코드
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+# Connection-level failures worth another attempt; timeouts already spent their budget
+# 재시도할 연결 오류 (타임아웃은 이미 대기 시간을 소진했으므로 제외)
+RETRY_TRANSPORT_ERRORS = (httpx.ConnectError, httpx.ReadError, httpx.RemoteProtocolError)
+RETRY_BASE_DELAY_SECONDS = 0.1
+RETRY_MAX_DELAY_SECONDS = 2.0
+# Longer Retry-After values (IP bans) are not waited out / 이보다 긴 Retry-After(IP 차단)는 재시도하지 않음
+MAX_RETRY_AFTER_SECONDS = 10.0
+
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+# Per-connector bound on reusable requests (~symbols x polled endpoints), least recently used evicted
+# 커넥터별 재사용 요청 캐시 상한 (가장 오래 사용되지 않은 요청부터 제거)
+REQUEST_CACHE_SIZE = 256
+
+
+def encode_json_body(payload: Any) -> bytes:
+    """Serialize a fixed request body once, e.g. at ``__init__`` / 고정 요청 본문을 한 번만 직렬화."""
+    return orjson.dumps(payload)
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Exponential backoff with ±50% jitter / ±50% 지터를 적용한 지수 백오프."""
+    return min(RETRY_MAX_DELAY_SECONDS, RETRY_BASE_DELAY_SECONDS * 2**attempt) * random.uniform(0.5, 1.5)
+
+
+def _retry_after(response: httpx.Response) -> float:
+    """Retry-After in seconds, 0 when absent or an HTTP date / Retry-After 초 단위 값."""
+    try:
+        return float(response.headers.get("Retry-After") or 0)
+    except ValueError:
+        return 0.0
+
+
+def check_status(response: httpx.Response) -> None:
+    """``raise_for_status`` with an inline 2xx fast path / 2xx 응답은 바로 통과하는 상태 검사.
+
+    Polled endpoints almost always answer 2xx, where ``raise_for_status`` still
+    costs several attribute lookups per call.
+    """
+    if not 200 <= response.status_code < 300:
+        response.raise_for_status()
+
 
 class MarketConnector(abc.ABC):
     """Abstract base class for market data connectors. / 마켓 데이터 커넥터를 위한 추상 기본 클래스."""
@@ -14,3 +74,166 @@ class MarketConnector(abc.ABC):
     @abc.abstractmethod
     async def fetch_quotes(self) -> Sequence[MarketQuote]:
         """Return the latest tradable quotes for this venue. / 해당 거래소의 최신 호가를 반환합니다."""
+
+
+class RestConnector(MarketConnector):
+    """Base class for connectors polling a REST API over HTTP / REST API 폴링 커넥터 기본 클래스.
+
+    Connectors expect to run on uvloop: uvicorn is started with ``--loop uvloop``
+    and standalone scripts go through :func:`app.core.runtime.run`.
+    커넥터는 uvloop 위에서 실행됩니다 (uvicorn ``--loop uvloop``, 스크립트는 ``runtime.run``).
+    """
+
+    base_url: str = ""
+    # Cap on in-flight requests, None for unbounded / 동시 요청 수 상한 (None이면 무제한)
+    max_concurrency: int | None = None
+    # Extra attempts for transient failures / 일시적 실패 시 추가 시도 횟수
+    max_retries: int = 2
+    retry_statuses: frozenset[int] = RETRY_STATUSES
+    # Optional WebSocket top-of-book feed replacing REST depth polling / REST 호가 폴링을 대체하는 선택적 스트림
+    _stream: BookStream | None = None
+
+    def _init_symbols(self, symbols: Iterable[str]) -> None:
+        """Store symbols and split each one once / 심볼 저장 및 분해 결과 사전 계산."""
+        self._symbols: tuple[str, ...] = tuple(symbols)
+        self._symbol_info = {symbol: self._parse_symbol(symbol) for symbol in self._symbols}
+        # Reverse map for payloads keyed by venue symbol / 거래소 심볼 → 설정 심볼 역매핑
+        self._venue_symbols = {pair: symbol for symbol, (_, _, pair) in self._symbol_info.items()}
+
+    def _parse_symbol(self, symbol: str) -> tuple[str, str, str]:
+        """Split ``BASE/QUOTE`` into (base, quote, venue symbol), e.g. BTCUSDT / 거래소 심볼로 변환."""
+        base, quote = symbol.split("/")
+        return base, quote, base + quote
+
+    def _symbol_parts(self, symbol: str) -> tuple[str, str, str]:
+        """Precomputed parts, parsing symbols outside the configured set / 사전 계산된 심볼 정보 조회."""
+        info = self._symbol_info.get(symbol)
+        return info if info is not None else self._parse_symbol(symbol)
+
+    def _init_client(self, client: httpx.AsyncClient | None, timeout: float) -> None:
+        """Use the injected shared client, or own a private one / 공유 클라이언트 주입 또는 전용 생성."""
+        self._owns_client = client is None
+        self._client = client or create_http_client(timeout)
+        self._timeout = timeout
+        self._semaphore = asyncio.Semaphore(self.max_concurrency) if self.max_concurrency else None
+        self._requests: OrderedDict[tuple[Any, ...], httpx.Request] = OrderedDict()
+
+    def _build_request(
+        self, method: str, path: str, params: dict[str, Any] | None = None, **kwargs: Any
+    ) -> httpx.Request:
+        """Build a request, reusing repeated ones across polls / 반복 요청은 폴링 간 재사용.
+
+        URL, query and header merging is about half of httpx's per-request cost,
+        and polled endpoints repeat the same (method, path, params) every tick.
+        ``content`` is a pre-encoded JSON body (see ``encode_json_body``) and is
+        part of the cache key, so fixed POST bodies are reused as well. Any other
+        argument (timeout, headers, json, ...) bypasses the cache, the cache is an
+        LRU of ``REQUEST_CACHE_SIZE`` entries, and cached requests get the client's
+        current cookies on every reuse.
+        URL/쿼리/헤더 병합 비용이 요청 처리의 절반가량이며 폴링 요청은 매 틱 동일합니다.
+        미리 인코딩된 JSON 본문(``content``)도 캐시 키에 포함되어 고정 POST 요청도 재사용됩니다.
+        그 외 인자(timeout, headers 등)가 있으면 캐시를 쓰지 않으며, 재사용 시 쿠키를 갱신합니다.
+        """
+        content: bytes | None = kwargs.pop("content", None)
+        if kwargs:  # per-call timeout, headers, json=, ...
+            kwargs.setdefault("timeout", self._timeout)
+            return self._client.build_request(
+                method, self.base_url + path, params=params, content=content, **kwargs
+            )
+        requests = self._requests
+        key = (method, path, tuple(params.items()) if params else (), content)
+        request = requests.get(key)
+        if request is None:
+            request = self._client.build_request(
+                method,
+                self.base_url + path,
+                params=params,
+                content=content,
+                headers=JSON_HEADERS if content is not None else None,
+                timeout=self._timeout,
+            )
+            requests[key] = request
+            if len(requests) > REQUEST_CACHE_SIZE:
+                requests.popitem(last=False)
+            return request
+        requests.move_to_end(key)
+        # The Cookie header was merged at build time; resync it with the jar
+        # (CDNs set cookies on the shared client) / 빌드 시점의 쿠키 헤더를 현재 쿠키로 갱신
+        cookies = self._client.cookies
+        if cookies or "Cookie" in request.headers:
+            request.headers.pop("Cookie", None)
+            cookies.set_cookie_header(request)
+        return request
+
+    async def _send(self, request: httpx.Request) -> httpx.Response:
+        if self._semaphore is None:
+            return await self._client.send(request)
+        # Requests start as soon as a slot frees up / 슬롯이 비는 즉시 다음 요청 시작
+        async with self._semaphore:
+            return await self._client.send(request)
+
+    async def _request(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
+        """Send with jittered exponential backoff on transient failures / 일시적 실패 시 지수 백오프 재시도.
+
+        Retries ``retry_statuses`` and dropped connections up to ``max_retries`` times,
+        honouring Retry-After. The last response is returned as-is for the caller's
+        ``raise_for_status``.
+        """
+        request = self._build_request(method, path, **kwargs)
+        for attempt in range(self.max_retries):
+            try:
+                response = await self._send(request)
+            except RETRY_TRANSPORT_ERRORS as exc:
+                delay, reason = _backoff_delay(attempt), str(exc)
+            else:
+                if response.status_code not in self.retry_statuses:
+                    return response
+                retry_after = _retry_after(response)
+                if retry_after > MAX_RETRY_AFTER_SECONDS:
+                    return response
+                delay, reason = max(retry_after, _backoff_delay(attempt)), str(response.status_code)
+            logger.warning("%s %s failed (%s), retrying in %.2fs", self.name, path, reason, delay)
+            await asyncio.sleep(delay)
+        return await self._send(request)
+
+    async def _get(self, path: str, **kwargs: Any) -> httpx.Response:
+        return await self._request("GET", path, **kwargs)
+
+    async def _post(self, path: str, **kwargs: Any) -> httpx.Response:
+        return await self._request("POST", path, **kwargs)
+
+    async def _get_json(self, path: str, **kwargs: Any) -> Any:
+        """GET, raise on HTTP errors and decode with orjson / GET 후 orjson으로 디코드."""
+        response = await self._get(path, **kwargs)
+        check_status(response)
+        return orjson.loads(response.content)
+
+    async def _post_json(self, path: str, **kwargs: Any) -> Any:
+        """POST, raise on HTTP errors and decode with orjson / POST 후 orjson으로 디코드."""
+        response = await self._post(path, **kwargs)
+        check_status(response)
+        return orjson.loads(response.content)
+
+    async def start_stream(self) -> None:
+        """Start the WebSocket book feed if this venue has one / 스트림 지원 시 웹소켓 호가 수신 시작."""
+        if self._stream is not None:
+            self._stream.start()
+
+    def _live_quotes(self) -> dict[str, MarketQuote]:
+        """Fresh streamed quotes by symbol, empty while the stream is down / 스트림 중단 시 빈 dict."""
+        if self._stream is None:
+            return {}
+        return self._stream.fresh_quotes()
+
+    def _live_quote(self, symbol: str) -> MarketQuote | None:
+        """Fresh streamed quote for one symbol / 단일 심볼의 최근 스트림 호가."""
+        if self._stream is None:
+            return None
+        return self._stream.fresh_quote(symbol)
+
+    async def close(self) -> None:
+        if self._stream is not None:
+            await self._stream.stop()
+        # The shared client is closed by the app on shutdown / 공유 클라이언트는 앱 종료 시 닫힘
+        if self._owns_client:
+            await self._client.aclose()
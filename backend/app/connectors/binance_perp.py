@@ -2,50 +2,179 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from datetime import datetime
-from typing import Iterable, Sequence
+import time
+from datetime import datetime, timezone
+from typing import Any, Iterable, Sequence
 
 import httpx
+from aiolimiter import AsyncLimiter
 
+from app.connectors.base import FETCH_ERRORS, RETRY_STATUSES
 from app.connectors.perp_base import PerpConnector
+from app.connectors.stream import BookStream
 from app.core.config import get_settings
 from app.models.opportunity import MarketQuote
 from app.models.market_data import FundingRate, PerpMarketData
 
 logger = logging.getLogger(__name__)
 
+# Binance USDⓈ-M request weight budget per minute / 분당 요청 가중치 한도
+WEIGHT_LIMIT_1M = 2400
+# Pause until the window resets past this share of the budget / 한도의 80% 초과 시 다음 분까지 대기
+WEIGHT_BACKOFF_RATIO = 0.8
+# Documented request weight per endpoint as (with ``symbol``, without ``symbol``); the
+# limiter spends this weight rather than one unit per request. Unlisted paths cost 1.
+# 엔드포인트별 요청 가중치 (symbol 지정 시, 미지정 시). 미등록 경로는 1.
+ENDPOINT_WEIGHTS: dict[str, tuple[int, int]] = {
+    "/fapi/v1/ticker/bookTicker": (2, 5),
+    "/fapi/v1/premiumIndex": (1, 10),
+    "/fapi/v1/openInterest": (1, 1),
+    "/fapi/v1/exchangeInfo": (1, 1),
+}
+# /fapi/v1/depth weight by ``limit`` upper bound / depth 가중치 (limit 구간별)
+DEPTH_WEIGHTS = ((50, 2), (100, 5), (500, 10), (1000, 20))
+# Combined-stream endpoint for USDⓈ-M bookTicker pushes / USDⓈ-M 최우선 호가 스트림
+STREAM_URL = "wss://fstream.binance.com/stream"
+
+
+def _request_weight(request: httpx.Request) -> int:
+    """Binance request weight of ``request`` / 요청의 바이낸스 가중치."""
+    path = request.url.path
+    params = request.url.params
+    if path == "/fapi/v1/depth":
+        limit = int(params.get("limit", 500))
+        return next((weight for bound, weight in DEPTH_WEIGHTS if limit <= bound), DEPTH_WEIGHTS[-1][1])
+    with_symbol, without_symbol = ENDPOINT_WEIGHTS.get(path, (1, 1))
+    return with_symbol if "symbol" in params else without_symbol
+
 
 class BinancePerpConnector(PerpConnector):
     """Fetches Binance USDⓈ-M perpetual futures data / 바이낸스 USDT 무기한 선물 데이터 수집."""
 
     venue_type = "perp"
+    # Rate limiting: bounds in-flight REST calls / 레이트 리밋: 동시 REST 호출 수 제한
+    max_concurrency = 15
+    # 418 is Binance's escalation of repeated 429s / 418은 429 반복 시 바이낸스의 차단 응답
+    retry_statuses = RETRY_STATUSES | {418}
+    base_url = "https://fapi.binance.com"
 
-    def __init__(self, symbols: Iterable[str]) -> None:
+    def __init__(self, symbols: Iterable[str], client: httpx.AsyncClient | None = None) -> None:
         self.name = "binance"
-        self._symbols = list(symbols)
-        timeout = get_settings().public_rest_timeout
-        self._client = httpx.AsyncClient(
-            base_url="https://fapi.binance.com",  # Futures API
-            timeout=timeout,
-            headers={"User-Agent": "ArbitrageCommand/0.1"},
+        self._init_symbols(symbols)
+        self._init_client(client, get_settings().public_rest_timeout)
+        self._limiter = AsyncLimiter(max_rate=WEIGHT_LIMIT_1M, time_period=60)
+        self._premium_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+        streams = "/".join(f"{pair.lower()}@bookTicker" for pair in self._venue_symbols)
+        self._stream = BookStream("binance-perp", f"{STREAM_URL}?streams={streams}", self._parse_book_ticker)
+
+    def _quote(self, symbol: str, bid: float, ask: float, timestamp: datetime) -> MarketQuote:
+        base, quote, _ = self._symbol_info[symbol]
+        return MarketQuote(
+            exchange=self.name,
+            venue_type="perp",
+            symbol=symbol,
+            base_asset=base,
+            quote_currency=quote,
+            bid=bid,
+            ask=ask,
+            timestamp=timestamp,
         )
 
-    async def fetch_quotes(self) -> Sequence[MarketQuote]:
-        """Fetch order book quotes for perpetual futures / 무기한 선물 호가 조회."""
-        tasks = [self._fetch_quote(symbol) for symbol in self._symbols]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        quotes: list[MarketQuote] = []
-        for symbol, result in zip(self._symbols, results):
-            if isinstance(result, Exception):
-                logger.warning("Binance perp quote failed for %s: %s", symbol, result)
+    def _parse_book_ticker(self, message: dict[str, Any]) -> MarketQuote | None:
+        """Combined-stream bookTicker frame to a quote / bookTicker 메시지를 호가로 변환."""
+        data = message.get("data")
+        symbol = self._venue_symbols.get(data["s"]) if data else None
+        if symbol is None:
+            return None
+        timestamp = datetime.fromtimestamp(data["E"] / 1000, tz=timezone.utc)
+        return self._quote(symbol, float(data["b"]), float(data["a"]), timestamp)
+
+    async def _fetch_all_book_tickers(self) -> dict[str, tuple[float, float]]:
+        """Best bid/ask for every tracked symbol in one request / 단일 요청으로 전체 심볼 최우선 호가 조회.
+
+        bookTicker without ``symbol`` covers the whole exchange for a fixed weight,
+        replacing one depth call per symbol.
+        symbol 없이 호출하면 고정 가중치로 전체 심볼을 반환하여 심볼별 depth 호출을 대체합니다.
+        """
+        data = await self._get_json("/fapi/v1/ticker/bookTicker")
+        venue_symbols = self._venue_symbols
+        books: dict[str, tuple[float, float]] = {}
+        for item in data:
+            symbol = venue_symbols.get(item["symbol"])
+            if symbol is None:
                 continue
-            if result:
-                quotes.append(result)
+            bid = float(item["bidPrice"])
+            ask = float(item["askPrice"])
+            if bid and ask:
+                books[symbol] = (bid, ask)
+        return books
+
+    async def _top_of_book(self) -> dict[str, tuple[float, float]]:
+        """Best bid/ask per symbol, streamed where live, else bulk REST / 스트림 우선, 없으면 일괄 REST."""
+        books = {symbol: (quote.bid, quote.ask) for symbol, quote in self._live_quotes().items()}
+        if len(books) < len(self._symbols):
+            try:
+                books = await self._fetch_all_book_tickers() | books
+            except FETCH_ERRORS as exc:
+                logger.warning("Binance perp bookTicker failed: %s", exc)
+        return books
+
+    async def _send(self, request: httpx.Request) -> httpx.Response:
+        """Rate-limited send honouring Binance weight headers / 가중치 헤더를 반영한 레이트 리밋 전송.
+
+        The limiter budget is the 1-minute weight cap, so each request spends its
+        documented endpoint weight.
+        리미터 예산은 분당 가중치 한도이며, 요청마다 엔드포인트 가중치만큼 소비합니다.
+        """
+        await self._limiter.acquire(_request_weight(request))
+        response = await super()._send(request)
+        await self._backoff_on_used_weight(response)
+        return response
+
+    async def _backoff_on_used_weight(self, response: httpx.Response) -> None:
+        used = response.headers.get("X-MBX-USED-WEIGHT-1M")
+        if used is None or int(used) < WEIGHT_LIMIT_1M * WEIGHT_BACKOFF_RATIO:
+            return
+        # The weight window resets at the top of each minute / 가중치는 매 분 초기화
+        delay = 60.0 - time.time() % 60.0
+        logger.warning("Binance used weight %s/%d, pausing %.1fs", used, WEIGHT_LIMIT_1M, delay)
+        await asyncio.sleep(delay)
+
+    async def _get_premium_index(self, pair: str) -> dict[str, Any]:
+        """Fetch premiumIndex JSON, served from the funding cache / 펀딩 캐시를 거쳐 premiumIndex 조회."""
+        cached = self._premium_cache.get(pair)
+        now = time.monotonic()
+        if cached and now - cached[0] < self.funding_cache_ttl:
+            return cached[1]
+        data = await self._get_json("/fapi/v1/premiumIndex", params={"symbol": pair})
+        self._premium_cache[pair] = (now, data)
+        return data
+
+    async def fetch_quotes(self) -> Sequence[MarketQuote]:
+        """Fetch order book quotes for perpetual futures / 무기한 선물 호가 조회.
+
+        Streamed quotes are used while the bookTicker feed is live; one bulk
+        REST bookTicker call covers the rest (cold start, reconnects).
+        """
+        streamed = self._live_quotes()
+        quotes: list[MarketQuote] = [streamed[symbol] for symbol in self._symbols if symbol in streamed]
+        if len(quotes) == len(self._symbols):
+            return quotes
+        try:
+            books = await self._fetch_all_book_tickers()
+        except FETCH_ERRORS as exc:
+            logger.warning("Binance perp bookTicker failed: %s", exc)
+            return quotes
+        now = datetime.now(timezone.utc)
+        for symbol in self._symbols:
+            if symbol not in streamed and symbol in books:
+                quotes.append(self._quote(symbol, *books[symbol], now))
         return quotes
 
     async def fetch_funding_rates(self) -> Sequence[FundingRate]:
         """Fetch current funding rates for all symbols / 모든 심볼의 펀딩비 조회."""
-        tasks = [self._fetch_funding_rate(symbol) for symbol in self._symbols]
+        now = datetime.now(timezone.utc)
+        tasks = [self._cached_funding_rate(symbol, now) for symbol in self._symbols]
         results = await asyncio.gather(*tasks, return_exceptions=True)
         funding_rates: list[FundingRate] = []
         for symbol, result in zip(self._symbols, results):
@@ -58,102 +187,57 @@ class BinancePerpConnector(PerpConnector):
 
     async def fetch_perp_market_data(self) -> Sequence[PerpMarketData]:
         """Fetch combined market data (quotes + funding + OI) with rate limiting / 레이트 리밋을 고려한 통합 시장 데이터 조회."""
+        now = datetime.now(timezone.utc)
+        books = await self._top_of_book()
+        tasks = [self._fetch_perp_data(symbol, now, books.get(symbol)) for symbol in self._symbols]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
         data: list[PerpMarketData] = []
-        # Process in batches of 5 to avoid rate limiting (Binance is strict) / 레이트 리밋 회피를 위해 5개씩 배치 처리 (바이낸스는 엄격함)
-        batch_size = 5
-        for i in range(0, len(self._symbols), batch_size):
-            batch = self._symbols[i:i + batch_size]
-            tasks = [self._fetch_perp_data(symbol) for symbol in batch]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            for symbol, result in zip(batch, results):
-                if isinstance(result, Exception):
-                    # Skip logging for known unsupported symbols
-                    if "400" not in str(result):
-                        logger.warning("Binance perp data failed for %s: %s", symbol, result)
-                    continue
-                if result:
-                    data.append(result)
-            # Longer delay between batches to avoid 418/429 errors
-            if i + batch_size < len(self._symbols):
-                await asyncio.sleep(0.2)
+        for symbol, result in zip(self._symbols, results):
+            if isinstance(result, Exception):
+                # Skip logging for known unsupported symbols
+                if "400" not in str(result):
+                    logger.warning("Binance perp data failed for %s: %s", symbol, result)
+                continue
+            if result:
+                data.append(result)
         return data
 
-    async def fetch_open_interest(self, symbol: str) -> float:
-        """Fetch open interest in USD for a symbol / 심볼의 USD 기준 미결제약정 조회."""
-        base, quote = symbol.split("/")
-        pair = base + quote  # e.g., BTCUSDT
+    async def fetch_open_interest(self, symbol: str, mark_price: float | None = None) -> float:
+        """Fetch open interest in USD for a symbol / 심볼의 USD 기준 미결제약정 조회.
+
+        Pass ``mark_price`` when the caller already has it to skip the premiumIndex lookup.
+        """
+        _, _, pair = self._symbol_parts(symbol)  # e.g., BTCUSDT
         try:
-            response = await self._client.get("/fapi/v1/openInterest", params={"symbol": pair})
-            response.raise_for_status()
-            data = response.json()
-            oi_contracts = float(data.get("openInterest", 0))
+            data = await self._get_json("/fapi/v1/openInterest", params={"symbol": pair})
+            oi_contracts = float(data["openInterest"])
 
             # Get mark price to convert to USD
-            mark_response = await self._client.get("/fapi/v1/premiumIndex", params={"symbol": pair})
-            mark_response.raise_for_status()
-            mark_data = mark_response.json()
-            mark_price = float(mark_data.get("markPrice", 0))
+            if mark_price is None:
+                mark_data = await self._get_premium_index(pair)
+                mark_price = float(mark_data["markPrice"])
 
             return oi_contracts * mark_price
-        except Exception as exc:
+        except FETCH_ERRORS as exc:
             logger.warning("Binance OI fetch failed for %s: %s", symbol, exc)
             return 0.0
 
-    async def close(self) -> None:
-        await self._client.aclose()
-
-    async def _fetch_quote(self, symbol: str) -> MarketQuote | None:
-        """Fetch order book for a single symbol / 단일 심볼 호가 조회."""
-        base, quote = symbol.split("/")
-        pair = base + quote
-        try:
-            response = await self._client.get(
-                "/fapi/v1/depth",
-                params={"symbol": pair, "limit": 5},
-            )
-            response.raise_for_status()
-        except Exception as exc:
-            logger.warning("Binance perp depth error for %s: %s", symbol, exc)
-            return None
-
-        payload = response.json()
-        bids = payload.get("bids") or []
-        asks = payload.get("asks") or []
-        if not bids or not asks:
-            return None
-
-        best_bid = float(bids[0][0])
-        best_ask = float(asks[0][0])
-        return MarketQuote(
-            exchange=self.name,
-            venue_type="perp",
-            symbol=symbol,
-            base_asset=base,
-            quote_currency=quote,
-            bid=best_bid,
-            ask=best_ask,
-            timestamp=datetime.utcnow(),
-        )
-
-    async def _fetch_funding_rate(self, symbol: str) -> FundingRate | None:
+    async def _fetch_funding_rate(self, symbol: str, now: datetime) -> FundingRate | None:
         """Fetch funding rate for a single symbol / 단일 심볼 펀딩비 조회."""
-        base, quote = symbol.split("/")
-        pair = base + quote
+        base, quote, pair = self._symbol_info[symbol]
         try:
-            response = await self._client.get("/fapi/v1/premiumIndex", params={"symbol": pair})
-            response.raise_for_status()
-            data = response.json()
+            data = await self._get_premium_index(pair)
 
-            funding_rate = float(data.get("lastFundingRate", 0))
-            next_funding_ts = int(data.get("nextFundingTime", 0))
-            mark_price = float(data.get("markPrice", 0))
-            index_price = float(data.get("indexPrice", 0))
+            funding_rate = float(data["lastFundingRate"])
+            next_funding_ts = int(data["nextFundingTime"])
+            mark_price = float(data["markPrice"])
+            index_price = float(data["indexPrice"])
 
             # Binance funding happens every 8 hours, so rate is already 8H
             funding_rate_8h = funding_rate
 
             # Get open interest
-            oi_usd = await self.fetch_open_interest(symbol)
+            oi_usd = await self.fetch_open_interest(symbol, mark_price=mark_price)
 
             return FundingRate(
                 exchange=self.name,
@@ -162,61 +246,47 @@ class BinancePerpConnector(PerpConnector):
                 quote_currency=quote,
                 funding_rate=funding_rate,
                 funding_rate_8h=funding_rate_8h,
-                next_funding_time=datetime.fromtimestamp(next_funding_ts / 1000) if next_funding_ts else None,
+                next_funding_time=datetime.fromtimestamp(next_funding_ts / 1000, tz=timezone.utc) if next_funding_ts else None,
                 open_interest_usd=oi_usd,
                 mark_price=mark_price,
                 index_price=index_price,
-                timestamp=datetime.utcnow(),
+                timestamp=now,
             )
-        except Exception as exc:
+        except FETCH_ERRORS as exc:
             logger.warning("Binance funding rate error for %s: %s", symbol, exc)
             return None
 
-    async def _fetch_perp_data(self, symbol: str) -> PerpMarketData | None:
-        """Fetch combined perp market data / 통합 무기한 선물 데이터 조회."""
-        base, quote = symbol.split("/")
-        pair = base + quote
-
+    async def _fetch_oi_contracts(self, symbol: str, pair: str) -> float:
+        """Open interest in contracts, 0 on failure so it never cancels siblings / 실패 시 0 반환."""
         try:
-            # Fetch all data in parallel
-            depth_task = self._client.get("/fapi/v1/depth", params={"symbol": pair, "limit": 5})
-            premium_task = self._client.get("/fapi/v1/premiumIndex", params={"symbol": pair})
-            oi_task = self._client.get("/fapi/v1/openInterest", params={"symbol": pair})
+            data = await self._get_json("/fapi/v1/openInterest", params={"symbol": pair})
+            return float(data["openInterest"])
+        except FETCH_ERRORS:
+            logger.warning("OI fetch failed for %s, using 0", symbol)
+            return 0.0
 
-            depth_resp, premium_resp, oi_resp = await asyncio.gather(
-                depth_task, premium_task, oi_task, return_exceptions=True
-            )
+    async def _fetch_perp_data(
+        self, symbol: str, now: datetime, book: tuple[float, float] | None
+    ) -> PerpMarketData | None:
+        """Fetch combined perp market data / 통합 무기한 선물 데이터 조회."""
+        base, quote, pair = self._symbol_info[symbol]
+        if book is None:
+            return None
+        best_bid, best_ask = book
 
-            # Handle exceptions
-            if isinstance(depth_resp, Exception):
-                raise depth_resp
-            if isinstance(premium_resp, Exception):
-                raise premium_resp
-            if isinstance(oi_resp, Exception):
-                logger.warning("OI fetch failed for %s, using 0", symbol)
-                oi_data = {"openInterest": "0"}
-            else:
-                oi_resp.raise_for_status()
-                oi_data = oi_resp.json()
-
-            depth_resp.raise_for_status()
-            premium_resp.raise_for_status()
-
-            depth = depth_resp.json()
-            premium = premium_resp.json()
-
-            bids = depth.get("bids") or []
-            asks = depth.get("asks") or []
-            if not bids or not asks:
-                return None
-
-            best_bid = float(bids[0][0])
-            best_ask = float(asks[0][0])
-            mark_price = float(premium.get("markPrice", 0))
-            funding_rate = float(premium.get("lastFundingRate", 0))
-            next_funding_ts = int(premium.get("nextFundingTime", 0))
-
-            oi_contracts = float(oi_data.get("openInterest", 0))
+        try:
+            # Fetch premium index and OI in parallel; a premium failure cancels OI
+            # 병렬 조회 (프리미엄 실패 시 OI 요청 취소)
+            async with asyncio.TaskGroup() as tg:
+                premium_task = tg.create_task(self._get_premium_index(pair))
+                oi_task = tg.create_task(self._fetch_oi_contracts(symbol, pair))
+
+            premium = premium_task.result()
+            mark_price = float(premium["markPrice"])
+            funding_rate = float(premium["lastFundingRate"])
+            next_funding_ts = int(premium["nextFundingTime"])
+
+            oi_contracts = oi_task.result()
             oi_usd = oi_contracts * mark_price
 
             return PerpMarketData(
@@ -229,11 +299,19 @@ class BinancePerpConnector(PerpConnector):
                 mark_price=mark_price,
                 funding_rate=funding_rate,
                 funding_rate_8h=funding_rate,  # Binance uses 8H intervals
-                next_funding_time=datetime.fromtimestamp(next_funding_ts / 1000) if next_funding_ts else None,
+                next_funding_time=datetime.fromtimestamp(next_funding_ts / 1000, tz=timezone.utc) if next_funding_ts else None,
                 open_interest_usd=oi_usd,
                 open_interest_contracts=oi_contracts,
-                timestamp=datetime.utcnow(),
+                timestamp=now,
             )
-        except Exception as exc:
+        except FETCH_ERRORS as exc:
             logger.warning("Binance perp data error for %s: %s", symbol, exc)
             return None
+        except ExceptionGroup as group:
+            # TaskGroup wraps request failures; anything unexpected propagates
+            # TaskGroup이 요청 실패를 감싸서 전달 (예상 외 예외는 전파)
+            matched, rest = group.split(FETCH_ERRORS)
+            if rest is not None:
+                raise
+            logger.warning("Binance perp data error for %s: %s", symbol, matched.exceptions[0])
+            return None
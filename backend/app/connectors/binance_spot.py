@@ -1,89 +1,64 @@
 from __future__ import annotations
 
-import asyncio
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Iterable, Sequence
 
 import httpx
 
-from app.connectors.base import MarketConnector
+from app.connectors.base import FETCH_ERRORS, RestConnector
 from app.core.config import get_settings
 from app.models.opportunity import MarketQuote
 
 logger = logging.getLogger(__name__)
 
 
-class BinanceSpotConnector(MarketConnector):
+class BinanceSpotConnector(RestConnector):
     """Fetches Binance spot order book snapshots. / 바이낸스 현물 주문장을 수집합니다."""
 
     venue_type = "spot"
+    base_url = "https://api.binance.com"
 
-    def __init__(self, symbols: Iterable[str]) -> None:
+    def __init__(self, symbols: Iterable[str], client: httpx.AsyncClient | None = None) -> None:
         self.name = "binance"
-        self._symbols = list(symbols)
-        timeout = get_settings().public_rest_timeout
-        self._client = httpx.AsyncClient(
-            base_url="https://api.binance.com",
-            timeout=timeout,
-            headers={"User-Agent": "ArbitrageCommand/0.1"},
-        )
+        self._init_symbols(symbols)
+        self._init_client(client, get_settings().public_rest_timeout)
 
     async def fetch_quotes(self) -> Sequence[MarketQuote]:
-        tasks = [self._fetch_symbol(symbol) for symbol in self._symbols]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        quotes: list[MarketQuote] = []
-        for symbol, result in zip(self._symbols, results):
-            if isinstance(result, Exception):
-                logger.warning(
-                    "Binance fetch failed for %s: %s / 바이낸스 %s 조회 실패: %s",
-                    symbol,
-                    result,
-                    symbol,
-                    result,
-                )
-                continue
-            if result:
-                quotes.append(result)
-        return quotes
-
-    async def close(self) -> None:
-        await self._client.aclose()
-
-    async def _fetch_symbol(self, symbol: str) -> MarketQuote | None:
-        base, quote = symbol.split("/")
-        pair = base + quote
+        # bookTicker without ``symbol`` returns every market's best bid/ask in one
+        # request, replacing a depth call per symbol / 심볼별 depth 대신 단일 요청으로 전체 최우선 호가 조회
         try:
-            response = await self._client.get(
-                "/api/v3/depth",
-                params={"symbol": pair, "limit": 5},
-            )
-            response.raise_for_status()
-        except Exception as exc:  # pylint: disable=broad-except
+            data = await self._get_json("/api/v3/ticker/bookTicker")
+        except FETCH_ERRORS as exc:
             logger.warning(
-                "Binance depth error for %s: %s / 바이낸스 호가 조회 오류 (%s): %s",
-                symbol,
+                "Binance bookTicker error: %s / 바이낸스 최우선 호가 조회 오류: %s",
                 exc,
-                symbol,
                 exc,
             )
-            return None
+            return []
 
-        payload = response.json()
-        bids = payload.get("bids") or []
-        asks = payload.get("asks") or []
-        if not bids or not asks:
-            return None
-
-        best_bid = float(bids[0][0])
-        best_ask = float(asks[0][0])
-        return MarketQuote(
-            exchange=self.name,
-            venue_type="spot",
-            symbol=symbol,
-            base_asset=base,
-            quote_currency=quote,
-            bid=best_bid,
-            ask=best_ask,
-            timestamp=datetime.utcnow(),
-        )
+        now = datetime.now(timezone.utc)
+        venue_symbols = self._venue_symbols
+        quotes: list[MarketQuote] = []
+        for item in data:
+            symbol = venue_symbols.get(item["symbol"])
+            if symbol is None:
+                continue
+            bid = float(item["bidPrice"])
+            ask = float(item["askPrice"])
+            if not bid or not ask:
+                continue
+            base, quote, _ = self._symbol_info[symbol]
+            quotes.append(
+                MarketQuote(
+                    exchange=self.name,
+                    venue_type="spot",
+                    symbol=symbol,
+                    base_asset=base,
+                    quote_currency=quote,
+                    bid=bid,
+                    ask=ask,
+                    timestamp=now,
+                )
+            )
+        return quotes
@@ -2,35 +2,38 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Iterable, Sequence
 
 import httpx
+import orjson
 
-from app.connectors.base import MarketConnector
+from app.connectors.base import RestConnector, check_status
 from app.core.config import get_settings
 from app.models.opportunity import MarketQuote
 
 logger = logging.getLogger(__name__)
 
 
-class BithumbSpotConnector(MarketConnector):
+class BithumbSpotConnector(RestConnector):
     """Pulls KRW order book data from Bithumb. / 빗썸 원화 주문장을 수집합니다."""
 
     venue_type = "spot"
+    base_url = "https://api.bithumb.com"
 
-    def __init__(self, symbols: Iterable[str]) -> None:
+    def __init__(self, symbols: Iterable[str], client: httpx.AsyncClient | None = None) -> None:
         self.name = "bithumb"
-        self._symbols = list(symbols)
-        timeout = get_settings().public_rest_timeout
-        self._client = httpx.AsyncClient(
-            base_url="https://api.bithumb.com",
-            timeout=timeout,
-            headers={"User-Agent": "ArbitrageCommand/0.1"},
-        )
+        self._init_symbols(symbols)
+        self._init_client(client, get_settings().public_rest_timeout)
+
+    def _parse_symbol(self, symbol: str) -> tuple[str, str, str]:
+        """Bithumb quotes every asset in KRW, e.g. BTC_KRW / 빗썸은 원화 마켓 (예: BTC_KRW)."""
+        base = symbol.split("/")[0]
+        return base, "KRW", f"{base}_KRW"
 
     async def fetch_quotes(self) -> Sequence[MarketQuote]:
-        tasks = [self._fetch_symbol(symbol) for symbol in self._symbols]
+        now = datetime.now(timezone.utc)
+        tasks = [self._fetch_symbol(symbol, now) for symbol in self._symbols]
         results = await asyncio.gather(*tasks, return_exceptions=True)
         quotes: list[MarketQuote] = []
         for symbol, result in zip(self._symbols, results):
@@ -47,15 +50,15 @@ class BithumbSpotConnector(MarketConnector):
                 quotes.append(result)
         return quotes
 
-    async def _fetch_symbol(self, symbol: str) -> MarketQuote | None:
-        base_asset = symbol.split("/")[0]
+    async def _fetch_symbol(self, symbol: str, now: datetime) -> MarketQuote | None:
+        base_asset, _, pair = self._symbol_info[symbol]
         try:
-            response = await self._client.get(f"/public/orderbook/{base_asset}_KRW")
-            response.raise_for_status()
-        except Exception as exc:  # pylint: disable=broad-except
+            response = await self._get(f"/public/orderbook/{pair}")
+            check_status(response)
+        except httpx.HTTPError as exc:
             return None
 
-        payload = response.json()
+        payload = orjson.loads(response.content)
         data = payload.get("data") or {}
         bids = data.get("bids") or []
         asks = data.get("asks") or []
@@ -72,8 +75,5 @@ class BithumbSpotConnector(MarketConnector):
             quote_currency="KRW",
             bid=best_bid,
             ask=best_ask,
-            timestamp=datetime.utcnow(),
+            timestamp=now,
         )
-
-    async def close(self) -> None:
-        await self._client.aclose()
@@ -2,40 +2,151 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from datetime import datetime
-from typing import Iterable, Sequence
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Iterable, Sequence
 
 import httpx
+import orjson
 
+from app.connectors.base import FETCH_ERRORS, check_status
 from app.connectors.perp_base import PerpConnector
+from app.connectors.stream import BookStream
 from app.core.config import get_settings
 from app.models.opportunity import MarketQuote
 from app.models.market_data import FundingRate, PerpMarketData
 
 logger = logging.getLogger(__name__)
 
+# Public linear stream; orderbook.1 pushes best bid/ask / 선형 공개 스트림 (orderbook.1 = 최우선 호가)
+STREAM_URL = "wss://stream.bybit.com/v5/public/linear"
+# Topics per subscribe request / 구독 요청당 토픽 수
+STREAM_SUBSCRIBE_BATCH = 10
+
+
+@dataclass(slots=True)
+class _Ticker:
+    """Numeric fields of a linear ticker, parsed once per cache window / 캐시 주기당 한 번 파싱된 티커."""
+
+    mark_price: float
+    index_price: float
+    funding_rate: float
+    next_funding_time: datetime | None
+
+
+def _parse_ticker(item: dict[str, Any]) -> _Ticker:
+    next_funding_ts = int(item["nextFundingTime"])
+    return _Ticker(
+        mark_price=float(item["markPrice"]),
+        index_price=float(item["indexPrice"]),
+        funding_rate=float(item["fundingRate"]),
+        next_funding_time=(
+            datetime.fromtimestamp(next_funding_ts / 1000, tz=timezone.utc) if next_funding_ts else None
+        ),
+    )
+
+
+def _top_price(levels: list[list[str]], fallback: float | None) -> float | None:
+    """First non-deleted level's price / 삭제되지 않은 첫 호가 가격."""
+    for price, size in levels:
+        if size != "0":
+            return float(price)
+    return fallback
+
 
 class BybitPerpConnector(PerpConnector):
     """Fetches Bybit USDT perpetual futures data / 바이빗 USDT 무기한 선물 데이터 수집."""
 
     venue_type = "perp"
+    # Rate limiting: bounds in-flight REST calls / 레이트 리밋: 동시 REST 호출 수 제한
+    max_concurrency = 30
+    base_url = "https://api.bybit.com"
 
-    def __init__(self, symbols: Iterable[str]) -> None:
+    def __init__(self, symbols: Iterable[str], client: httpx.AsyncClient | None = None) -> None:
         self.name = "bybit"
-        self._symbols = list(symbols)
-        timeout = get_settings().public_rest_timeout
-        self._client = httpx.AsyncClient(
-            base_url="https://api.bybit.com",
-            timeout=timeout,
-            headers={"User-Agent": "ArbitrageCommand/0.1"},
+        self._init_symbols(symbols)
+        self._init_client(client, get_settings().public_rest_timeout)
+        self._tickers_cache: tuple[float, dict[str, _Ticker]] | None = None
+        topics = [f"orderbook.1.{pair}" for pair in self._venue_symbols]
+        self._stream = BookStream(
+            "bybit-perp",
+            STREAM_URL,
+            self._parse_orderbook,
+            subscribe=[
+                {"op": "subscribe", "args": topics[i : i + STREAM_SUBSCRIBE_BATCH]}
+                for i in range(0, len(topics), STREAM_SUBSCRIBE_BATCH)
+            ],
+            heartbeat={"op": "ping"},
         )
 
+    def _parse_orderbook(self, message: dict[str, Any]) -> MarketQuote | None:
+        """orderbook.1 snapshot/delta frame to a quote / orderbook.1 메시지를 호가로 변환."""
+        data = message.get("data")
+        symbol = self._venue_symbols.get(data["s"]) if data else None
+        if symbol is None:
+            return None
+        # Deltas only carry the side that changed / 델타는 변경된 쪽만 포함
+        previous = self._stream.quotes.get(symbol) if message.get("type") == "delta" else None
+        bid = _top_price(data["b"], previous.bid if previous else None)
+        ask = _top_price(data["a"], previous.ask if previous else None)
+        if bid is None or ask is None:
+            return None
+        base, quote, _ = self._symbol_info[symbol]
+        return MarketQuote(
+            exchange=self.name,
+            venue_type="perp",
+            symbol=symbol,
+            base_asset=base,
+            quote_currency=quote,
+            bid=bid,
+            ask=ask,
+            timestamp=datetime.fromtimestamp(message["ts"] / 1000, tz=timezone.utc),
+        )
+
+    async def _fetch_all_tickers(self) -> dict[str, _Ticker]:
+        """Tracked linear tickers keyed by Bybit symbol, one request per funding-cache window.
+
+        추적 중인 선형 티커를 한 번에 조회 (펀딩 캐시 주기마다 1회 요청).
+
+        Only tracked symbols are parsed, once per window, so the per-tick
+        consumers read floats instead of re-parsing strings.
+        추적 심볼만 주기당 한 번 파싱하여 매 틱 문자열 재파싱을 피합니다.
+        """
+        cached = self._tickers_cache
+        now = time.monotonic()
+        if cached and now - cached[0] < self.funding_cache_ttl:
+            return cached[1]
+        # Omitting ``symbol`` returns every linear ticker / symbol 생략 시 전체 티커 반환
+        data = await self._get_json("/v5/market/tickers", params={"category": "linear"})
+        tickers: dict[str, _Ticker] = {}
+        venue_symbols = self._venue_symbols
+        for item in data["result"]["list"]:
+            if item["symbol"] not in venue_symbols:
+                continue
+            try:
+                tickers[item["symbol"]] = _parse_ticker(item)
+            except (KeyError, ValueError):
+                # e.g. pre-launch contracts with empty prices / 가격이 비어있는 상장 전 계약 등
+                continue
+        self._tickers_cache = (now, tickers)
+        return tickers
+
     async def fetch_quotes(self) -> Sequence[MarketQuote]:
-        """Fetch order book quotes for perpetual futures / 무기한 선물 호가 조회."""
-        tasks = [self._fetch_quote(symbol) for symbol in self._symbols]
+        """Fetch order book quotes for perpetual futures / 무기한 선물 호가 조회.
+
+        Streamed quotes are used while the orderbook.1 feed is live; REST depth
+        covers the rest (cold start, reconnects).
+        """
+        streamed = self._live_quotes()
+        quotes: list[MarketQuote] = [streamed[symbol] for symbol in self._symbols if symbol in streamed]
+        missing = [symbol for symbol in self._symbols if symbol not in streamed]
+        if not missing:
+            return quotes
+        now = datetime.now(timezone.utc)
+        tasks = [self._fetch_quote(symbol, now) for symbol in missing]
         results = await asyncio.gather(*tasks, return_exceptions=True)
-        quotes: list[MarketQuote] = []
-        for symbol, result in zip(self._symbols, results):
+        for symbol, result in zip(missing, results):
             if isinstance(result, Exception):
                 logger.warning("Bybit perp quote failed for %s: %s", symbol, result)
                 continue
@@ -44,98 +155,120 @@ class BybitPerpConnector(PerpConnector):
         return quotes
 
     async def fetch_funding_rates(self) -> Sequence[FundingRate]:
-        """Fetch current funding rates for all symbols / 모든 심볼의 펀딩비 조회."""
-        tasks = [self._fetch_funding_rate(symbol) for symbol in self._symbols]
+        """Fetch current funding rates for all symbols / 모든 심볼의 펀딩비 조회.
+
+        Symbols outside the funding cache are refreshed with the bulk tickers and
+        their open interest fetched concurrently, then assembled without further awaits.
+        캐시가 만료된 심볼은 일괄 티커와 OI를 동시에 조회한 뒤 추가 대기 없이 조립합니다.
+        """
+        now = datetime.now(timezone.utc)
+        fetched_at = time.monotonic()
+        rates = {
+            symbol: rate
+            for symbol, (cached_at, rate) in self._funding_cache.items()
+            if fetched_at - cached_at < self.funding_cache_ttl
+        }
+        stale = [symbol for symbol in self._symbols if symbol not in rates]
+        if stale:
+            try:
+                tickers, oi_map = await asyncio.gather(self._fetch_all_tickers(), self._fetch_all_oi(stale))
+            except FETCH_ERRORS as exc:
+                logger.warning("Bybit tickers fetch failed: %s", exc)
+                tickers, oi_map = {}, {}
+            for symbol in stale:
+                base, quote, bybit_symbol = self._symbol_info[symbol]
+                ticker = tickers.get(bybit_symbol)
+                if ticker is None:
+                    continue
+                rate = FundingRate(
+                    exchange=self.name,
+                    symbol=symbol,
+                    base_asset=base,
+                    quote_currency=quote,
+                    funding_rate=ticker.funding_rate,
+                    funding_rate_8h=ticker.funding_rate,  # Bybit funding happens every 8 hours
+                    next_funding_time=ticker.next_funding_time,
+                    open_interest_usd=oi_map.get(symbol, 0.0) * ticker.mark_price,
+                    mark_price=ticker.mark_price,
+                    index_price=ticker.index_price,
+                    timestamp=now,
+                )
+                self._funding_cache[symbol] = (fetched_at, rate)
+                rates[symbol] = rate
+        return [rates[symbol] for symbol in self._symbols if symbol in rates]
+
+    async def fetch_perp_market_data(self) -> Sequence[PerpMarketData]:
+        """Fetch combined market data (quotes + funding + OI) with rate limiting / 레이트 리밋을 고려한 통합 시장 데이터 조회."""
+        now = datetime.now(timezone.utc)
+        try:
+            tickers, oi_map = await asyncio.gather(
+                self._fetch_all_tickers(), self._fetch_all_oi(self._symbols)
+            )
+        except FETCH_ERRORS as exc:
+            logger.warning("Bybit tickers fetch failed: %s", exc)
+            return []
+        tasks = [
+            self._fetch_perp_data(symbol, now, tickers.get(self._symbol_info[symbol][2]), oi_map.get(symbol, 0.0))
+            for symbol in self._symbols
+        ]
         results = await asyncio.gather(*tasks, return_exceptions=True)
-        funding_rates: list[FundingRate] = []
+        data: list[PerpMarketData] = []
         for symbol, result in zip(self._symbols, results):
             if isinstance(result, Exception):
-                logger.warning("Bybit funding rate failed for %s: %s", symbol, result)
+                # Skip logging for known unsupported symbols
+                if "400" not in str(result):
+                    logger.warning("Bybit perp data failed for %s: %s", symbol, result)
                 continue
             if result:
-                funding_rates.append(result)
-        return funding_rates
-
-    async def fetch_perp_market_data(self) -> Sequence[PerpMarketData]:
-        """Fetch combined market data (quotes + funding + OI) with rate limiting / 레이트 리밋을 고려한 통합 시장 데이터 조회."""
-        data: list[PerpMarketData] = []
-        # Process in batches of 10 to avoid rate limiting / 레이트 리밋 회피를 위해 10개씩 배치 처리
-        batch_size = 10
-        for i in range(0, len(self._symbols), batch_size):
-            batch = self._symbols[i:i + batch_size]
-            tasks = [self._fetch_perp_data(symbol) for symbol in batch]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            for symbol, result in zip(batch, results):
-                if isinstance(result, Exception):
-                    # Skip logging for known unsupported symbols
-                    if "400" not in str(result):
-                        logger.warning("Bybit perp data failed for %s: %s", symbol, result)
-                    continue
-                if result:
-                    data.append(result)
-            # Small delay between batches to respect rate limits
-            if i + batch_size < len(self._symbols):
-                await asyncio.sleep(0.1)
+                data.append(result)
         return data
 
-    async def fetch_open_interest(self, symbol: str) -> float:
-        """Fetch open interest in USD for a symbol / 심볼의 USD 기준 미결제약정 조회."""
-        base, quote = symbol.split("/")
-        bybit_symbol = base + quote  # e.g., BTCUSDT
+    async def fetch_open_interest(self, symbol: str, mark_price: float | None = None) -> float:
+        """Fetch open interest in USD for a symbol / 심볼의 USD 기준 미결제약정 조회.
+
+        Pass ``mark_price`` when the caller already has it to skip the ticker lookup.
+        """
+        _, _, bybit_symbol = self._symbol_parts(symbol)  # e.g., BTCUSDT
         try:
-            response = await self._client.get(
+            data = await self._get_json(
                 "/v5/market/open-interest",
                 params={"category": "linear", "symbol": bybit_symbol, "intervalTime": "5min"},
             )
-            response.raise_for_status()
-            data = response.json()
-            result = data.get("result", {})
-            items = result.get("list", [])
+            items = data["result"]["list"]
             if not items:
                 return 0.0
 
             # Get the latest OI entry
-            latest = items[0]
-            oi_value = float(latest.get("openInterest", 0))
+            oi_value = float(items[0]["openInterest"])
 
             # Bybit returns OI in base currency, need to convert to USD
-            # Get mark price
-            ticker_response = await self._client.get(
-                "/v5/market/tickers", params={"category": "linear", "symbol": bybit_symbol}
-            )
-            ticker_response.raise_for_status()
-            ticker_data = ticker_response.json()
-            ticker_result = ticker_data.get("result", {})
-            ticker_list = ticker_result.get("list", [])
-            if not ticker_list:
-                return 0.0
+            if mark_price is None:
+                ticker = (await self._fetch_all_tickers()).get(bybit_symbol)
+                if not ticker:
+                    return 0.0
+                mark_price = ticker.mark_price
 
-            mark_price = float(ticker_list[0].get("markPrice", 0))
             return oi_value * mark_price
-        except Exception as exc:
+        except FETCH_ERRORS as exc:
             logger.warning("Bybit OI fetch failed for %s: %s", symbol, exc)
             return 0.0
 
-    async def close(self) -> None:
-        await self._client.aclose()
-
-    async def _fetch_quote(self, symbol: str) -> MarketQuote | None:
+    async def _fetch_quote(self, symbol: str, now: datetime) -> MarketQuote | None:
         """Fetch order book for a single symbol / 단일 심볼 호가 조회."""
-        base, quote = symbol.split("/")
-        bybit_symbol = base + quote
+        base, quote, bybit_symbol = self._symbol_info[symbol]
         try:
-            response = await self._client.get(
+            response = await self._get(
                 "/v5/market/orderbook", params={"category": "linear", "symbol": bybit_symbol, "limit": 5}
             )
-            response.raise_for_status()
-        except Exception as exc:
+            check_status(response)
+        except httpx.HTTPError as exc:
             logger.warning("Bybit perp depth error for %s: %s", symbol, exc)
             return None
 
-        payload = response.json()
-        result = payload.get("result", {})
-        bids = result.get("b", [])
-        asks = result.get("a", [])
+        payload = orjson.loads(response.content)
+        result = payload["result"]
+        bids = result["b"]
+        asks = result["a"]
         if not bids or not asks:
             return None
 
@@ -149,114 +282,64 @@ class BybitPerpConnector(PerpConnector):
             quote_currency=quote,
             bid=best_bid,
             ask=best_ask,
-            timestamp=datetime.utcnow(),
+            timestamp=now,
         )
 
-    async def _fetch_funding_rate(self, symbol: str) -> FundingRate | None:
-        """Fetch funding rate for a single symbol / 단일 심볼 펀딩비 조회."""
-        base, quote = symbol.split("/")
-        bybit_symbol = base + quote
+    async def _fetch_oi_contracts(self, symbol: str, bybit_symbol: str) -> float:
+        """Open interest in contracts, 0 on failure so it never cancels siblings / 실패 시 0 반환."""
         try:
-            # Get ticker for funding rate and mark price
-            response = await self._client.get(
-                "/v5/market/tickers", params={"category": "linear", "symbol": bybit_symbol}
+            data = await self._get_json(
+                "/v5/market/open-interest",
+                params={"category": "linear", "symbol": bybit_symbol, "intervalTime": "5min"},
             )
-            response.raise_for_status()
-            data = response.json()
-            result = data.get("result", {})
-            items = result.get("list", [])
-            if not items:
-                return None
-
-            item = items[0]
-            funding_rate = float(item.get("fundingRate", 0))
-            next_funding_ts = int(item.get("nextFundingTime", 0))
-            mark_price = float(item.get("markPrice", 0))
-            index_price = float(item.get("indexPrice", 0))
-
-            # Bybit funding happens every 8 hours
-            funding_rate_8h = funding_rate
-
-            # Get open interest
-            oi_usd = await self.fetch_open_interest(symbol)
+            items = data["result"]["list"]
+            return float(items[0]["openInterest"]) if items else 0.0
+        except FETCH_ERRORS:
+            logger.warning("OI fetch failed for %s, using 0", symbol)
+            return 0.0
 
-            return FundingRate(
-                exchange=self.name,
-                symbol=symbol,
-                base_asset=base,
-                quote_currency=quote,
-                funding_rate=funding_rate,
-                funding_rate_8h=funding_rate_8h,
-                next_funding_time=datetime.fromtimestamp(next_funding_ts / 1000) if next_funding_ts else None,
-                open_interest_usd=oi_usd,
-                mark_price=mark_price,
-                index_price=index_price,
-                timestamp=datetime.utcnow(),
-            )
-        except Exception as exc:
-            logger.warning("Bybit funding rate error for %s: %s", symbol, exc)
-            return None
+    async def _fetch_all_oi(self, symbols: Sequence[str]) -> dict[str, float]:
+        """Open interest in contracts for each symbol, fetched concurrently / 심볼별 OI 동시 조회.
+
+        Symbols missing from the last ticker snapshot are not listed on Bybit and skipped.
+        직전 티커 스냅샷에 없는 심볼은 미상장으로 보고 건너뜁니다.
+        """
+        if self._tickers_cache is not None:
+            listed = self._tickers_cache[1]
+            symbols = [symbol for symbol in symbols if self._symbol_info[symbol][2] in listed]
+        contracts = await asyncio.gather(
+            *(self._fetch_oi_contracts(symbol, self._symbol_info[symbol][2]) for symbol in symbols)
+        )
+        return dict(zip(symbols, contracts))
 
-    async def _fetch_perp_data(self, symbol: str) -> PerpMarketData | None:
+    async def _fetch_perp_data(
+        self, symbol: str, now: datetime, ticker: _Ticker | None, oi_contracts: float
+    ) -> PerpMarketData | None:
         """Fetch combined perp market data / 통합 무기한 선물 데이터 조회."""
-        base, quote = symbol.split("/")
-        bybit_symbol = base + quote
+        base, quote, bybit_symbol = self._symbol_info[symbol]
+        if not ticker:
+            return None
+        streamed = self._live_quote(symbol)
 
         try:
-            # Fetch ticker and order book in parallel
-            ticker_task = self._client.get(
-                "/v5/market/tickers", params={"category": "linear", "symbol": bybit_symbol}
-            )
-            depth_task = self._client.get(
-                "/v5/market/orderbook", params={"category": "linear", "symbol": bybit_symbol, "limit": 5}
-            )
-            oi_task = self._client.get(
-                "/v5/market/open-interest",
-                params={"category": "linear", "symbol": bybit_symbol, "intervalTime": "5min"},
-            )
-
-            ticker_resp, depth_resp, oi_resp = await asyncio.gather(
-                ticker_task, depth_task, oi_task, return_exceptions=True
-            )
-
-            # Handle exceptions
-            if isinstance(ticker_resp, Exception):
-                raise ticker_resp
-            if isinstance(depth_resp, Exception):
-                raise depth_resp
-            if isinstance(oi_resp, Exception):
-                logger.warning("OI fetch failed for %s, using 0", symbol)
-                oi_contracts = 0.0
+            # Only the order book is per symbol, and only while the stream is down
+            # 심볼별 요청은 스트림 중단 시의 호가 조회뿐
+            if streamed is not None:
+                best_bid, best_ask = streamed.bid, streamed.ask
             else:
-                oi_resp.raise_for_status()
-                oi_data = oi_resp.json()
-                oi_result = oi_data.get("result", {})
-                oi_items = oi_result.get("list", [])
-                oi_contracts = float(oi_items[0].get("openInterest", 0)) if oi_items else 0.0
-
-            ticker_resp.raise_for_status()
-            depth_resp.raise_for_status()
-
-            ticker_data = ticker_resp.json()
-            depth_data = depth_resp.json()
-
-            ticker_result = ticker_data.get("result", {})
-            ticker_items = ticker_result.get("list", [])
-            if not ticker_items:
-                return None
-
-            depth_result = depth_data.get("result", {})
-            bids = depth_result.get("b", [])
-            asks = depth_result.get("a", [])
-            if not bids or not asks:
-                return None
-
-            ticker = ticker_items[0]
-            best_bid = float(bids[0][0])
-            best_ask = float(asks[0][0])
-            mark_price = float(ticker.get("markPrice", 0))
-            funding_rate = float(ticker.get("fundingRate", 0))
-            next_funding_ts = int(ticker.get("nextFundingTime", 0))
+                depth_data = await self._get_json(
+                    "/v5/market/orderbook",
+                    params={"category": "linear", "symbol": bybit_symbol, "limit": 5},
+                )
+                depth_result = depth_data["result"]
+                bids = depth_result["b"]
+                asks = depth_result["a"]
+                if not bids or not asks:
+                    return None
+                best_bid = float(bids[0][0])
+                best_ask = float(asks[0][0])
+            mark_price = ticker.mark_price
+            funding_rate = ticker.funding_rate
 
             oi_usd = oi_contracts * mark_price
 
@@ -270,11 +353,11 @@ class BybitPerpConnector(PerpConnector):
                 mark_price=mark_price,
                 funding_rate=funding_rate,
                 funding_rate_8h=funding_rate,  # Bybit uses 8H intervals
-                next_funding_time=datetime.fromtimestamp(next_funding_ts / 1000) if next_funding_ts else None,
+                next_funding_time=ticker.next_funding_time,
                 open_interest_usd=oi_usd,
                 open_interest_contracts=oi_contracts,
-                timestamp=datetime.utcnow(),
+                timestamp=now,
             )
-        except Exception as exc:
+        except FETCH_ERRORS as exc:
             logger.warning("Bybit perp data error for %s: %s", symbol, exc)
             return None
@@ -2,10 +2,10 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Iterable, Sequence
 
-import ccxt
+import ccxt.async_support as ccxt
 
 from app.connectors.base import MarketConnector
 from app.models.opportunity import MarketQuote
@@ -20,21 +20,35 @@ class CCXTSpotConnector(MarketConnector):
 
     def __init__(self, exchange_id: str, symbols: Iterable[str]) -> None:
         self.name = exchange_id
-        self._symbols = list(symbols)
+        self._symbols: tuple[str, ...] = tuple(symbols)
+        self._symbol_parts = {symbol: tuple(symbol.split("/")) for symbol in self._symbols}
         exchange_class = getattr(ccxt, exchange_id)
         self._client: ccxt.Exchange = exchange_class({"enableRateLimit": True})
 
     async def fetch_quotes(self) -> Sequence[MarketQuote]:
+        now = datetime.now(timezone.utc)
+        tasks = [self._fetch_symbol(symbol, now) for symbol in self._symbols]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
         quotes: list[MarketQuote] = []
-        for symbol in self._symbols:
-            quote = await self._fetch_symbol(symbol)
-            if quote:
-                quotes.append(quote)
+        for symbol, result in zip(self._symbols, results):
+            if isinstance(result, Exception):
+                logger.warning(
+                    "CCXT %s fetch failed for %s: %s / CCXT %s 심볼 %s 조회 실패: %s",
+                    self.name,
+                    symbol,
+                    result,
+                    self.name,
+                    symbol,
+                    result,
+                )
+                continue
+            if result:
+                quotes.append(result)
         return quotes
 
-    async def _fetch_symbol(self, symbol: str) -> MarketQuote | None:
+    async def _fetch_symbol(self, symbol: str, now: datetime) -> MarketQuote | None:
         try:
-            order_book = await asyncio.to_thread(self._client.fetch_order_book, symbol, 5)
+            order_book = await self._client.fetch_order_book(symbol, 5)
         except Exception as exc:  # pylint: disable=broad-except
             logger.warning(
                 "CCXT %s fetch failed for %s: %s / CCXT %s 심볼 %s 조회 실패: %s",
@@ -54,7 +68,7 @@ class CCXTSpotConnector(MarketConnector):
 
         best_bid = bids[0][0]
         best_ask = asks[0][0]
-        base, quote = symbol.split("/")
+        base, quote = self._symbol_parts[symbol]
         return MarketQuote(
             exchange=self.name,
             venue_type="spot",
@@ -63,8 +77,8 @@ class CCXTSpotConnector(MarketConnector):
             quote_currency=quote,
             bid=float(best_bid),
             ask=float(best_ask),
-            timestamp=datetime.utcnow(),
+            timestamp=now,
         )
 
     async def close(self) -> None:
-        await asyncio.to_thread(self._client.close)
+        await self._client.close()
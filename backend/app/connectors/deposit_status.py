@@ -3,25 +3,76 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from datetime import datetime, timedelta
-from typing import Dict, Set
+import random
+import time
+from collections import defaultdict
+from typing import Awaitable, Callable, Dict, FrozenSet
 
 import httpx
+import orjson
+
+from app.core.http import create_http_client
 
 logger = logging.getLogger(__name__)
 
+# Spread per-exchange expiries so refreshes don't line up / 거래소별 만료 시점을 분산
+CACHE_JITTER_SECONDS = 30.0
+REQUEST_TIMEOUT_SECONDS = 5.0
+# Refresh this long before the cache duration runs out / 캐시 만료보다 이만큼 먼저 갱신
+REFRESH_LEAD_SECONDS = 60.0
+
 
 class DepositWithdrawalChecker:
     """Checks deposit/withdrawal status across exchanges / 거래소별 입출금 상태 확인."""
 
-    def __init__(self):
-        self._client = httpx.AsyncClient(timeout=5.0)
-        self._cache: Dict[str, Set[str]] = {}  # exchange -> set of disabled symbols
-        self._cache_time: Dict[str, datetime] = {}
-        self._cache_duration = timedelta(minutes=5)  # Cache for 5 minutes
+    def __init__(self, client: httpx.AsyncClient | None = None):
+        self._owns_client = client is None
+        self._client = client or create_http_client(timeout=REQUEST_TIMEOUT_SECONDS)
+        self._cache: Dict[str, FrozenSet[str]] = {}  # exchange -> set of disabled symbols
+        # Symbols disabled on at least one exchange / 하나 이상의 거래소에서 막힌 심볼
+        self._union_disabled: FrozenSet[str] = frozenset()
+        self._cache_expiry: Dict[str, float] = {}  # exchange -> time.monotonic() deadline
+        self._cache_duration = 300.0  # Cache for 5 minutes (seconds)
+        # One refresh per exchange at a time / 거래소별로 한 번에 하나의 갱신만 수행
+        self._locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self._task: asyncio.Task | None = None
+        # Supported exchanges and their status loaders; the refresher keeps all of them warm
+        # 지원 거래소별 상태 로더 (백그라운드 갱신 대상)
+        self._updaters: Dict[str, Callable[[], Awaitable[None]]] = {
+            "binance": self._update_binance_cache,
+            "okx": self._update_okx_cache,
+            "upbit": self._update_upbit_cache,
+            "bithumb": self._update_bithumb_cache,
+            "bybit": self._update_bybit_cache,
+        }
+
+    def start(self) -> None:
+        """Start refreshing every exchange in the background / 백그라운드 주기적 갱신 시작.
+
+        Lookups then read the cache without waiting on exchange APIs.
+        이후 조회는 거래소 API를 기다리지 않고 캐시만 읽습니다.
+        """
+        if self._task and not self._task.done():
+            return
+        self._task = asyncio.create_task(self._refresh_loop())
 
     async def close(self) -> None:
-        await self._client.aclose()
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        # The shared client is closed by the app on shutdown / 공유 클라이언트는 앱 종료 시 닫힘
+        if self._owns_client:
+            await self._client.aclose()
+
+    async def _refresh_loop(self) -> None:
+        interval = self._cache_duration - REFRESH_LEAD_SECONDS
+        while True:
+            await asyncio.gather(
+                *(self._refresh_locked(exchange) for exchange in self._updaters),
+                return_exceptions=True,
+            )
+            await asyncio.sleep(interval)
 
     async def is_trading_enabled(self, exchange: str, symbol: str) -> bool:
         """Check if deposit/withdrawal is enabled for a symbol on an exchange.
@@ -32,184 +83,212 @@ class DepositWithdrawalChecker:
         # Update cache if needed
         await self._update_cache_if_needed(exchange)
 
-        disabled_symbols = self._cache.get(exchange, set())
+        disabled_symbols = self._cache.get(exchange, frozenset())
         return symbol not in disabled_symbols
 
-    async def get_disabled_symbols(self, exchange: str) -> Set[str]:
+    async def get_disabled_symbols(self, exchange: str) -> FrozenSet[str]:
         """Get set of symbols with disabled deposits or withdrawals."""
         await self._update_cache_if_needed(exchange)
-        return self._cache.get(exchange, set())
+        return self._cache.get(exchange, frozenset())
+
+    def mark_disabled(self, exchange: str, symbol: str) -> None:
+        """Block a symbol right away after the exchange rejects it as suspended.
+
+        거래소가 중단을 이유로 주문을 거부하면 다음 갱신을 기다리지 않고 즉시 차단합니다.
+
+        The entry stays until the next scheduled refresh replaces it with
+        the exchange's own status list.
+        """
+        exchange = exchange.lower()
+        self._cache[exchange] = self._cache.get(exchange, frozenset()) | {symbol}
+        self._union_disabled = self._union_disabled | {symbol}
+        logger.warning(f"{exchange}: {symbol} marked disabled after a suspension error")
+
+    def is_any_disabled(self, symbol: str) -> bool:
+        """Whether any cached exchange has the symbol's deposits or withdrawals blocked.
+
+        캐시된 거래소 중 하나라도 해당 심볼의 입출금이 막혀 있는지 여부 (갱신을 기다리지 않음).
+        """
+        return symbol in self._union_disabled
+
+    def _is_stale(self, exchange: str) -> bool:
+        expiry = self._cache_expiry.get(exchange)
+        if expiry is None:
+            return True
+        # The background refresher keeps loaded exchanges current / 백그라운드 갱신 중에는 만료 검사 생략
+        if self._task is not None and not self._task.done():
+            return False
+        return time.monotonic() >= expiry
 
     async def _update_cache_if_needed(self, exchange: str) -> None:
-        """Update cache if it's stale."""
-        now = datetime.utcnow()
-        last_update = self._cache_time.get(exchange)
+        """Update cache if it's stale.
 
-        if last_update is None or (now - last_update) > self._cache_duration:
-            await self._update_cache(exchange)
-            self._cache_time[exchange] = now
+        Concurrent callers wait on the exchange lock and re-check, so an expiry
+        triggers a single refresh instead of one per caller.
+        동시 호출자는 락을 기다린 뒤 재확인하므로 만료 시 갱신은 한 번만 일어납니다.
+        """
+        if not self._is_stale(exchange):
+            return
+        async with self._locks[exchange]:
+            if not self._is_stale(exchange):
+                return
+            await self._refresh(exchange)
+
+    async def _refresh_locked(self, exchange: str) -> None:
+        async with self._locks[exchange]:
+            await self._refresh(exchange)
+
+    async def _refresh(self, exchange: str) -> None:
+        """Reload one exchange and schedule its jittered expiry / 갱신 후 지터가 적용된 만료 시각 설정."""
+        await self._update_cache(exchange)
+        self._union_disabled = frozenset().union(*self._cache.values())
+        jitter = random.uniform(-CACHE_JITTER_SECONDS, CACHE_JITTER_SECONDS)
+        self._cache_expiry[exchange] = time.monotonic() + self._cache_duration + jitter
 
     async def _update_cache(self, exchange: str) -> None:
         """Fetch latest deposit/withdrawal status from exchange."""
-        exchange_lower = exchange.lower()
-
-        if exchange_lower == "binance":
-            await self._update_binance_cache()
-        elif exchange_lower == "okx":
-            await self._update_okx_cache()
-        elif exchange_lower == "upbit":
-            await self._update_upbit_cache()
-        elif exchange_lower == "bithumb":
-            await self._update_bithumb_cache()
-        elif exchange_lower == "bybit":
-            await self._update_bybit_cache()
+        updater = self._updaters.get(exchange.lower())
+        if updater is not None:
+            await updater()
         else:
             logger.warning(f"Unknown exchange for deposit/withdrawal check: {exchange}")
-            self._cache[exchange] = set()
+            self._cache[exchange] = frozenset()
 
     async def _update_binance_cache(self) -> None:
         """Fetch Binance spot deposit/withdrawal status."""
         try:
-            response = await self._client.get("https://api.binance.com/sapi/v1/capital/config/getall")
+            response = await self._client.get(
+                "https://api.binance.com/sapi/v1/capital/config/getall", timeout=REQUEST_TIMEOUT_SECONDS
+            )
             response.raise_for_status()
-            coins = response.json()
-
-            disabled = set()
-            for coin in coins:
-                symbol = coin.get("coin")
-                deposit_enabled = coin.get("depositAllEnable", False)
-                withdraw_enabled = coin.get("withdrawAllEnable", False)
+            coins = orjson.loads(response.content)
 
-                # Mark as disabled if either deposit OR withdrawal is disabled
-                if not deposit_enabled or not withdraw_enabled:
-                    disabled.add(symbol)
+            # Mark as disabled if either deposit OR withdrawal is disabled
+            disabled = frozenset(
+                coin.get("coin")
+                for coin in coins
+                if not (coin.get("depositAllEnable", False) and coin.get("withdrawAllEnable", False))
+            )
 
             self._cache["binance"] = disabled
             logger.info(f"Binance: {len(disabled)} symbols with disabled deposits/withdrawals")
 
         except Exception as exc:
             logger.warning(f"Failed to fetch Binance deposit/withdrawal status: {exc}")
-            self._cache["binance"] = set()
+            self._cache["binance"] = frozenset()
 
     async def _update_okx_cache(self) -> None:
         """Fetch OKX deposit/withdrawal status."""
         try:
-            response = await self._client.get("https://www.okx.com/api/v5/asset/currencies")
+            response = await self._client.get(
+                "https://www.okx.com/api/v5/asset/currencies", timeout=REQUEST_TIMEOUT_SECONDS
+            )
             response.raise_for_status()
-            data = response.json()
-
-            disabled = set()
-            for currency in data.get("data", []):
-                symbol = currency.get("ccy")
-                can_deposit = currency.get("canDep", False)
-                can_withdraw = currency.get("canWd", False)
+            data = orjson.loads(response.content)
 
-                if not can_deposit or not can_withdraw:
-                    disabled.add(symbol)
+            disabled = frozenset(
+                currency.get("ccy")
+                for currency in data.get("data", [])
+                if not (currency.get("canDep", False) and currency.get("canWd", False))
+            )
 
             self._cache["okx"] = disabled
             logger.info(f"OKX: {len(disabled)} symbols with disabled deposits/withdrawals")
 
         except Exception as exc:
             logger.warning(f"Failed to fetch OKX deposit/withdrawal status: {exc}")
-            self._cache["okx"] = set()
+            self._cache["okx"] = frozenset()
 
     async def _update_upbit_cache(self) -> None:
         """Fetch Upbit deposit/withdrawal status."""
         try:
-            response = await self._client.get("https://api.upbit.com/v1/status/wallet")
+            response = await self._client.get(
+                "https://api.upbit.com/v1/status/wallet", timeout=REQUEST_TIMEOUT_SECONDS
+            )
             response.raise_for_status()
-            wallets = response.json()
-
-            disabled = set()
-            for wallet in wallets:
-                # Upbit uses market format like "BTC" or "KRW-BTC"
-                currency = wallet.get("currency")
-
-                wallet_state = wallet.get("wallet_state", "")
-                block_state = wallet.get("block_state", "")
+            wallets = orjson.loads(response.content)
 
-                # Mark as disabled if wallet is not working or blockchain is not normal
-                if wallet_state != "working" or block_state != "normal":
-                    disabled.add(currency)
+            # Mark as disabled if wallet is not working or blockchain is not normal
+            disabled = frozenset(
+                wallet.get("currency")
+                for wallet in wallets
+                if wallet.get("wallet_state", "") != "working" or wallet.get("block_state", "") != "normal"
+            )
 
             self._cache["upbit"] = disabled
             logger.info(f"Upbit: {len(disabled)} symbols with disabled deposits/withdrawals")
 
         except Exception as exc:
             logger.warning(f"Failed to fetch Upbit deposit/withdrawal status: {exc}")
-            self._cache["upbit"] = set()
+            self._cache["upbit"] = frozenset()
 
     async def _update_bithumb_cache(self) -> None:
         """Fetch Bithumb deposit/withdrawal status."""
         try:
-            response = await self._client.get("https://api.bithumb.com/public/assetsstatus/ALL")
+            response = await self._client.get(
+                "https://api.bithumb.com/public/assetsstatus/ALL", timeout=REQUEST_TIMEOUT_SECONDS
+            )
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
-            disabled = set()
+            disabled = frozenset()
             if data.get("status") == "0000":
-                assets = data.get("data", {})
-                for symbol, status in assets.items():
-                    if isinstance(status, dict):
-                        deposit_status = status.get("deposit_status", 0)
-                        withdrawal_status = status.get("withdrawal_status", 0)
-
-                        # 1 = enabled, 0 = disabled
-                        if deposit_status != 1 or withdrawal_status != 1:
-                            disabled.add(symbol)
+                # 1 = enabled, 0 = disabled
+                disabled = frozenset(
+                    symbol
+                    for symbol, status in data.get("data", {}).items()
+                    if isinstance(status, dict)
+                    and (status.get("deposit_status", 0) != 1 or status.get("withdrawal_status", 0) != 1)
+                )
 
             self._cache["bithumb"] = disabled
             logger.info(f"Bithumb: {len(disabled)} symbols with disabled deposits/withdrawals")
 
         except Exception as exc:
             logger.warning(f"Failed to fetch Bithumb deposit/withdrawal status: {exc}")
-            self._cache["bithumb"] = set()
+            self._cache["bithumb"] = frozenset()
 
     async def _update_bybit_cache(self) -> None:
         """Fetch Bybit deposit/withdrawal status."""
         try:
-            response = await self._client.get("https://api.bybit.com/v5/asset/coin/query-info")
+            response = await self._client.get(
+                "https://api.bybit.com/v5/asset/coin/query-info", timeout=REQUEST_TIMEOUT_SECONDS
+            )
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
-            disabled = set()
+            disabled = frozenset()
             if data.get("retCode") == 0:
-                rows = data.get("result", {}).get("rows", [])
-                for row in rows:
-                    symbol = row.get("coin")
-                    chains = row.get("chains", [])
-
-                    # Check if ANY chain has both deposit and withdrawal enabled
-                    has_enabled_chain = False
-                    for chain in chains:
-                        deposit_enabled = chain.get("chainDeposit") == "1"
-                        withdraw_enabled = chain.get("chainWithdraw") == "1"
-
-                        if deposit_enabled and withdraw_enabled:
-                            has_enabled_chain = True
-                            break
-
-                    if not has_enabled_chain:
-                        disabled.add(symbol)
+                # Disabled unless ANY chain has both deposit and withdrawal enabled
+                disabled = frozenset(
+                    row.get("coin")
+                    for row in data.get("result", {}).get("rows", [])
+                    if not any(
+                        chain.get("chainDeposit") == "1" and chain.get("chainWithdraw") == "1"
+                        for chain in row.get("chains", [])
+                    )
+                )
 
             self._cache["bybit"] = disabled
             logger.info(f"Bybit: {len(disabled)} symbols with disabled deposits/withdrawals")
 
         except Exception as exc:
             logger.warning(f"Failed to fetch Bybit deposit/withdrawal status: {exc}")
-            self._cache["bybit"] = set()
+            self._cache["bybit"] = frozenset()
 
 
 # Global singleton instance
 _checker_instance: DepositWithdrawalChecker | None = None
 
 
-def get_deposit_checker() -> DepositWithdrawalChecker:
-    """Get global deposit/withdrawal checker instance."""
+def get_deposit_checker(client: httpx.AsyncClient | None = None) -> DepositWithdrawalChecker:
+    """Get global deposit/withdrawal checker instance.
+
+    ``client`` is only used when the instance is first created.
+    """
     global _checker_instance
     if _checker_instance is None:
-        _checker_instance = DepositWithdrawalChecker()
+        _checker_instance = DepositWithdrawalChecker(client)
     return _checker_instance
 
 
@@ -2,11 +2,13 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from datetime import datetime
-from typing import Iterable, Sequence
+import time
+from datetime import datetime, timezone
+from typing import Any, Iterable, Sequence
 
 import httpx
 
+from app.connectors.base import FETCH_ERRORS
 from app.connectors.perp_base import PerpConnector
 from app.core.config import get_settings
 from app.models.opportunity import MarketQuote
@@ -14,35 +16,37 @@ from app.models.market_data import FundingRate, PerpMarketData
 
 logger = logging.getLogger(__name__)
 
+# Ticker responses are reused within one poll tick / 한 폴링 주기 내 티커 응답 재사용
+TICKER_CACHE_TTL_SECONDS = 1.0
+
 
 class EdgeXPerpConnector(PerpConnector):
     """Fetches EdgeX Exchange perpetual futures data / EdgeX 거래소 무기한 선물 데이터 수집."""
 
     venue_type = "perp"
+    # Rate limiting: bounds in-flight REST calls / 레이트 리밋: 동시 REST 호출 수 제한
+    max_concurrency = 20
+    base_url = "https://pro.edgex.exchange"
 
-    def __init__(self, symbols: Iterable[str]) -> None:
+    def __init__(self, symbols: Iterable[str], client: httpx.AsyncClient | None = None) -> None:
         self.name = "edgex"
-        self._symbols = list(symbols)
-        timeout = get_settings().public_rest_timeout
-        self._client = httpx.AsyncClient(
-            base_url="https://pro.edgex.exchange",  # API base URL
-            timeout=timeout * 2,
-            headers={"Content-Type": "application/json"},
-        )
-        self._symbol_map = self._build_symbol_map()
-
-    def _build_symbol_map(self) -> dict[str, str]:
+        self._init_symbols(symbols)
+        self._init_client(client, get_settings().public_rest_timeout * 2)
+        self._ticker_cache: tuple[float, dict[str, dict[str, Any]]] | None = None
+        # Books from the last fetch_quotes, taken once by the next perp fetch
+        # 직전 fetch_quotes의 호가 (다음 무기한 데이터 조회에서 한 번만 사용)
+        self._book_snapshot: dict[str, MarketQuote] | None = None
+
+    def _parse_symbol(self, symbol: str) -> tuple[str, str, str]:
         """Map standard symbols to EdgeX format / 심볼 형식 매핑."""
-        symbol_map = {}
-        for symbol in self._symbols:
-            base, quote = symbol.split("/")
-            # EdgeX uses format like BTC_USDT
-            symbol_map[symbol] = f"{base}_{quote}"
-        return symbol_map
+        base, quote = symbol.split("/")
+        # EdgeX uses format like BTC_USDT
+        return base, quote, f"{base}_{quote}"
 
     async def fetch_quotes(self) -> Sequence[MarketQuote]:
         """Fetch order book quotes for perpetual futures / 무기한 선물 호가 조회."""
-        tasks = [self._fetch_quote(symbol) for symbol in self._symbols]
+        now = datetime.now(timezone.utc)
+        tasks = [self._fetch_quote(symbol, now) for symbol in self._symbols]
         results = await asyncio.gather(*tasks, return_exceptions=True)
         quotes: list[MarketQuote] = []
         for symbol, result in zip(self._symbols, results):
@@ -51,11 +55,33 @@ class EdgeXPerpConnector(PerpConnector):
                 continue
             if result:
                 quotes.append(result)
+        self._book_snapshot = {quote.symbol: quote for quote in quotes}
         return quotes
 
+    def _take_books(self) -> dict[str, MarketQuote]:
+        """Books from this cycle's ``fetch_quotes``, consumed once / 이번 주기 fetch_quotes 호가 (1회 사용).
+
+        The engine calls ``fetch_quotes`` then ``fetch_perp_market_data`` every tick
+        (``OpportunityEngine._tick``), so the snapshot belongs to the current cycle no
+        matter how long other connectors took in between. Taking it clears it, so a
+        later perp fetch without a new ``fetch_quotes`` requests depth itself.
+        엔진은 매 틱 fetch_quotes 후 fetch_perp_market_data를 호출하므로 스냅샷은 현재 주기의 것이며,
+        사용 후 비워져 새 fetch_quotes 없이 호출되면 직접 호가를 조회합니다.
+        """
+        books, self._book_snapshot = self._book_snapshot, None
+        return books or {}
+
     async def fetch_funding_rates(self) -> Sequence[FundingRate]:
         """Fetch current funding rates for all symbols / 모든 심볼의 펀딩비 조회."""
-        tasks = [self._fetch_funding_rate(symbol) for symbol in self._symbols]
+        now = datetime.now(timezone.utc)
+        # Warm the bulk ticker once so per-symbol lookups below hit the cache
+        # 일괄 티커를 먼저 받아 아래 심볼별 조회가 캐시를 사용하도록 함
+        try:
+            await self._fetch_all_tickers()
+        except FETCH_ERRORS as exc:
+            logger.warning("EdgeX ticker fetch failed: %s / EdgeX 티커 조회 실패", exc)
+            return []
+        tasks = [self._cached_funding_rate(symbol, now) for symbol in self._symbols]
         results = await asyncio.gather(*tasks, return_exceptions=True)
         funding_rates: list[FundingRate] = []
         for symbol, result in zip(self._symbols, results):
@@ -68,7 +94,22 @@ class EdgeXPerpConnector(PerpConnector):
 
     async def fetch_perp_market_data(self) -> Sequence[PerpMarketData]:
         """Fetch combined market data (quotes + funding + OI) / 통합 시장 데이터 조회."""
-        tasks = [self._fetch_perp_data(symbol) for symbol in self._symbols]
+        now = datetime.now(timezone.utc)
+        try:
+            tickers = await self._fetch_all_tickers()
+        except FETCH_ERRORS as exc:
+            logger.warning("EdgeX ticker fetch failed: %s / EdgeX 티커 조회 실패", exc)
+            return []
+        # The engine polls fetch_quotes first in the same tick, so depth is only
+        # fetched for symbols missing from that snapshot
+        # 같은 틱에 fetch_quotes가 먼저 호출되므로 누락된 심볼만 호가를 조회
+        books = self._take_books()
+        tasks = [
+            self._fetch_perp_data(
+                symbol, now, tickers.get(self._symbol_info[symbol][2]), books.get(symbol)
+            )
+            for symbol in self._symbols
+        ]
         results = await asyncio.gather(*tasks, return_exceptions=True)
         data: list[PerpMarketData] = []
         for symbol, result in zip(self._symbols, results):
@@ -81,31 +122,77 @@ class EdgeXPerpConnector(PerpConnector):
 
     async def fetch_open_interest(self, symbol: str) -> float:
         """Fetch open interest in USD for a symbol / 심볼의 USD 기준 미결제약정 조회."""
-        edgex_symbol = self._symbol_map.get(symbol, symbol)
+        _, _, edgex_symbol = self._symbol_parts(symbol)
         try:
             # EdgeX uses ticker endpoint which includes OI
-            response = await self._client.get(f"/api/public/ticker", params={"symbol": edgex_symbol})
-            response.raise_for_status()
-            data = response.json()
+            data = await self._get_ticker(edgex_symbol)
             oi = float(data.get("openInterest", 0))
             return oi
-        except Exception as exc:
+        except FETCH_ERRORS as exc:
             logger.warning("EdgeX OI fetch failed for %s: %s", symbol, exc)
             return 0.0
 
-    async def close(self) -> None:
-        await self._client.aclose()
-
-    async def _fetch_quote(self, symbol: str) -> MarketQuote | None:
+    async def _fetch_all_tickers(self) -> dict[str, dict[str, Any]]:
+        """Tracked tickers keyed by EdgeX symbol, one request per cache window.
+
+        추적 중인 티커를 EdgeX 심볼별로 한 번에 조회 (캐시 주기마다 1회 요청).
+        """
+        cached = self._ticker_cache
+        now = time.monotonic()
+        if cached and now - cached[0] < TICKER_CACHE_TTL_SECONDS:
+            return cached[1]
+        # Omitting ``symbol`` returns every contract / symbol 생략 시 전체 계약 반환
+        data = await self._get_json("/api/public/ticker")
+        items = data.get("data", []) if isinstance(data, dict) else data
+        if not isinstance(items, list):
+            items = []
+        venue_symbols = self._venue_symbols
+        tickers = {
+            item["symbol"]: item
+            for item in items
+            if isinstance(item, dict) and item.get("symbol") in venue_symbols
+        }
+        missing = [symbol for symbol in venue_symbols if symbol not in tickers]
+        if missing:
+            # Fall back to the per-symbol ticker so an unexpected bulk payload
+            # does not silently drop every row / 일괄 응답에 없는 심볼은 개별 티커로 조회
+            logger.warning(
+                "EdgeX bulk ticker missing %d/%d symbols, fetching individually: %s "
+                "/ EdgeX 일괄 티커 누락 심볼 개별 조회",
+                len(missing),
+                len(venue_symbols),
+                ", ".join(missing),
+            )
+            results = await asyncio.gather(
+                *(self._fetch_symbol_ticker(symbol) for symbol in missing), return_exceptions=True
+            )
+            for symbol, result in zip(missing, results):
+                if isinstance(result, Exception):
+                    logger.warning("EdgeX ticker failed for %s: %s", symbol, result)
+                elif result:
+                    tickers[symbol] = result
+        self._ticker_cache = (now, tickers)
+        return tickers
+
+    async def _fetch_symbol_ticker(self, edgex_symbol: str) -> dict[str, Any] | None:
+        """Ticker JSON for one symbol via the per-symbol request / 개별 요청으로 단일 티커 조회."""
+        data = await self._get_json("/api/public/ticker", params={"symbol": edgex_symbol})
+        if isinstance(data, dict) and isinstance(data.get("data"), dict):
+            data = data["data"]
+        return data if isinstance(data, dict) and data else None
+
+    async def _get_ticker(self, edgex_symbol: str) -> dict[str, Any]:
+        """Ticker JSON for one symbol from the bulk snapshot / 일괄 스냅샷에서 단일 티커 조회."""
+        tickers = await self._fetch_all_tickers()
+        return tickers[edgex_symbol]
+
+    async def _fetch_quote(self, symbol: str, now: datetime) -> MarketQuote | None:
         """Fetch order book for a single symbol / 단일 심볼 호가 조회."""
-        base, quote = symbol.split("/")
-        edgex_symbol = self._symbol_map.get(symbol, f"{base}_{quote}")
+        base, quote, edgex_symbol = self._symbol_info[symbol]
 
         try:
             # EdgeX uses /api/public/depth endpoint
-            response = await self._client.get(f"/api/public/depth", params={"symbol": edgex_symbol, "limit": 5})
-            response.raise_for_status()
-            data = response.json()
+            data = await self._get_json("/api/public/depth", params={"symbol": edgex_symbol, "limit": 5})
 
             bids = data.get("bids", [])
             asks = data.get("asks", [])
@@ -124,22 +211,19 @@ class EdgeXPerpConnector(PerpConnector):
                 quote_currency=quote,
                 bid=best_bid,
                 ask=best_ask,
-                timestamp=datetime.utcnow(),
+                timestamp=now,
             )
-        except Exception as exc:
+        except FETCH_ERRORS as exc:
             logger.warning("EdgeX quote error for %s: %s", symbol, exc)
             return None
 
-    async def _fetch_funding_rate(self, symbol: str) -> FundingRate | None:
+    async def _fetch_funding_rate(self, symbol: str, now: datetime) -> FundingRate | None:
         """Fetch funding rate for a single symbol / 단일 심볼 펀딩비 조회."""
-        base, quote = symbol.split("/")
-        edgex_symbol = self._symbol_map.get(symbol, f"{base}_{quote}")
+        base, quote, edgex_symbol = self._symbol_info[symbol]
 
         try:
             # EdgeX uses /api/public/ticker endpoint for funding info
-            response = await self._client.get(f"/api/public/ticker", params={"symbol": edgex_symbol})
-            response.raise_for_status()
-            data = response.json()
+            data = await self._get_ticker(edgex_symbol)
 
             funding_rate = float(data.get("fundingRate", 0))
             mark_price = float(data.get("markPrice", 0))
@@ -148,8 +232,8 @@ class EdgeXPerpConnector(PerpConnector):
             # EdgeX funding happens every 8 hours
             funding_rate_8h = funding_rate
 
-            # Get open interest
-            oi_usd = await self.fetch_open_interest(symbol)
+            # Open interest comes from the same ticker payload
+            oi_usd = float(data.get("openInterest", 0))
 
             return FundingRate(
                 exchange=self.name,
@@ -158,49 +242,42 @@ class EdgeXPerpConnector(PerpConnector):
                 quote_currency=quote,
                 funding_rate=funding_rate,
                 funding_rate_8h=funding_rate_8h,
-                next_funding_time=datetime.fromtimestamp(next_funding_ts / 1000) if next_funding_ts else None,
+                next_funding_time=datetime.fromtimestamp(next_funding_ts / 1000, tz=timezone.utc) if next_funding_ts else None,
                 open_interest_usd=oi_usd,
                 mark_price=mark_price,
                 index_price=None,
-                timestamp=datetime.utcnow(),
+                timestamp=now,
             )
-        except Exception as exc:
+        except FETCH_ERRORS as exc:
             logger.warning("EdgeX funding rate error for %s: %s", symbol, exc)
             return None
 
-    async def _fetch_perp_data(self, symbol: str) -> PerpMarketData | None:
+    async def _fetch_perp_data(
+        self,
+        symbol: str,
+        now: datetime,
+        ticker_data: dict[str, Any] | None,
+        book: MarketQuote | None = None,
+    ) -> PerpMarketData | None:
         """Fetch combined perp market data / 통합 무기한 선물 데이터 조회."""
-        base, quote = symbol.split("/")
-        edgex_symbol = self._symbol_map.get(symbol, f"{base}_{quote}")
+        base, quote, edgex_symbol = self._symbol_info[symbol]
+        if ticker_data is None:
+            return None
 
         try:
-            # Fetch all data in parallel
-            book_task = self._client.get(f"/api/public/depth", params={"symbol": edgex_symbol, "limit": 5})
-            ticker_task = self._client.get(f"/api/public/ticker", params={"symbol": edgex_symbol})
-
-            book_resp, ticker_resp = await asyncio.gather(
-                book_task, ticker_task, return_exceptions=True
-            )
-
-            # Handle exceptions
-            if isinstance(book_resp, Exception):
-                raise book_resp
-            if isinstance(ticker_resp, Exception):
-                raise ticker_resp
-
-            book_resp.raise_for_status()
-            ticker_resp.raise_for_status()
+            if book is not None:
+                best_bid, best_ask = book.bid, book.ask
+            else:
+                book_data = await self._get_json(
+                    "/api/public/depth", params={"symbol": edgex_symbol, "limit": 5}
+                )
+                bids = book_data.get("bids", [])
+                asks = book_data.get("asks", [])
+                if not bids or not asks:
+                    return None
+                best_bid = float(bids[0][0])
+                best_ask = float(asks[0][0])
 
-            book_data = book_resp.json()
-            ticker_data = ticker_resp.json()
-
-            bids = book_data.get("bids", [])
-            asks = book_data.get("asks", [])
-            if not bids or not asks:
-                return None
-
-            best_bid = float(bids[0][0])
-            best_ask = float(asks[0][0])
             mark_price = float(ticker_data.get("markPrice", 0))
             funding_rate = float(ticker_data.get("fundingRate", 0))
             next_funding_ts = int(ticker_data.get("nextFundingTime", 0))
@@ -219,11 +296,11 @@ class EdgeXPerpConnector(PerpConnector):
                 mark_price=mark_price,
                 funding_rate=funding_rate,
                 funding_rate_8h=funding_rate_8h,
-                next_funding_time=datetime.fromtimestamp(next_funding_ts / 1000) if next_funding_ts else None,
+                next_funding_time=datetime.fromtimestamp(next_funding_ts / 1000, tz=timezone.utc) if next_funding_ts else None,
                 open_interest_usd=oi_usd,
                 open_interest_contracts=None,
-                timestamp=datetime.utcnow(),
+                timestamp=now,
             )
-        except Exception as exc:
+        except FETCH_ERRORS as exc:
             logger.warning("EdgeX perp data error for %s: %s", symbol, exc)
             return None
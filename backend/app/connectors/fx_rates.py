@@ -1,93 +1,101 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime
+import time
+from datetime import datetime, timedelta, timezone
 from typing import Optional, Sequence
 
 import httpx
+import orjson
 
 from app.connectors.base import MarketConnector
 from app.core.config import get_settings
+from app.core.http import create_http_client
 from app.models.opportunity import MarketQuote
 
 logger = logging.getLogger(__name__)
 
+# USD/KRW moves slowly in Seoul hours and is flat overnight, so quotes are reused
+# 원/달러 환율은 장중에도 변화가 느리고 장외에는 고정되므로 재사용
+FX_CACHE_TTL_SECONDS = 2.0
+FX_OFF_HOURS_CACHE_TTL_SECONDS = 60.0
+KST = timezone(timedelta(hours=9))
+
+DUNAMU_FX_URL = "https://quotation-api-cdn.dunamu.com/v1/forex/recent"
+EXCHANGERATE_URL = "https://api.exchangerate-api.com/v4/latest/USD"
+UPBIT_ORDERBOOK_URL = "https://api.upbit.com/v1/orderbook"
+
+
+def _fx_cache_ttl(now: datetime) -> float:
+    """Shorter TTL during Seoul FX trading hours (weekdays 09:00-15:30 KST) / 서울 외환시장 장중에는 짧은 TTL."""
+    now = now.astimezone(KST)
+    if now.weekday() < 5 and (9, 0) <= (now.hour, now.minute) < (15, 30):
+        return FX_CACHE_TTL_SECONDS
+    return FX_OFF_HOURS_CACHE_TTL_SECONDS
+
+
+def _usd_krw_quote(exchange: str, rate: float, now: datetime) -> MarketQuote:
+    """USD/KRW quote with the rate on both sides / 매수·매도 모두 동일 환율인 원/달러 호가."""
+    return MarketQuote(
+        exchange=exchange,
+        venue_type="fx",
+        symbol="USD/KRW",
+        base_asset="USD",
+        quote_currency="KRW",
+        bid=rate,
+        ask=rate,
+        timestamp=now,
+    )
+
 
 class KRWUSDForexConnector(MarketConnector):
     """Retrieves USD/KRW forex rate from Dunamu API. / 두나무 API를 통해 달러/원 환율을 취득합니다."""
 
     venue_type = "forex"
 
-    def __init__(self) -> None:
+    def __init__(self, client: httpx.AsyncClient | None = None) -> None:
         self.name = "dunamu_fx"
-        timeout = get_settings().public_rest_timeout
-        self._dunamu = httpx.AsyncClient(
-            base_url="https://quotation-api-cdn.dunamu.com",
-            timeout=timeout,
-            headers={"User-Agent": "ArbitrageCommand/0.1"},
-        )
-        self._fallback = httpx.AsyncClient(
-            base_url="https://api.exchangerate-api.com",
-            timeout=timeout,
-            headers={"User-Agent": "ArbitrageCommand/0.1"},
-        )
-        self._upbit = httpx.AsyncClient(
-            base_url="https://api.upbit.com",
-            timeout=timeout,
-            headers={"User-Agent": "ArbitrageCommand/0.1"},
-        )
+        # All three sources share the injected client, or one private pool
+        # 세 환율 소스가 주입된 공유 클라이언트(없으면 전용 풀 하나)를 함께 사용
+        self._owns_client = client is None
+        self._client = client or create_http_client(get_settings().public_rest_timeout)
+        self._cache: tuple[float, MarketQuote] | None = None
 
     async def fetch_quotes(self) -> Sequence[MarketQuote]:
-        quote = await self._fetch_dunamu()
-        if quote:
-            return [quote]
-        quote = await self._fetch_exchangerate_host()
-        if quote:
-            return [quote]
-        # Try Upbit USDT/KRW as fallback / 업비트 USDT/KRW를 폴백으로 사용
-        quote = await self._fetch_upbit_usdt_krw()
+        # One clock read per poll, shared by the TTL check and every source / 폴링당 한 번만 시각 조회
+        now = datetime.now(timezone.utc)
+        cached = self._cache
+        if cached and time.monotonic() - cached[0] < _fx_cache_ttl(now):
+            return [cached[1]]
+        quote = (
+            await self._fetch_dunamu(now)
+            or await self._fetch_exchangerate_host(now)
+            # Try Upbit USDT/KRW as fallback / 업비트 USDT/KRW를 폴백으로 사용
+            or await self._fetch_upbit_usdt_krw(now)
+        )
         if quote:
+            self._cache = (time.monotonic(), quote)
             return [quote]
-        # Fallback to fixed rate if all APIs fail
+        # Fallback to fixed rate if all APIs fail; not cached so the APIs are retried next poll
+        # 모든 API 실패 시 고정 환율 사용 (다음 폴링에서 재시도하도록 캐시하지 않음)
         logger.warning("Using fixed USD/KRW rate (1400) / 고정 환율(1400원) 사용")
-        return [MarketQuote(
-            exchange="fixed_rate",
-            venue_type="fx",
-            symbol="USD/KRW",
-            base_asset="USD",
-            quote_currency="KRW",
-            bid=1400.0,
-            ask=1400.0,
-            timestamp=datetime.utcnow(),
-        )]
+        return [_usd_krw_quote("fixed_rate", 1400.0, now)]
 
     async def close(self) -> None:
-        await self._dunamu.aclose()
-        await self._fallback.aclose()
-        await self._upbit.aclose()
+        # The shared client is closed by the app on shutdown / 공유 클라이언트는 앱 종료 시 닫힘
+        if self._owns_client:
+            await self._client.aclose()
 
-    async def _fetch_dunamu(self) -> Optional[MarketQuote]:
+    async def _fetch_dunamu(self, now: datetime) -> Optional[MarketQuote]:
         try:
-            response = await self._dunamu.get(
-                "/v1/forex/recent", params={"codes": "FRX.KRWUSD"}
-            )
+            response = await self._client.get(DUNAMU_FX_URL, params={"codes": "FRX.KRWUSD"})
             response.raise_for_status()
-            payload = response.json()
+            payload = orjson.loads(response.content)
             if not payload:
                 return None
             data = payload[0]
             base_price = float(data.get("basePrice"))
-            now = datetime.utcnow()
-            return MarketQuote(
-                exchange=self.name,
-                venue_type="fx",
-                symbol="USD/KRW",
-                base_asset="USD",
-                quote_currency="KRW",
-                bid=base_price,
-                ask=base_price,
-                timestamp=now,
-            )
+            return _usd_krw_quote(self.name, base_price, now)
         except Exception as exc:  # pylint: disable=broad-except
             logger.warning(
                 "KRW/USD forex fetch failed: %s / 환율 조회 실패: %s",
@@ -96,25 +104,15 @@ class KRWUSDForexConnector(MarketConnector):
             )
             return None
 
-    async def _fetch_exchangerate_host(self) -> Optional[MarketQuote]:
+    async def _fetch_exchangerate_host(self, now: datetime) -> Optional[MarketQuote]:
         try:
-            response = await self._fallback.get("/v4/latest/USD")
+            response = await self._client.get(EXCHANGERATE_URL)
             response.raise_for_status()
-            payload = response.json()
+            payload = orjson.loads(response.content)
             rate = float(payload.get("rates", {}).get("KRW"))
             if not rate or rate <= 0:
                 return None
-            now = datetime.utcnow()
-            return MarketQuote(
-                exchange="exchangerate_api",
-                venue_type="fx",
-                symbol="USD/KRW",
-                base_asset="USD",
-                quote_currency="KRW",
-                bid=rate,
-                ask=rate,
-                timestamp=now,
-            )
+            return _usd_krw_quote("exchangerate_api", rate, now)
         except Exception as exc:  # pylint: disable=broad-except
             logger.warning(
                 "Fallback forex fetch failed: %s / 대체 환율 조회 실패: %s",
@@ -123,37 +121,27 @@ class KRWUSDForexConnector(MarketConnector):
             )
             return None
 
-    async def _fetch_upbit_usdt_krw(self) -> Optional[MarketQuote]:
+    async def _fetch_upbit_usdt_krw(self, now: datetime) -> Optional[MarketQuote]:
         """
         Fetch USDT/KRW rate from Upbit as fallback.
         업비트 USDT/KRW 환율을 폴백으로 사용.
         """
         try:
-            response = await self._upbit.get("/v1/orderbook", params={"markets": "KRW-USDT"})
+            response = await self._client.get(UPBIT_ORDERBOOK_URL, params={"markets": "KRW-USDT"})
             response.raise_for_status()
-            payload = response.json()
+            payload = orjson.loads(response.content)
             if not payload:
                 return None
             orderbook = payload[0]["orderbook_units"][0]
             bid = float(orderbook["bid_price"])
             ask = float(orderbook["ask_price"])
             mid = (bid + ask) / 2.0
-            now = datetime.utcnow()
             logger.info(
                 "Using Upbit USDT/KRW as forex rate: %.2f / 업비트 USDT/KRW 환율 사용: %.2f",
                 mid,
                 mid,
             )
-            return MarketQuote(
-                exchange="upbit_usdt",
-                venue_type="fx",
-                symbol="USD/KRW",
-                base_asset="USD",
-                quote_currency="KRW",
-                bid=mid,
-                ask=mid,
-                timestamp=now,
-            )
+            return _usd_krw_quote("upbit_usdt", mid, now)
         except Exception as exc:  # pylint: disable=broad-except
             logger.warning(
                 "Upbit USDT/KRW forex fetch failed: %s / 업비트 USDT/KRW 환율 조회 실패: %s",
@@ -2,50 +2,122 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from datetime import datetime
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
 from typing import Any, Iterable, Sequence
 
 import httpx
 
+from app.connectors.base import FETCH_ERRORS, encode_json_body
 from app.connectors.perp_base import PerpConnector
+from app.connectors.stream import BookStream
 from app.core.config import get_settings
 from app.models.opportunity import MarketQuote
 from app.models.market_data import FundingRate, PerpMarketData
 
 logger = logging.getLogger(__name__)
 
+STREAM_URL = "wss://api.hyperliquid.xyz/ws"
+META_AND_ASSET_CTXS_BODY = encode_json_body({"type": "metaAndAssetCtxs"})
+
+
+@dataclass(slots=True)
+class _AssetCtx:
+    """Numeric fields of one asset context, parsed once per cache window / 캐시 주기당 한 번 파싱된 자산 정보."""
+
+    funding_rate: float
+    mark_price: float
+    open_interest: float
+
 
 class HyperliquidPerpConnector(PerpConnector):
     """Fetches Hyperliquid DEX perpetual futures data / 하이퍼리퀴드 DEX 무기한 선물 데이터 수집."""
 
     venue_type = "perp"
+    base_url = "https://api.hyperliquid.xyz"
 
-    def __init__(self, symbols: Iterable[str]) -> None:
+    def __init__(self, symbols: Iterable[str], client: httpx.AsyncClient | None = None) -> None:
         self.name = "hyperliquid"
-        self._symbols = list(symbols)
-        timeout = get_settings().public_rest_timeout
-        self._client = httpx.AsyncClient(
-            base_url="https://api.hyperliquid.xyz",
-            timeout=timeout,
-            headers={"Content-Type": "application/json"},
+        self._init_symbols(symbols)
+        settings = get_settings()
+        self._init_client(client, settings.public_rest_timeout)
+        # metaAndAssetCtxs covers every coin, so one response serves half a poll interval
+        # metaAndAssetCtxs는 전체 코인을 포함하므로 폴링 주기의 절반 동안 재사용
+        self._asset_ctx_ttl = settings.market_poll_interval / 2
+        self._asset_ctx_cache: tuple[float, dict[str, _AssetCtx]] | None = None
+        self._asset_ctx_lock = asyncio.Lock()
+        # /info bodies never change per symbol, so they are encoded once
+        # 심볼별 /info 요청 본문은 고정이므로 한 번만 인코딩
+        self._l2_bodies = {
+            symbol: encode_json_body({"type": "l2Book", "coin": coin})
+            for symbol, (_, _, coin) in self._symbol_info.items()
+        }
+        # One l2Book subscription per coin; the server drops connections idle for 60s
+        # 코인별 l2Book 구독 (60초 무응답 시 서버가 연결을 끊으므로 ping 전송)
+        self._stream = BookStream(
+            "hyperliquid-perp",
+            STREAM_URL,
+            self._parse_l2book,
+            subscribe=[
+                {"method": "subscribe", "subscription": {"type": "l2Book", "coin": coin}}
+                for coin in self._venue_symbols
+            ],
+            heartbeat={"method": "ping"},
         )
-        # Map standard symbols to Hyperliquid format
-        self._symbol_map = self._build_symbol_map()
 
-    def _build_symbol_map(self) -> dict[str, str]:
+    def _parse_symbol(self, symbol: str) -> tuple[str, str, str]:
         """Map standard symbols (BTC/USDT) to Hyperliquid format (BTC) / 심볼 형식 매핑."""
-        symbol_map = {}
-        for symbol in self._symbols:
-            base, _ = symbol.split("/")
-            symbol_map[symbol] = base
-        return symbol_map
+        base, quote = symbol.split("/")
+        return base, quote, base
+
+    def _parse_l2book(self, message: dict[str, Any]) -> MarketQuote | None:
+        """l2Book channel frame to a quote; pongs and acks are skipped / l2Book 메시지를 호가로 변환."""
+        if message.get("channel") != "l2Book":
+            return None
+        data = message["data"]
+        symbol = self._venue_symbols.get(data["coin"])
+        if symbol is None:
+            return None
+        return self._book_quote(
+            symbol, data["levels"], datetime.fromtimestamp(data["time"] / 1000, tz=timezone.utc)
+        )
+
+    def _book_quote(self, symbol: str, levels: list[list[dict[str, Any]]], now: datetime) -> MarketQuote | None:
+        """Top of an l2Book ``levels`` pair / l2Book levels에서 최우선 호가 추출."""
+        if len(levels) < 2:
+            return None
+        bids, asks = levels[0], levels[1]
+        if not bids or not asks:
+            return None
+        base, quote, _ = self._symbol_info[symbol]
+        # Hyperliquid format: [{"px": ..., "sz": ..., "n": ...}, ...]
+        return MarketQuote(
+            exchange=self.name,
+            venue_type="perp",
+            symbol=symbol,
+            base_asset=base,
+            quote_currency=quote,
+            bid=float(bids[0]["px"]),
+            ask=float(asks[0]["px"]),
+            timestamp=now,
+        )
 
     async def fetch_quotes(self) -> Sequence[MarketQuote]:
-        """Fetch order book quotes for perpetual futures / 무기한 선물 호가 조회."""
-        tasks = [self._fetch_quote(symbol) for symbol in self._symbols]
+        """Fetch order book quotes for perpetual futures / 무기한 선물 호가 조회.
+
+        Streamed quotes are used while the l2Book feed is live; REST covers the
+        rest (cold start, reconnects).
+        """
+        streamed = self._live_quotes()
+        quotes: list[MarketQuote] = [streamed[symbol] for symbol in self._symbols if symbol in streamed]
+        missing = [symbol for symbol in self._symbols if symbol not in streamed]
+        if not missing:
+            return quotes
+        now = datetime.now(timezone.utc)
+        tasks = [self._fetch_quote(symbol, now) for symbol in missing]
         results = await asyncio.gather(*tasks, return_exceptions=True)
-        quotes: list[MarketQuote] = []
-        for symbol, result in zip(self._symbols, results):
+        for symbol, result in zip(missing, results):
             if isinstance(result, Exception):
                 logger.warning("Hyperliquid quote failed for %s: %s", symbol, result)
                 continue
@@ -54,21 +126,61 @@ class HyperliquidPerpConnector(PerpConnector):
         return quotes
 
     async def fetch_funding_rates(self) -> Sequence[FundingRate]:
-        """Fetch current funding rates for all symbols / 모든 심볼의 펀딩비 조회."""
-        tasks = [self._fetch_funding_rate(symbol) for symbol in self._symbols]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        funding_rates: list[FundingRate] = []
-        for symbol, result in zip(self._symbols, results):
-            if isinstance(result, Exception):
-                logger.warning("Hyperliquid funding rate failed for %s: %s", symbol, result)
-                continue
-            if result:
-                funding_rates.append(result)
-        return funding_rates
+        """Fetch current funding rates for all symbols / 모든 심볼의 펀딩비 조회.
+
+        Symbols outside the funding cache are rebuilt from one asset-context fetch.
+        캐시가 만료된 심볼은 한 번의 자산 정보 조회로 다시 구성합니다.
+        """
+        now = datetime.now(timezone.utc)
+        fetched_at = time.monotonic()
+        rates = {
+            symbol: rate
+            for symbol, (cached_at, rate) in self._funding_cache.items()
+            if fetched_at - cached_at < self.funding_cache_ttl
+        }
+        stale = [symbol for symbol in self._symbols if symbol not in rates]
+        if stale:
+            try:
+                asset_ctxs = await self._fetch_asset_ctxs()
+            except FETCH_ERRORS as exc:
+                logger.warning("Hyperliquid meta fetch failed: %s / 하이퍼리퀴드 메타 조회 실패", exc)
+                asset_ctxs = {}
+            for symbol in stale:
+                base, quote, hl_symbol = self._symbol_info[symbol]
+                asset_ctx = asset_ctxs.get(hl_symbol)
+                if asset_ctx is None:
+                    continue
+                rate = FundingRate(
+                    exchange=self.name,
+                    symbol=symbol,
+                    base_asset=base,
+                    quote_currency=quote,
+                    funding_rate=asset_ctx.funding_rate,
+                    # Hyperliquid funding rate is per hour, convert to 8H
+                    funding_rate_8h=asset_ctx.funding_rate * 8,
+                    next_funding_time=None,  # Hyperliquid doesn't provide next funding time
+                    open_interest_usd=asset_ctx.open_interest * asset_ctx.mark_price,
+                    mark_price=asset_ctx.mark_price,
+                    index_price=None,  # Not provided by Hyperliquid
+                    timestamp=now,
+                )
+                self._funding_cache[symbol] = (fetched_at, rate)
+                rates[symbol] = rate
+        return [rates[symbol] for symbol in self._symbols if symbol in rates]
 
     async def fetch_perp_market_data(self) -> Sequence[PerpMarketData]:
         """Fetch combined market data (quotes + funding + OI) / 통합 시장 데이터 조회."""
-        tasks = [self._fetch_perp_data(symbol) for symbol in self._symbols]
+        now = datetime.now(timezone.utc)
+        try:
+            asset_ctxs = await self._fetch_asset_ctxs()
+        except FETCH_ERRORS as exc:
+            logger.warning("Hyperliquid meta fetch failed: %s / 하이퍼리퀴드 메타 조회 실패", exc)
+            return []
+        # Only the order book is still fetched per symbol / 심볼별 요청은 호가만 남음
+        tasks = [
+            self._fetch_perp_data(symbol, now, asset_ctxs.get(self._symbol_info[symbol][2]))
+            for symbol in self._symbols
+        ]
         results = await asyncio.gather(*tasks, return_exceptions=True)
         data: list[PerpMarketData] = []
         for symbol, result in zip(self._symbols, results):
@@ -81,160 +193,89 @@ class HyperliquidPerpConnector(PerpConnector):
 
     async def fetch_open_interest(self, symbol: str) -> float:
         """Fetch open interest in USD for a symbol / 심볼의 USD 기준 미결제약정 조회."""
-        hl_symbol = self._symbol_map.get(symbol, symbol.split("/")[0])
+        _, _, hl_symbol = self._symbol_parts(symbol)
         try:
-            response = await self._client.post("/info", json={"type": "metaAndAssetCtxs"})
-            response.raise_for_status()
-            data = response.json()
-
-            # Find the asset
-            for asset_ctx in data[1]:  # assetCtxs is second element
-                if asset_ctx.get("coin") == hl_symbol:
-                    oi_value = float(asset_ctx.get("openInterest", 0))
-                    mark_price = float(asset_ctx.get("markPx", 0))
-                    return oi_value * mark_price
-
-            return 0.0
-        except Exception as exc:
+            asset_ctx = (await self._fetch_asset_ctxs()).get(hl_symbol)
+            if asset_ctx is None:
+                return 0.0
+            return asset_ctx.open_interest * asset_ctx.mark_price
+        except FETCH_ERRORS as exc:
             logger.warning("Hyperliquid OI fetch failed for %s: %s", symbol, exc)
             return 0.0
 
-    async def close(self) -> None:
-        await self._client.aclose()
-
-    async def _fetch_quote(self, symbol: str) -> MarketQuote | None:
+    async def _fetch_asset_ctxs(self) -> dict[str, _AssetCtx]:
+        """Tracked asset contexts keyed by coin, one request per cache window.
+
+        추적 중인 코인의 자산 정보를 한 번에 조회 (캐시 주기마다 1회 요청).
+
+        The response is ``[meta, assetCtxs]`` where ``assetCtxs[i]`` belongs to
+        ``meta["universe"][i]["name"]``; only tracked coins are converted to floats.
+        응답의 assetCtxs는 meta.universe와 같은 순서이며, 추적 코인만 변환합니다.
+        """
+        cached = self._asset_ctx_cache
+        if cached and time.monotonic() - cached[0] < self._asset_ctx_ttl:
+            return cached[1]
+        # Concurrent callers wait for the in-flight fetch instead of repeating it
+        # 동시 호출자는 진행 중인 조회를 기다린 뒤 결과를 공유
+        async with self._asset_ctx_lock:
+            cached = self._asset_ctx_cache
+            now = time.monotonic()
+            if cached and now - cached[0] < self._asset_ctx_ttl:
+                return cached[1]
+            meta, ctxs = await self._post_json("/info", content=META_AND_ASSET_CTXS_BODY)
+            venue_symbols = self._venue_symbols
+            asset_ctxs: dict[str, _AssetCtx] = {}
+            for asset, ctx in zip(meta["universe"], ctxs):
+                coin = asset["name"]
+                if coin not in venue_symbols:
+                    continue
+                asset_ctxs[coin] = _AssetCtx(
+                    funding_rate=float(ctx.get("funding") or 0),
+                    mark_price=float(ctx.get("markPx") or 0),
+                    open_interest=float(ctx.get("openInterest") or 0),
+                )
+            self._asset_ctx_cache = (now, asset_ctxs)
+            return asset_ctxs
+
+    async def _fetch_quote(self, symbol: str, now: datetime) -> MarketQuote | None:
         """Fetch order book for a single symbol / 단일 심볼 호가 조회."""
-        base, quote = symbol.split("/")
-        hl_symbol = self._symbol_map.get(symbol, base)
+        hl_symbol = self._symbol_info[symbol][2]
 
         try:
-            response = await self._client.post("/info", json={"type": "l2Book", "coin": hl_symbol})
-            response.raise_for_status()
-            data = response.json()
+            data = await self._post_json("/info", content=self._l2_bodies[symbol])
 
             # Check if symbol exists
             if not data or "levels" not in data:
                 logger.debug("Hyperliquid: Symbol %s (%s) not found or no data", symbol, hl_symbol)
                 return None
-
-            levels = data.get("levels", [])
-            if len(levels) < 2:
-                return None
-
-            bids = levels[0]  # bids
-            asks = levels[1]  # asks
-
-            if not bids or not asks:
-                return None
-
-            # Hyperliquid format: [[price, size], ...]
-            best_bid = float(bids[0][0]["px"])
-            best_ask = float(asks[0][0]["px"])
-
-            return MarketQuote(
-                exchange=self.name,
-                venue_type="perp",
-                symbol=symbol,
-                base_asset=base,
-                quote_currency=quote,
-                bid=best_bid,
-                ask=best_ask,
-                timestamp=datetime.utcnow(),
-            )
-        except Exception as exc:
+            return self._book_quote(symbol, data["levels"], now)
+        except FETCH_ERRORS as exc:
             # Only log at debug level for missing symbols to reduce noise
             logger.debug("Hyperliquid depth error for %s (%s): %s", symbol, hl_symbol, exc)
             return None
 
-    async def _fetch_funding_rate(self, symbol: str) -> FundingRate | None:
-        """Fetch funding rate for a single symbol / 단일 심볼 펀딩비 조회."""
-        base, quote = symbol.split("/")
-        hl_symbol = self._symbol_map.get(symbol, base)
-
-        try:
-            response = await self._client.post("/info", json={"type": "metaAndAssetCtxs"})
-            response.raise_for_status()
-            data = response.json()
-
-            # Find the asset in assetCtxs
-            for asset_ctx in data[1]:  # assetCtxs is second element
-                if asset_ctx.get("coin") == hl_symbol:
-                    funding_rate = float(asset_ctx.get("funding", 0))
-                    mark_price = float(asset_ctx.get("markPx", 0))
-                    oi_value = float(asset_ctx.get("openInterest", 0))
-                    oi_usd = oi_value * mark_price
-
-                    # Hyperliquid funding rate is per hour, convert to 8H
-                    funding_rate_8h = funding_rate * 8
-
-                    return FundingRate(
-                        exchange=self.name,
-                        symbol=symbol,
-                        base_asset=base,
-                        quote_currency=quote,
-                        funding_rate=funding_rate,
-                        funding_rate_8h=funding_rate_8h,
-                        next_funding_time=None,  # Hyperliquid doesn't provide next funding time
-                        open_interest_usd=oi_usd,
-                        mark_price=mark_price,
-                        index_price=None,  # Not provided by Hyperliquid
-                        timestamp=datetime.utcnow(),
-                    )
-
-            return None
-        except Exception as exc:
-            logger.warning("Hyperliquid funding rate error for %s: %s", symbol, exc)
-            return None
-
-    async def _fetch_perp_data(self, symbol: str) -> PerpMarketData | None:
+    async def _fetch_perp_data(
+        self, symbol: str, now: datetime, asset_ctx: _AssetCtx | None
+    ) -> PerpMarketData | None:
         """Fetch combined perp market data / 통합 무기한 선물 데이터 조회."""
-        base, quote = symbol.split("/")
-        hl_symbol = self._symbol_map.get(symbol, base)
+        base, quote, _ = self._symbol_info[symbol]
+        if asset_ctx is None:
+            return None
 
         try:
-            # Fetch order book and meta in parallel
-            book_task = self._client.post("/info", json={"type": "l2Book", "coin": hl_symbol})
-            meta_task = self._client.post("/info", json={"type": "metaAndAssetCtxs"})
-
-            book_resp, meta_resp = await asyncio.gather(book_task, meta_task, return_exceptions=True)
-
-            if isinstance(book_resp, Exception):
-                raise book_resp
-            if isinstance(meta_resp, Exception):
-                raise meta_resp
-
-            book_resp.raise_for_status()
-            meta_resp.raise_for_status()
-
-            book_data = book_resp.json()
-            meta_data = meta_resp.json()
-
-            # Parse order book
-            levels = book_data.get("levels", [])
-            if len(levels) < 2:
-                return None
-
-            bids = levels[0]
-            asks = levels[1]
-            if not bids or not asks:
-                return None
-
-            best_bid = float(bids[0][0]["px"])
-            best_ask = float(asks[0][0]["px"])
-
-            # Find asset in meta
-            asset_ctx = None
-            for ctx in meta_data[1]:
-                if ctx.get("coin") == hl_symbol:
-                    asset_ctx = ctx
-                    break
-
-            if not asset_ctx:
-                return None
-
-            funding_rate = float(asset_ctx.get("funding", 0))
-            mark_price = float(asset_ctx.get("markPx", 0))
-            oi_value = float(asset_ctx.get("openInterest", 0))
+            # Only the order book is per symbol, and only while the stream is down
+            # 심볼별 요청은 스트림 중단 시의 호가 조회뿐
+            book = self._live_quote(symbol)
+            if book is None:
+                book_data = await self._post_json("/info", content=self._l2_bodies[symbol])
+                book = self._book_quote(symbol, book_data.get("levels", []), now)
+                if book is None:
+                    return None
+            best_bid, best_ask = book.bid, book.ask
+
+            funding_rate = asset_ctx.funding_rate
+            mark_price = asset_ctx.mark_price
+            oi_value = asset_ctx.open_interest
             oi_usd = oi_value * mark_price
 
             # Hyperliquid funding is per hour, convert to 8H
@@ -253,8 +294,8 @@ class HyperliquidPerpConnector(PerpConnector):
                 next_funding_time=None,
                 open_interest_usd=oi_usd,
                 open_interest_contracts=oi_value,
-                timestamp=datetime.utcnow(),
+                timestamp=now,
             )
-        except Exception as exc:
+        except FETCH_ERRORS as exc:
             logger.warning("Hyperliquid perp data error for %s: %s", symbol, exc)
             return None
@@ -2,11 +2,12 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Iterable, Sequence
 
 import httpx
 
+from app.connectors.base import FETCH_ERRORS
 from app.connectors.perp_base import PerpConnector
 from app.core.config import get_settings
 from app.models.opportunity import MarketQuote
@@ -19,30 +20,23 @@ class LighterPerpConnector(PerpConnector):
     """Fetches Lighter DEX perpetual futures data / Lighter DEX 무기한 선물 데이터 수집."""
 
     venue_type = "perp"
+    base_url = "https://mainnet.zklighter.elliot.ai"
 
-    def __init__(self, symbols: Iterable[str]) -> None:
+    def __init__(self, symbols: Iterable[str], client: httpx.AsyncClient | None = None) -> None:
         self.name = "lighter"
-        self._symbols = list(symbols)
-        timeout = get_settings().public_rest_timeout
-        self._client = httpx.AsyncClient(
-            base_url="https://mainnet.zklighter.elliot.ai",  # Lighter mainnet API
-            timeout=timeout * 2,
-            headers={"Content-Type": "application/json"},
-        )
-        self._symbol_map = self._build_symbol_map()
-
-    def _build_symbol_map(self) -> dict[str, str]:
+        self._init_symbols(symbols)
+        self._init_client(client, get_settings().public_rest_timeout * 2)
+
+    def _parse_symbol(self, symbol: str) -> tuple[str, str, str]:
         """Map standard symbols to Lighter format / 심볼 형식 매핑."""
-        symbol_map = {}
-        for symbol in self._symbols:
-            base, quote = symbol.split("/")
-            # Lighter uses format like BTC-USDT
-            symbol_map[symbol] = f"{base}-{quote}"
-        return symbol_map
+        base, quote = symbol.split("/")
+        # Lighter uses format like BTC-USDT
+        return base, quote, f"{base}-{quote}"
 
     async def fetch_quotes(self) -> Sequence[MarketQuote]:
         """Fetch order book quotes for perpetual futures / 무기한 선물 호가 조회."""
-        tasks = [self._fetch_quote(symbol) for symbol in self._symbols]
+        now = datetime.now(timezone.utc)
+        tasks = [self._fetch_quote(symbol, now) for symbol in self._symbols]
         results = await asyncio.gather(*tasks, return_exceptions=True)
         quotes: list[MarketQuote] = []
         for symbol, result in zip(self._symbols, results):
@@ -55,7 +49,8 @@ class LighterPerpConnector(PerpConnector):
 
     async def fetch_funding_rates(self) -> Sequence[FundingRate]:
         """Fetch current funding rates for all symbols / 모든 심볼의 펀딩비 조회."""
-        tasks = [self._fetch_funding_rate(symbol) for symbol in self._symbols]
+        now = datetime.now(timezone.utc)
+        tasks = [self._cached_funding_rate(symbol, now) for symbol in self._symbols]
         results = await asyncio.gather(*tasks, return_exceptions=True)
         funding_rates: list[FundingRate] = []
         for symbol, result in zip(self._symbols, results):
@@ -68,7 +63,8 @@ class LighterPerpConnector(PerpConnector):
 
     async def fetch_perp_market_data(self) -> Sequence[PerpMarketData]:
         """Fetch combined market data (quotes + funding + OI) / 통합 시장 데이터 조회."""
-        tasks = [self._fetch_perp_data(symbol) for symbol in self._symbols]
+        now = datetime.now(timezone.utc)
+        tasks = [self._fetch_perp_data(symbol, now) for symbol in self._symbols]
         results = await asyncio.gather(*tasks, return_exceptions=True)
         data: list[PerpMarketData] = []
         for symbol, result in zip(self._symbols, results):
@@ -81,30 +77,22 @@ class LighterPerpConnector(PerpConnector):
 
     async def fetch_open_interest(self, symbol: str) -> float:
         """Fetch open interest in USD for a symbol / 심볼의 USD 기준 미결제약정 조회."""
-        lighter_symbol = self._symbol_map.get(symbol, symbol)
+        _, _, lighter_symbol = self._symbol_parts(symbol)
         try:
             # Lighter API endpoint for open interest
-            response = await self._client.get(f"/v1/market/{lighter_symbol}/stats")
-            response.raise_for_status()
-            data = response.json()
+            data = await self._get_json(f"/v1/market/{lighter_symbol}/stats")
             oi = float(data.get("open_interest", 0))
             return oi
-        except Exception as exc:
+        except FETCH_ERRORS as exc:
             logger.warning("Lighter OI fetch failed for %s: %s", symbol, exc)
             return 0.0
 
-    async def close(self) -> None:
-        await self._client.aclose()
-
-    async def _fetch_quote(self, symbol: str) -> MarketQuote | None:
+    async def _fetch_quote(self, symbol: str, now: datetime) -> MarketQuote | None:
         """Fetch order book for a single symbol / 단일 심볼 호가 조회."""
-        base, quote = symbol.split("/")
-        lighter_symbol = self._symbol_map.get(symbol, f"{base}-{quote}")
+        base, quote, lighter_symbol = self._symbol_info[symbol]
 
         try:
-            response = await self._client.get(f"/v1/orderbook/{lighter_symbol}", params={"depth": 5})
-            response.raise_for_status()
-            data = response.json()
+            data = await self._get_json(f"/v1/orderbook/{lighter_symbol}", params={"depth": 5})
 
             bids = data.get("bids", [])
             asks = data.get("asks", [])
@@ -122,21 +110,18 @@ class LighterPerpConnector(PerpConnector):
                 quote_currency=quote,
                 bid=best_bid,
                 ask=best_ask,
-                timestamp=datetime.utcnow(),
+                timestamp=now,
             )
-        except Exception as exc:
+        except FETCH_ERRORS as exc:
             logger.warning("Lighter quote error for %s: %s", symbol, exc)
             return None
 
-    async def _fetch_funding_rate(self, symbol: str) -> FundingRate | None:
+    async def _fetch_funding_rate(self, symbol: str, now: datetime) -> FundingRate | None:
         """Fetch funding rate for a single symbol / 단일 심볼 펀딩비 조회."""
-        base, quote = symbol.split("/")
-        lighter_symbol = self._symbol_map.get(symbol, f"{base}-{quote}")
+        base, quote, lighter_symbol = self._symbol_info[symbol]
 
         try:
-            response = await self._client.get(f"/v1/market/{lighter_symbol}/funding")
-            response.raise_for_status()
-            data = response.json()
+            data = await self._get_json(f"/v1/market/{lighter_symbol}/funding")
 
             funding_rate = float(data.get("funding_rate", 0))
             mark_price = float(data.get("mark_price", 0))
@@ -155,49 +140,34 @@ class LighterPerpConnector(PerpConnector):
                 quote_currency=quote,
                 funding_rate=funding_rate,
                 funding_rate_8h=funding_rate_8h,
-                next_funding_time=datetime.fromtimestamp(next_funding_ts / 1000) if next_funding_ts else None,
+                next_funding_time=datetime.fromtimestamp(next_funding_ts / 1000, tz=timezone.utc) if next_funding_ts else None,
                 open_interest_usd=oi_usd,
                 mark_price=mark_price,
                 index_price=None,
-                timestamp=datetime.utcnow(),
+                timestamp=now,
             )
-        except Exception as exc:
+        except FETCH_ERRORS as exc:
             logger.warning("Lighter funding rate error for %s: %s", symbol, exc)
             return None
 
-    async def _fetch_perp_data(self, symbol: str) -> PerpMarketData | None:
+    async def _fetch_perp_data(self, symbol: str, now: datetime) -> PerpMarketData | None:
         """Fetch combined perp market data / 통합 무기한 선물 데이터 조회."""
-        base, quote = symbol.split("/")
-        lighter_symbol = self._symbol_map.get(symbol, f"{base}-{quote}")
+        base, quote, lighter_symbol = self._symbol_info[symbol]
 
         try:
-            # Fetch all data in parallel
-            book_task = self._client.get(f"/v1/orderbook/{lighter_symbol}", params={"depth": 5})
-            funding_task = self._client.get(f"/v1/market/{lighter_symbol}/funding")
-            stats_task = self._client.get(f"/v1/market/{lighter_symbol}/stats")
-
-            book_resp, funding_resp, stats_resp = await asyncio.gather(
-                book_task, funding_task, stats_task, return_exceptions=True
-            )
-
-            # Handle exceptions
-            if isinstance(book_resp, Exception):
-                raise book_resp
-            if isinstance(funding_resp, Exception):
-                raise funding_resp
-            if isinstance(stats_resp, Exception):
-                logger.warning("Stats fetch failed for %s, using default", symbol)
-                oi_usd = 0.0
-            else:
-                stats_resp.raise_for_status()
-                stats_data = stats_resp.json()
-                oi_usd = float(stats_data.get("open_interest", 0))
-
-            book_resp.raise_for_status()
-            funding_resp.raise_for_status()
-
-            book_data = book_resp.json()
-            funding_data = funding_resp.json()
+            # Fetch all data in parallel; a book or funding failure cancels the rest.
+            # OI is optional and fetch_open_interest falls back to 0.0 instead of raising.
+            # 병렬 조회 (호가/펀딩 실패 시 나머지 취소, OI는 실패 시 0.0)
+            async with asyncio.TaskGroup() as tg:
+                book_task = tg.create_task(
+                    self._get_json(f"/v1/orderbook/{lighter_symbol}", params={"depth": 5})
+                )
+                funding_task = tg.create_task(self._get_json(f"/v1/market/{lighter_symbol}/funding"))
+                oi_task = tg.create_task(self.fetch_open_interest(symbol))
+
+            book_data = book_task.result()
+            funding_data = funding_task.result()
+            oi_usd = oi_task.result()
 
             bids = book_data.get("bids", [])
             asks = book_data.get("asks", [])
@@ -223,11 +193,19 @@ class LighterPerpConnector(PerpConnector):
                 mark_price=mark_price,
                 funding_rate=funding_rate,
                 funding_rate_8h=funding_rate_8h,
-                next_funding_time=datetime.fromtimestamp(next_funding_ts / 1000) if next_funding_ts else None,
+                next_funding_time=datetime.fromtimestamp(next_funding_ts / 1000, tz=timezone.utc) if next_funding_ts else None,
                 open_interest_usd=oi_usd,
                 open_interest_contracts=None,
-                timestamp=datetime.utcnow(),
+                timestamp=now,
             )
-        except Exception as exc:
+        except FETCH_ERRORS as exc:
             logger.warning("Lighter perp data error for %s: %s", symbol, exc)
             return None
+        except ExceptionGroup as group:
+            # TaskGroup wraps request failures; anything unexpected propagates
+            # TaskGroup이 요청 실패를 감싸서 전달 (예상 외 예외는 전파)
+            matched, rest = group.split(FETCH_ERRORS)
+            if rest is not None:
+                raise
+            logger.warning("Lighter perp data error for %s: %s", symbol, matched.exceptions[0])
+            return None
@@ -2,35 +2,38 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Iterable, Sequence
 
 import httpx
+import orjson
 
-from app.connectors.base import MarketConnector
+from app.connectors.base import RestConnector, check_status
 from app.core.config import get_settings
 from app.models.opportunity import MarketQuote
 
 logger = logging.getLogger(__name__)
 
 
-class OkxSpotConnector(MarketConnector):
+class OkxSpotConnector(RestConnector):
     """Fetches OKX spot order book snapshots. / OKX 현물 주문장을 수집합니다."""
 
     venue_type = "spot"
+    base_url = "https://www.okx.com"
 
-    def __init__(self, symbols: Iterable[str]) -> None:
+    def __init__(self, symbols: Iterable[str], client: httpx.AsyncClient | None = None) -> None:
         self.name = "okx"
-        self._symbols = list(symbols)
-        timeout = get_settings().public_rest_timeout
-        self._client = httpx.AsyncClient(
-            base_url="https://www.okx.com",
-            timeout=timeout,
-            headers={"User-Agent": "ArbitrageCommand/0.1"},
-        )
+        self._init_symbols(symbols)
+        self._init_client(client, get_settings().public_rest_timeout)
+
+    def _parse_symbol(self, symbol: str) -> tuple[str, str, str]:
+        """OKX instrument ids look like BTC-USDT / OKX 심볼 형식."""
+        base, quote = symbol.split("/")
+        return base, quote, f"{base}-{quote}"
 
     async def fetch_quotes(self) -> Sequence[MarketQuote]:
-        tasks = [self._fetch_symbol(symbol) for symbol in self._symbols]
+        now = datetime.now(timezone.utc)
+        tasks = [self._fetch_symbol(symbol, now) for symbol in self._symbols]
         results = await asyncio.gather(*tasks, return_exceptions=True)
         quotes: list[MarketQuote] = []
         for symbol, result in zip(self._symbols, results):
@@ -47,19 +50,15 @@ class OkxSpotConnector(MarketConnector):
                 quotes.append(result)
         return quotes
 
-    async def close(self) -> None:
-        await self._client.aclose()
-
-    async def _fetch_symbol(self, symbol: str) -> MarketQuote | None:
-        base, quote = symbol.split("/")
-        inst_id = f"{base}-{quote}"
+    async def _fetch_symbol(self, symbol: str, now: datetime) -> MarketQuote | None:
+        base, quote, inst_id = self._symbol_info[symbol]
         try:
-            response = await self._client.get(
+            response = await self._get(
                 "/api/v5/market/books",
                 params={"instId": inst_id, "sz": 5},
             )
-            response.raise_for_status()
-        except Exception as exc:  # pylint: disable=broad-except
+            check_status(response)
+        except httpx.HTTPError as exc:
             logger.warning(
                 "OKX depth error for %s: %s / OKX 호가 조회 오류 (%s): %s",
                 symbol,
@@ -69,7 +68,7 @@ class OkxSpotConnector(MarketConnector):
             )
             return None
 
-        payload = response.json()
+        payload = orjson.loads(response.content)
         data = payload.get("data") or []
         if not data:
             return None
@@ -89,5 +88,5 @@ class OkxSpotConnector(MarketConnector):
             quote_currency=quote,
             bid=best_bid,
             ask=best_ask,
-            timestamp=datetime.utcnow(),
+            timestamp=now,
         )
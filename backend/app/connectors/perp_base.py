@@ -1,19 +1,40 @@
 from __future__ import annotations
 
 import abc
-from typing import Sequence
+import time
+from datetime import datetime
+from typing import Iterable, Sequence
 
-from app.connectors.base import MarketConnector
+from app.connectors.base import RestConnector
 from app.models.market_data import FundingRate, PerpMarketData
 
 
-class PerpConnector(MarketConnector):
+class PerpConnector(RestConnector):
     """Abstract base class for perpetual futures connectors / 무기한 선물 커넥터를 위한 추상 기본 클래스.
 
-    This extends MarketConnector to also provide funding rate and open interest data.
-    MarketConnector를 확장하여 펀딩비와 미결제약정 데이터도 제공합니다.
+    This extends RestConnector to also provide funding rate and open interest data.
+    RestConnector를 확장하여 펀딩비와 미결제약정 데이터도 제공합니다.
     """
 
+    # Funding settles every few hours, so funding payloads are reused this long.
+    # 펀딩비는 수 시간마다 정산되므로 이 시간 동안 재사용합니다.
+    funding_cache_ttl: float = 60.0
+
+    def _init_symbols(self, symbols: Iterable[str]) -> None:
+        super()._init_symbols(symbols)
+        self._funding_cache: dict[str, tuple[float, FundingRate]] = {}
+
+    async def _cached_funding_rate(self, symbol: str, now: datetime) -> FundingRate | None:
+        """``_fetch_funding_rate`` behind a ``funding_cache_ttl`` cache / TTL 캐시를 거친 펀딩비 조회."""
+        cached = self._funding_cache.get(symbol)
+        fetched_at = time.monotonic()
+        if cached and fetched_at - cached[0] < self.funding_cache_ttl:
+            return cached[1]
+        rate = await self._fetch_funding_rate(symbol, now)
+        if rate is not None:
+            self._funding_cache[symbol] = (fetched_at, rate)
+        return rate
+
     @abc.abstractmethod
     async def fetch_funding_rates(self) -> Sequence[FundingRate]:
         """Return the latest funding rates for all symbols / 모든 심볼의 최신 펀딩비를 반환합니다."""
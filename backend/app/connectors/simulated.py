@@ -2,12 +2,27 @@ from __future__ import annotations
 
 import asyncio
 import random
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Iterable, Literal, Sequence
 
 from app.connectors.base import MarketConnector
 from app.models.opportunity import MarketQuote
 
+BASE_PRICES = {
+    "BTC/USDT": 63000,
+    "ETH/USDT": 3200,
+    "XRP/USDT": 0.58,
+}
+# Premium/discount bias per exchange to mimic 김프 (Korean premium) dynamics.
+EXCHANGE_BIAS = {
+    "upbit": 0.004,  # Positive premium
+    "binance": 0.0,
+    "okx": -0.0015,
+    "bybit": -0.0005,
+    "bithumb": 0.003,
+}
+
+
 class SimulatedConnector(MarketConnector):
     """Generates pseudo-random market quotes that resemble exchange feeds. / 거래소 시세를 모사하는 의사난수 호가를 생성합니다."""
 
@@ -21,52 +36,52 @@ class SimulatedConnector(MarketConnector):
         self.name = name
         self.venue_type = venue_type
         self._base_spread = base_spreads_bps / 10000
-        self._last_timestamp = datetime.utcnow()
-        self._symbols = list(symbols)
+        self._last_timestamp = datetime.now(timezone.utc)
+        self._symbols: tuple[str, ...] = tuple(symbols)
+        self._symbol_parts = {symbol: tuple(symbol.split("/")) for symbol in self._symbols}
+        # Private RNG so the module-global one is never reseeded / 전역 RNG를 재시드하지 않도록 전용 RNG 사용
+        self._rng = random.Random()
+        # Mid prices only move once a minute, so (symbol, base, quote, mid, half spread)
+        # rows are rebuilt per minute and only the spread jitter is drawn per tick
+        # 중간가는 분 단위로만 변하므로 행을 분마다 재계산하고 매 틱 스프레드 변동만 생성
+        self._mid_minute: datetime | None = None
+        self._levels: tuple[tuple[str, str, str, float, float], ...] = ()
 
     async def fetch_quotes(self) -> Sequence[MarketQuote]:
         # Introduce slight delay to mimic network jitter.
-        await asyncio.sleep(random.uniform(0.0, 0.05))
-        quotes: list[MarketQuote] = []
-        now = datetime.utcnow()
-        for symbol in self._symbols:
-            mid = self._generate_mid_price(symbol, now)
-            spread = mid * self._base_spread
-            variance = spread * random.uniform(0.5, 1.5)
-            bid = mid - variance / 2
-            ask = mid + variance / 2
-            base, quote = symbol.split("/")
-            quotes.append(
-                MarketQuote(
-                    exchange=self.name,
-                    venue_type=self.venue_type,
-                    symbol=symbol,
-                    base_asset=base,
-                    quote_currency=quote,
-                    bid=round(bid, 2),
-                    ask=round(ask, 2),
-                    timestamp=now,
-                )
+        await asyncio.sleep(self._rng.uniform(0.0, 0.05))
+        now = datetime.now(timezone.utc)
+        # Prices are seeded per minute; truncate once per batch / 분 단위 시드는 배치당 한 번만 계산
+        minute = now.replace(second=0, microsecond=0)
+        if minute != self._mid_minute:
+            self._levels = tuple(self._level(symbol, minute) for symbol in self._symbols)
+            self._mid_minute = minute
+        exchange, venue_type, uniform = self.name, self.venue_type, self._rng.uniform
+        quotes = [
+            MarketQuote(
+                exchange=exchange,
+                venue_type=venue_type,
+                symbol=symbol,
+                base_asset=base,
+                quote_currency=quote,
+                bid=round(mid - (half := half_spread * uniform(0.5, 1.5)), 2),
+                ask=round(mid + half, 2),
+                timestamp=now,
             )
+            for symbol, base, quote, mid, half_spread in self._levels
+        ]
         self._last_timestamp = now
         return quotes
 
-    def _generate_mid_price(self, symbol: str, now: datetime) -> float:
-        seed = hash((self.name, symbol, now.replace(second=0, microsecond=0)))
-        random.seed(seed)
-        base_price = {
-            "BTC/USDT": 63000,
-            "ETH/USDT": 3200,
-            "XRP/USDT": 0.58,
-        }[symbol]
-        drift = random.uniform(-0.01, 0.01) * base_price
-        micro_noise = random.gauss(0, base_price * 0.001)
-        # Introduce premium/discount bias per exchange to mimic 김프 (Korean premium) dynamics.
-        bias = {
-            "upbit": base_price * 0.004,  # Positive premium
-            "binance": base_price * 0.0,
-            "okx": base_price * -0.0015,
-            "bybit": base_price * -0.0005,
-            "bithumb": base_price * 0.003,
-        }.get(self.name, 0.0)
+    def _level(self, symbol: str, minute: datetime) -> tuple[str, str, str, float, float]:
+        base, quote = self._symbol_parts[symbol]
+        mid = self._generate_mid_price(symbol, minute)
+        return symbol, base, quote, mid, mid * self._base_spread / 2
+
+    def _generate_mid_price(self, symbol: str, minute: datetime) -> float:
+        rng = random.Random(hash((self.name, symbol, minute)))
+        base_price = BASE_PRICES[symbol]
+        drift = rng.uniform(-0.01, 0.01) * base_price
+        micro_noise = rng.gauss(0, base_price * 0.001)
+        bias = base_price * EXCHANGE_BIAS.get(self.name, 0.0)
         return base_price + drift + micro_noise + bias
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any, Callable, Sequence
+
+import orjson
+import websockets
+
+from app.models.opportunity import MarketQuote
+
+logger = logging.getLogger(__name__)
+
+# A stream silent for longer than this is treated as down / 이 시간 이상 메시지가 없으면 끊긴 것으로 간주
+STREAM_STALE_SECONDS = 10.0
+RECONNECT_DELAY_SECONDS = 1.0
+MAX_RECONNECT_DELAY_SECONDS = 30.0
+HEARTBEAT_INTERVAL_SECONDS = 20.0
+
+
+class BookStream:
+    """Always-on WebSocket consumer holding the latest top-of-book quote per symbol.
+
+    공개 웹소켓으로 심볼별 최우선 호가를 유지하는 상시 소비자.
+
+    Connectors read :meth:`fresh_quotes` instead of polling REST depth and fall back
+    to REST for symbols missing from it. Quotes are dropped when a connection opens
+    or closes, and a quote not updated within ``STREAM_STALE_SECONDS`` is left out
+    (venues such as Binance bookTicker push no snapshot, so a thin symbol can sit
+    unchanged for a long time).
+    커넥터는 REST 대신 :meth:`fresh_quotes`를 읽고, 누락된 심볼만 REST로 조회합니다.
+    연결이 열리거나 끊기면 호가를 비우고, 일정 시간 갱신되지 않은 호가는 제외합니다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        url: str,
+        parse: Callable[[Any], MarketQuote | None],
+        subscribe: Sequence[dict[str, Any]] = (),
+        heartbeat: dict[str, Any] | None = None,
+    ) -> None:
+        self.name = name
+        self.quotes: dict[str, MarketQuote] = {}
+        # Monotonic receive time per symbol / 심볼별 수신 시각 (monotonic)
+        self._received: dict[str, float] = {}
+        self._url = url
+        self._parse = parse
+        self._subscribe = [orjson.dumps(message).decode() for message in subscribe]
+        self._heartbeat = orjson.dumps(heartbeat).decode() if heartbeat else None
+        self._last_message = 0.0
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def live(self) -> bool:
+        return time.monotonic() - self._last_message < STREAM_STALE_SECONDS
+
+    def fresh_quotes(self) -> dict[str, MarketQuote]:
+        """Quotes received within ``STREAM_STALE_SECONDS`` / 최근 수신된 호가만 반환."""
+        if not self.live:
+            return {}
+        cutoff = time.monotonic() - STREAM_STALE_SECONDS
+        received = self._received
+        return {symbol: quote for symbol, quote in self.quotes.items() if received[symbol] >= cutoff}
+
+    def fresh_quote(self, symbol: str) -> MarketQuote | None:
+        """Single-symbol :meth:`fresh_quotes` / 단일 심볼의 최근 호가."""
+        quote = self.quotes.get(symbol)
+        if quote is None or time.monotonic() - self._received[symbol] >= STREAM_STALE_SECONDS:
+            return None
+        return quote
+
+    def _reset(self) -> None:
+        """Forget every quote; nothing from a previous connection is served / 이전 연결의 호가 폐기."""
+        self.quotes.clear()
+        self._received.clear()
+        self._last_message = 0.0
+
+    def start(self) -> None:
+        if self._task and not self._task.done():
+            return
+        self._task = asyncio.create_task(self._run(), name=f"book-stream-{self.name}")
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        self._reset()
+
+    async def _run(self) -> None:
+        delay = RECONNECT_DELAY_SECONDS
+        while True:
+            try:
+                async with websockets.connect(self._url, max_queue=None) as ws:
+                    self._reset()
+                    for message in self._subscribe:
+                        await ws.send(message)
+                    logger.info("%s book stream connected / 호가 스트림 연결됨", self.name)
+                    delay = RECONNECT_DELAY_SECONDS
+                    heartbeat = asyncio.create_task(self._send_heartbeats(ws)) if self._heartbeat else None
+                    try:
+                        async for raw in ws:
+                            now = self._last_message = time.monotonic()
+                            quote = self._parse(orjson.loads(raw))
+                            if quote is not None:
+                                self.quotes[quote.symbol] = quote
+                                self._received[quote.symbol] = now
+                    finally:
+                        if heartbeat:
+                            heartbeat.cancel()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:  # pylint: disable=broad-except
+                logger.warning(
+                    "%s book stream dropped: %s, reconnecting in %.0fs / 호가 스트림 끊김, 재연결 대기",
+                    self.name,
+                    exc,
+                    delay,
+                )
+            self._reset()
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, MAX_RECONNECT_DELAY_SECONDS)
+
+    async def _send_heartbeats(self, ws: Any) -> None:
+        while True:
+            await asyncio.sleep(HEARTBEAT_INTERVAL_SECONDS)
+            await ws.send(self._heartbeat)
@@ -1,13 +1,16 @@
+from dataclasses import dataclass, fields
 from functools import lru_cache
 from typing import Literal, Sequence, Tuple
 
 from pydantic import Field
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
     """Application configuration loaded from environment variables. / 환경변수에서 불러오는 애플리케이션 설정."""
 
+    model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
+
     app_name: str = "Arbitrage Backend / 아비트리지 백엔드"
     environment: Literal["local", "staging", "production"] = "local"
     log_level: str = "INFO"
@@ -63,6 +66,10 @@ class Settings(BaseSettings):
         description="Enable Binance/OKX spot market data via public REST.",
     )
     public_rest_timeout: float = Field(3.0, description="HTTP timeout for public REST fetches.")
+    enable_book_streams: bool = Field(
+        default=True,
+        description="Stream best bid/ask over public WebSockets where supported; REST depth is the fallback.",
+    )
 
     enable_ccxt_spot: bool = Field(
         default=False,
@@ -133,11 +140,30 @@ class Settings(BaseSettings):
     upbit_secret_key: str = Field(default="", description="Upbit API secret key.")
     wallet_proxy_token: str = Field(default="", description="Token for wallet status proxy endpoint.")
 
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-
 
 @lru_cache
 def get_settings() -> Settings:
     return Settings()
+
+
+@dataclass(frozen=True, slots=True)
+class EngineSettings:
+    """Frozen copy of the settings read inside the engine's per-pair loops. / 엔진 루프에서 읽는 설정의 고정 스냅샷.
+
+    Pydantic attribute reads cost several times a plain slot load; these are read
+    once per candidate pair every tick and never change after startup.
+    Pydantic 속성 접근은 슬롯 접근보다 몇 배 느리며, 이 값들은 매 틱 후보 쌍마다 읽힙니다.
+    """
+
+    max_spread_bps: float
+    min_profit_pct: float
+    simulated_base_notional: float
+    simulated_fee_bps: float
+    kimchi_deviation_threshold_pct: float
+    min_kimchi_allocation_pct: float
+
+
+@lru_cache
+def get_engine_settings() -> EngineSettings:
+    settings = get_settings()
+    return EngineSettings(**{f.name: getattr(settings, f.name) for f in fields(EngineSettings)})
@@ -0,0 +1,40 @@
+"""Shared HTTP client factory / 공유 HTTP 클라이언트 팩토리."""
+from __future__ import annotations
+
+import logging
+
+import httpx
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = "ArbitrageCommand/0.1"
+
+# Optional HTTP/2 support (httpx[http2]) / 선택적 HTTP/2 지원
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+    logger.warning("h2 not installed, falling back to HTTP/1.1 / h2 미설치, HTTP/1.1 사용")
+
+
+def create_http_client(timeout: float | None = None) -> httpx.AsyncClient:
+    """
+    Create the app-wide pooled AsyncClient.
+    앱 전역에서 공유하는 커넥션 풀 AsyncClient 생성.
+
+    One client keeps TCP/TLS connections alive across connectors and requests.
+    Callers pass absolute URLs since no base_url is set. With HTTP/2, concurrent
+    polls of the same exchange are multiplexed over a single connection.
+    Connectors and checkers built without the shared client create their own through here.
+    """
+    if timeout is None:
+        timeout = get_settings().public_rest_timeout
+    return httpx.AsyncClient(
+        http2=HTTP2_AVAILABLE,
+        limits=httpx.Limits(max_connections=200, max_keepalive_connections=100, keepalive_expiry=90),
+        timeout=httpx.Timeout(timeout, connect=5.0),
+        headers={"User-Agent": USER_AGENT},
+    )
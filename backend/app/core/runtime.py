@@ -0,0 +1,23 @@
+"""Event loop selection for entrypoints outside uvicorn / uvicorn 외 실행 진입점의 이벤트 루프 선택.
+
+uvicorn picks uvloop itself (``--loop uvloop``); standalone scripts use :func:`run`.
+uvicorn은 자체적으로 uvloop을 사용하고, 독립 스크립트는 :func:`run`을 사용합니다.
+"""
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Coroutine, TypeVar
+
+try:
+    import uvloop
+except ImportError:  # e.g. Windows / 윈도우 등
+    uvloop = None
+
+T = TypeVar("T")
+
+
+def run(main: Coroutine[Any, Any, T]) -> T:
+    """``asyncio.run`` on uvloop when installed / uvloop 설치 시 uvloop에서 실행."""
+    if uvloop is not None:
+        return uvloop.run(main)
+    return asyncio.run(main)
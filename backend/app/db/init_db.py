@@ -6,6 +6,7 @@ import logging
 from sqlalchemy.ext.asyncio import AsyncEngine
 
 from app.db.base import Base
+from app.db.migrations import upgrade
 from app.db.session import engine
 from app.models.db_models import (
     BalanceSnapshot,
@@ -29,6 +30,8 @@ async def init_db(engine_override: AsyncEngine | None = None) -> None:
     async with target_engine.begin() as conn:
         logger.info("Creating database tables... / 데이터베이스 테이블 생성 중...")
         await conn.run_sync(Base.metadata.create_all)
+        # create_all never alters existing tables / create_all은 기존 테이블을 변경하지 않음
+        await conn.run_sync(upgrade)
         logger.info("Database tables created successfully. / 데이터베이스 테이블 생성 완료.")
 
 
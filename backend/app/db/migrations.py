@@ -0,0 +1,100 @@
+"""In-place schema upgrades for existing databases / 기존 데이터베이스 스키마 업그레이드.
+
+``create_all`` only creates missing tables; it never alters a table that already
+exists, so column type changes and new indexes on existing tables are applied
+here. Every step is idempotent and runs after ``create_all`` in :func:`init_db`.
+``create_all``은 기존 테이블을 변경하지 않으므로 타입 변경과 인덱스 추가를 여기서 적용합니다.
+모든 단계는 멱등이며 init_db에서 create_all 이후 실행됩니다.
+
+Run manually with ``python -m app.db.migrations``.
+"""
+from __future__ import annotations
+
+import logging
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.db.base import Base
+from app.models.db_models import PositionStatusType
+
+logger = logging.getLogger(__name__)
+
+# Position indexes that were renamed; index names are schema-wide, and these
+# clashed with the ``orders`` indexes of the same name
+# 이름이 바뀐 포지션 인덱스 (orders 인덱스와 이름이 충돌했음)
+LEGACY_POSITION_INDEXES = ("idx_user_status", "idx_opportunity")
+
+
+def _status_case(column: str) -> str:
+    """SQL CASE mapping legacy enum names to SMALLINT codes / 기존 enum 이름을 SMALLINT 코드로 변환."""
+    whens = " ".join(
+        f"WHEN '{status.name}' THEN {code}" for status, code in PositionStatusType._CODES.items()
+    )
+    return f"CASE {column} {whens} END"
+
+
+def _migrate_position_status(conn: Connection) -> None:
+    """Convert ``positions.status`` from the native ENUM to SMALLINT codes / 포지션 상태를 SMALLINT로 변환."""
+    if conn.dialect.name == "postgresql":
+        data_type = conn.execute(
+            text(
+                "SELECT data_type FROM information_schema.columns "
+                "WHERE table_name = 'positions' AND column_name = 'status'"
+            )
+        ).scalar()
+        if data_type is None or data_type == "smallint":
+            return
+        logger.info("Converting positions.status to SMALLINT / positions.status를 SMALLINT로 변환")
+        conn.execute(
+            text(
+                "ALTER TABLE positions ALTER COLUMN status TYPE SMALLINT "
+                f"USING {_status_case('status::text')}"
+            )
+        )
+        conn.execute(text("DROP TYPE IF EXISTS positionstatus"))
+        return
+    # SQLite keeps the VARCHAR column; only the stored values change
+    # SQLite는 컬럼 타입은 그대로 두고 저장된 값만 변환
+    names = ", ".join(f"'{status.name}'" for status in PositionStatusType._CODES)
+    result = conn.execute(
+        text(f"UPDATE positions SET status = {_status_case('status')} WHERE status IN ({names})")
+    )
+    if result.rowcount:
+        logger.info("Rewrote %d position statuses to codes / 포지션 상태 %d건 변환", result.rowcount, result.rowcount)
+
+
+def _migrate_indexes(conn: Connection) -> None:
+    """Create indexes missing from existing tables and drop renamed ones / 누락된 인덱스 생성, 이전 인덱스 삭제."""
+    inspector = inspect(conn)
+    position_indexes = {index["name"] for index in inspector.get_indexes("positions")}
+    for name in LEGACY_POSITION_INDEXES:
+        if name in position_indexes:
+            logger.info("Dropping legacy index %s / 이전 인덱스 %s 삭제", name, name)
+            conn.execute(text(f"DROP INDEX {name}"))
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(conn, checkfirst=True)
+
+
+def upgrade(conn: Connection) -> None:
+    """Apply every schema upgrade / 모든 스키마 업그레이드 적용."""
+    if not inspect(conn).has_table("positions"):
+        return
+    _migrate_position_status(conn)
+    _migrate_indexes(conn)
+
+
+async def migrate_db(engine: AsyncEngine) -> None:
+    """Upgrade an existing database in place / 기존 데이터베이스를 제자리에서 업그레이드."""
+    async with engine.begin() as conn:
+        await conn.run_sync(upgrade)
+
+
+if __name__ == "__main__":
+    from app.core.runtime import run
+    from app.db.session import engine as default_engine
+
+    logging.basicConfig(level=logging.INFO)
+    run(migrate_db(default_engine))
@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.routes import router as api_router
@@ -15,6 +16,7 @@ from app.api.wallet_routes import router as wallet_router
 from app.db.init_db import init_db
 from app.connectors.binance_spot import BinanceSpotConnector
 from app.connectors.bithumb_spot import BithumbSpotConnector
+from app.connectors.deposit_status import close_deposit_checker, get_deposit_checker
 from app.connectors.fx_rates import KRWUSDForexConnector
 from app.connectors.okx_spot import OkxSpotConnector
 from app.connectors.simulated import SimulatedConnector
@@ -25,6 +27,7 @@ from app.connectors.hyperliquid_perp import HyperliquidPerpConnector
 from app.connectors.lighter_perp import LighterPerpConnector
 from app.connectors.edgex_perp import EdgeXPerpConnector
 from app.core.config import get_settings
+from app.core.http import create_http_client
 from app.services.opportunity_engine import OpportunityEngine
 from app.services.fill_monitor import start_fill_monitor, stop_fill_monitor
 # from app.services.position_monitor import start_position_monitor, stop_position_monitor  # TODO: Fix connector_factory dependency
@@ -43,7 +46,7 @@ logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
 settings = get_settings()
-app = FastAPI(title=settings.app_name)
+app = FastAPI(title=settings.app_name, default_response_class=ORJSONResponse)
 
 # Allow local frontend dev server during MVP.
 app.add_middleware(
@@ -71,15 +74,19 @@ async def startup_event() -> None:
     except Exception as exc:
         logger.warning("Database initialization skipped: %s / DB 초기화 생략: %s", exc, exc)
 
+    # Shared pooled HTTP client / 공유 HTTP 클라이언트
+    http_client = create_http_client()
+    app.state.http_client = http_client
+
     connectors = []
 
     if settings.enable_public_rest_spot:
         connectors.extend(
             [
-                BinanceSpotConnector(settings.trading_symbols),
-                OkxSpotConnector(settings.trading_symbols),
-                UpbitSpotConnector(settings.trading_symbols),
-                BithumbSpotConnector(settings.trading_symbols),
+                BinanceSpotConnector(settings.trading_symbols, client=http_client),
+                OkxSpotConnector(settings.trading_symbols, client=http_client),
+                UpbitSpotConnector(settings.trading_symbols, client=http_client),
+                BithumbSpotConnector(settings.trading_symbols, client=http_client),
             ]
         )
     else:
@@ -106,41 +113,41 @@ async def startup_event() -> None:
             ]
         )
 
-    connectors.append(KRWUSDForexConnector())
+    connectors.append(KRWUSDForexConnector(client=http_client))
 
     # Add perpetual futures connectors / 무기한 선물 커넥터 추가
     if settings.enable_perp_connectors:
         if settings.enable_binance_perp:
             try:
-                connectors.append(BinancePerpConnector(settings.trading_symbols))
+                connectors.append(BinancePerpConnector(settings.trading_symbols, client=http_client))
                 logger.info("Binance perpetual futures connector enabled / 바이낸스 무기한 선물 커넥터 활성화")
             except Exception as exc:  # pylint: disable=broad-except
                 logger.exception("Failed to initialize Binance perp connector: %s", exc)
 
         if settings.enable_bybit_perp:
             try:
-                connectors.append(BybitPerpConnector(settings.trading_symbols))
+                connectors.append(BybitPerpConnector(settings.trading_symbols, client=http_client))
                 logger.info("Bybit perpetual futures connector enabled / 바이빗 무기한 선물 커넥터 활성화")
             except Exception as exc:  # pylint: disable=broad-except
                 logger.exception("Failed to initialize Bybit perp connector: %s", exc)
 
         if settings.enable_hyperliquid_perp:
             try:
-                connectors.append(HyperliquidPerpConnector(settings.trading_symbols))
+                connectors.append(HyperliquidPerpConnector(settings.trading_symbols, client=http_client))
                 logger.info("Hyperliquid DEX perpetual connector enabled (also powers based.one) / 하이퍼리퀴드 DEX 무기한 선물 커넥터 활성화 (based.one도 지원)")
             except Exception as exc:  # pylint: disable=broad-except
                 logger.exception("Failed to initialize Hyperliquid perp connector: %s", exc)
 
         if settings.enable_lighter_perp:
             try:
-                connectors.append(LighterPerpConnector(settings.trading_symbols))
+                connectors.append(LighterPerpConnector(settings.trading_symbols, client=http_client))
                 logger.info("Lighter DEX perpetual connector enabled / Lighter DEX 무기한 선물 커넥터 활성화")
             except Exception as exc:  # pylint: disable=broad-except
                 logger.exception("Failed to initialize Lighter perp connector: %s", exc)
 
         if settings.enable_edgex_perp:
             try:
-                connectors.append(EdgeXPerpConnector(settings.trading_symbols))
+                connectors.append(EdgeXPerpConnector(settings.trading_symbols, client=http_client))
                 logger.info("EdgeX perpetual connector enabled / EdgeX 무기한 선물 커넥터 활성화")
             except Exception as exc:  # pylint: disable=broad-except
                 logger.exception("Failed to initialize EdgeX perp connector: %s", exc)
@@ -174,6 +181,10 @@ async def startup_event() -> None:
                 )
     elif settings.enable_ccxt_spot and not CCXT_AVAILABLE:
         logger.warning("CCXT is enabled in settings but not installed / 설정에서 활성화되었지만 설치되지 않음")
+    # Keep deposit/withdrawal status warm off the opportunity hot path; created
+    # before the engine so the singleton picks up the shared client
+    # 입출금 상태를 백그라운드에서 미리 갱신 (공유 클라이언트 사용을 위해 엔진보다 먼저 생성)
+    get_deposit_checker(http_client).start()
     engine = OpportunityEngine(connectors=connectors)
     await engine.start()
     app.state.opportunity_engine = engine
@@ -202,3 +213,9 @@ async def shutdown_event() -> None:
     if engine:
         await engine.stop()
         logger.info("Opportunity engine stopped. / 기회 엔진이 중지되었습니다.")
+
+    await close_deposit_checker()
+
+    http_client = getattr(app.state, "http_client", None)
+    if http_client:
+        await http_client.aclose()
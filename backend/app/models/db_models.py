@@ -17,8 +17,10 @@ from sqlalchemy import (
     Text,
     Boolean,
     Index,
+    SmallInteger,
+    TypeDecorator,
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship
 
 from app.db.base import Base
 
@@ -41,6 +43,9 @@ class User(Base):
     exchange_credentials = relationship("ExchangeCredential", back_populates="user")
     orders = relationship("Order", back_populates="user")
     balances = relationship("BalanceSnapshot", back_populates="user")
+    risk_limit = relationship(
+        "RiskLimit", back_populates="user", uselist=False, cascade="save-update, merge, delete"
+    )
 
 
 class ExchangeCredential(Base):
@@ -197,6 +202,9 @@ class RiskLimit(Base):
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    # Relationships
+    user = relationship("User", back_populates="risk_limit")
+
 
 class ExecutionLog(Base):
     """Execution attempt logs / 실행 시도 로그."""
@@ -224,6 +232,39 @@ class PositionStatus(str, enum.Enum):
     FAILED = "failed"  # Failed to exit
 
 
+class PositionStatusType(TypeDecorator):
+    """
+    Store PositionStatus as a SMALLINT code / PositionStatus를 SMALLINT 코드로 저장.
+
+    Codes are persisted, so only append new statuses to the end.
+    코드는 DB에 저장되므로 새 상태는 끝에만 추가할 것.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    _CODES = {
+        PositionStatus.OPEN: 1,
+        PositionStatus.CLOSING: 2,
+        PositionStatus.CLOSED: 3,
+        PositionStatus.FAILED: 4,
+    }
+    _STATUSES = {code: status for status, code in _CODES.items()}
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return self._CODES[PositionStatus(value)]
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        if isinstance(value, str) and not value.isdigit():
+            # Rows written before the SMALLINT switch hold enum names / 이전 형식(이름) 호환
+            return PositionStatus[value]
+        return self._STATUSES[int(value)]
+
+
 class Position(Base):
     """Open position tracking for arbitrage strategies / 차익거래 전략의 오픈 포지션 추적."""
 
@@ -234,11 +275,12 @@ class Position(Base):
     opportunity_id = Column(String(50), nullable=False)  # UUID from opportunity
     position_type = Column(String(50), nullable=False)  # funding_arb, perp_perp_spread, etc.
     symbol = Column(String(50), nullable=False)
-    status = Column(Enum(PositionStatus), default=PositionStatus.OPEN, nullable=False)
+    status = Column(PositionStatusType(), default=PositionStatus.OPEN, nullable=False)
 
     # Entry details
     entry_time = Column(DateTime, default=datetime.utcnow, nullable=False)
-    entry_legs = Column(JSON, nullable=False)  # [{exchange, venue_type, side, price, quantity, order_id}, ...]
+    # JSON payloads are deferred; load with undefer_group("legs") / JSON 컬럼은 지연 로딩
+    entry_legs = deferred(Column(JSON, nullable=False), group="legs")  # [{exchange, venue_type, side, price, quantity, order_id}, ...]
     entry_notional = Column(Float, nullable=False)  # Total notional value in USD
 
     # Exit targets
@@ -252,16 +294,17 @@ class Position(Base):
 
     # Exit details (populated when closed)
     exit_time = Column(DateTime, nullable=True)
-    exit_legs = Column(JSON, nullable=True)  # [{exchange, venue_type, side, price, quantity, order_id}, ...]
+    exit_legs = deferred(Column(JSON, nullable=True), group="legs")  # [{exchange, venue_type, side, price, quantity, order_id}, ...]
     realized_pnl_pct = Column(Float, nullable=True)
     realized_pnl_usd = Column(Float, nullable=True)
     exit_reason = Column(String(50), nullable=True)  # target_hit, stop_loss, manual, spread_converged
 
     # Additional metadata
-    position_metadata = Column(JSON, nullable=True)  # Additional strategy-specific data
+    position_metadata = deferred(Column(JSON, nullable=True), group="legs")  # Additional strategy-specific data
 
     __table_args__ = (
-        Index("idx_user_status", "user_id", "status"),
-        Index("idx_opportunity", "opportunity_id"),
+        Index("idx_position_user_status", "user_id", "status"),
+        Index("idx_position_user_entry_time", "user_id", "entry_time"),
+        Index("idx_position_opportunity", "opportunity_id"),
         Index("idx_symbol_status", "symbol", "status"),
     )
@@ -1,34 +1,43 @@
 from __future__ import annotations
 
-from datetime import datetime
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from typing import Literal, Optional
 
-from pydantic import BaseModel, Field
+# Connector outputs are slotted dataclasses rather than pydantic models: one is
+# built per symbol per poll and they are never validated from user input.
+# 커넥터 출력은 폴링마다 대량 생성되므로 pydantic 대신 slots 데이터클래스 사용.
 
 
-class FundingRate(BaseModel):
+def utc_now() -> datetime:
+    """Timezone-aware UTC now (``datetime.utcnow`` is deprecated) / UTC 기준 현재 시각."""
+    return datetime.now(timezone.utc)
+
+
+@dataclass(slots=True, kw_only=True)
+class FundingRate:
     """Perpetual futures funding rate data / 무기한 선물 펀딩비 데이터."""
 
-    exchange: str = Field(description="Exchange name / 거래소 이름")
-    symbol: str = Field(description="Symbol (e.g., BTC/USDT:USDT) / 심볼")
-    base_asset: str = Field(description="Base asset (e.g., BTC) / 기초 자산")
-    quote_currency: str = Field(description="Quote currency (e.g., USDT) / 결제 통화")
+    exchange: str  # Exchange name / 거래소 이름
+    symbol: str  # Symbol (e.g., BTC/USDT:USDT) / 심볼
+    base_asset: str  # Base asset (e.g., BTC) / 기초 자산
+    quote_currency: str  # Quote currency (e.g., USDT) / 결제 통화
 
     # Funding rate data / 펀딩비 데이터
-    funding_rate: float = Field(description="Current funding rate (decimal, e.g., 0.0001 = 0.01%) / 현재 펀딩비")
-    funding_rate_8h: float = Field(description="Annualized to 8H for comparison / 8시간 기준으로 정규화")
-    next_funding_time: Optional[datetime] = Field(default=None, description="Next funding timestamp / 다음 펀딩 시간")
+    funding_rate: float  # Current funding rate (decimal, e.g., 0.0001 = 0.01%) / 현재 펀딩비
+    funding_rate_8h: float  # Annualized to 8H for comparison / 8시간 기준으로 정규화
+    next_funding_time: Optional[datetime] = None  # Next funding timestamp / 다음 펀딩 시간
 
     # Open Interest data / 미결제약정 데이터
-    open_interest_usd: Optional[float] = Field(default=None, description="Open interest in USD / USD 기준 미결제약정")
-    open_interest_contracts: Optional[float] = Field(default=None, description="Open interest in contracts / 계약 기준 미결제약정")
+    open_interest_usd: Optional[float] = None  # Open interest in USD / USD 기준 미결제약정
+    open_interest_contracts: Optional[float] = None  # Open interest in contracts / 계약 기준 미결제약정
 
     # Price data / 가격 데이터
-    mark_price: Optional[float] = Field(default=None, description="Mark price / 표시 가격")
-    index_price: Optional[float] = Field(default=None, description="Index price / 지수 가격")
+    mark_price: Optional[float] = None  # Mark price / 표시 가격
+    index_price: Optional[float] = None  # Index price / 지수 가격
 
     # Metadata / 메타데이터
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = field(default_factory=utc_now)
     venue_type: Literal["perp"] = "perp"
 
     @property
@@ -38,7 +47,8 @@ class FundingRate(BaseModel):
         return self.funding_rate * 3 * 365
 
 
-class PerpMarketData(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class PerpMarketData:
     """Combined perpetual market data with quote and funding / 무기한 선물 시장 데이터 (호가 + 펀딩비)."""
 
     exchange: str
@@ -61,7 +71,7 @@ class PerpMarketData(BaseModel):
     open_interest_contracts: Optional[float] = None
 
     # Metadata / 메타데이터
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = field(default_factory=utc_now)
     venue_type: Literal["perp"] = "perp"
 
     @property
@@ -1,8 +1,11 @@
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 from typing import Any, Literal, Optional
 
+from app.models.market_data import utc_now
+
 
 class OpportunityType(str, Enum):
     SPOT_CROSS = "spot_cross"
@@ -12,8 +15,12 @@ class OpportunityType(str, Enum):
     KIMCHI_PREMIUM = "kimchi_premium"
 
 
-class MarketQuote(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
+@dataclass(slots=True, kw_only=True)
+class MarketQuote:
+    """Top-of-book quote from a connector; a slotted dataclass since one is built per symbol per poll.
+
+    커넥터 호가 (폴링마다 심볼별로 생성되므로 slots 데이터클래스 사용).
+    """
 
     exchange: str
     venue_type: Literal["spot", "perp", "fx"]
@@ -22,7 +29,7 @@ class MarketQuote(BaseModel):
     quote_currency: str
     bid: float
     ask: float
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = field(default_factory=utc_now)
 
     @property
     def mid_price(self) -> float:
@@ -39,6 +46,14 @@ class OpportunityLeg(BaseModel):
 
 
 class Opportunity(BaseModel):
+    """Arbitrage opportunity served over the API / API로 제공되는 차익거래 기회.
+
+    The engine builds these with ``model_construct`` from already-typed quote
+    fields, skipping validation on every tick; validation still applies to
+    anything parsed from external input.
+    엔진은 이미 타입이 보장된 값으로 ``model_construct``를 사용해 매 틱 검증을 생략합니다.
+    """
+
     model_config = ConfigDict(from_attributes=True)
 
     id: str
@@ -51,3 +66,7 @@ class Opportunity(BaseModel):
     description: str
     legs: list[OpportunityLeg]
     metadata: Optional[dict[str, Any]] = None
+
+
+# Serializes opportunity lists straight to JSON bytes / 기회 목록을 바로 JSON 바이트로 직렬화
+OpportunityListAdapter = TypeAdapter(list[Opportunity])
@@ -3,7 +3,9 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
 from sqlalchemy import select
@@ -21,6 +23,8 @@ logger = logging.getLogger(__name__)
 class AutoTradingStrategy:
     """Base class for automated trading strategies / 자동 거래 전략 기본 클래스."""
 
+    __slots__ = ()
+
     def should_execute(self, opportunity: Opportunity) -> bool:
         """
         Determine if an opportunity should be executed.
@@ -35,29 +39,21 @@ class AutoTradingStrategy:
         raise NotImplementedError
 
 
+@dataclass(frozen=True, slots=True)
 class ConservativeStrategy(AutoTradingStrategy):
     """
     Conservative strategy: Only execute high-quality opportunities.
     보수적 전략: 고품질 기회만 실행.
-    """
 
-    def __init__(
-        self,
-        min_spread_bps: float = 50.0,
-        min_expected_pnl_pct: float = 0.5,
-        min_notional: float = 100.0,
-    ):
-        """
-        Initialize conservative strategy.
+    Attributes:
+        min_spread_bps: Minimum spread in basis points
+        min_expected_pnl_pct: Minimum expected PnL percentage
+        min_notional: Minimum notional (too small trades filtered out)
+    """
 
-        Args:
-            min_spread_bps: Minimum spread in basis points
-            min_expected_pnl_pct: Minimum expected PnL percentage
-            min_notional: Minimum notional (too small trades filtered out)
-        """
-        self.min_spread_bps = min_spread_bps
-        self.min_expected_pnl_pct = min_expected_pnl_pct
-        self.min_notional = min_notional
+    min_spread_bps: float = 50.0
+    min_expected_pnl_pct: float = 0.5
+    min_notional: float = 100.0
 
     def should_execute(self, opportunity: Opportunity) -> bool:
         """Check if opportunity meets conservative criteria / 보수적 기준 충족 여부 확인."""
@@ -68,29 +64,21 @@ class ConservativeStrategy(AutoTradingStrategy):
         )
 
 
+@dataclass(frozen=True, slots=True)
 class AggressiveStrategy(AutoTradingStrategy):
     """
     Aggressive strategy: Execute more opportunities with lower thresholds.
     공격적 전략: 낮은 기준으로 더 많은 기회 실행.
-    """
 
-    def __init__(
-        self,
-        min_spread_bps: float = 20.0,
-        min_expected_pnl_pct: float = 0.2,
-        min_notional: float = 50.0,
-    ):
-        """
-        Initialize aggressive strategy.
+    Attributes:
+        min_spread_bps: Minimum spread in basis points
+        min_expected_pnl_pct: Minimum expected PnL percentage
+        min_notional: Minimum notional (too small trades filtered out)
+    """
 
-        Args:
-            min_spread_bps: Minimum spread in basis points
-            min_expected_pnl_pct: Minimum expected PnL percentage
-            min_notional: Minimum notional (too small trades filtered out)
-        """
-        self.min_spread_bps = min_spread_bps
-        self.min_expected_pnl_pct = min_expected_pnl_pct
-        self.min_notional = min_notional
+    min_spread_bps: float = 20.0
+    min_expected_pnl_pct: float = 0.2
+    min_notional: float = 50.0
 
     def should_execute(self, opportunity: Opportunity) -> bool:
         """Check if opportunity meets aggressive criteria / 공격적 기준 충족 여부 확인."""
@@ -101,26 +89,19 @@ class AggressiveStrategy(AutoTradingStrategy):
         )
 
 
+@dataclass(frozen=True, slots=True)
 class FundingRateStrategy(AutoTradingStrategy):
     """
     Strategy focused on funding rate arbitrage.
     펀딩 비율 차익거래 전략.
-    """
 
-    def __init__(
-        self,
-        min_funding_rate_apr: float = 10.0,  # 10% APR
-        min_notional: float = 100.0,
-    ):
-        """
-        Initialize funding rate strategy.
+    Attributes:
+        min_funding_rate_apr: Minimum funding rate APR %
+        min_notional: Minimum notional (too small trades filtered out)
+    """
 
-        Args:
-            min_funding_rate_apr: Minimum funding rate APR %
-            min_notional: Minimum notional (too small trades filtered out)
-        """
-        self.min_funding_rate_apr = min_funding_rate_apr
-        self.min_notional = min_notional
+    min_funding_rate_apr: float = 10.0  # 10% APR
+    min_notional: float = 100.0
 
     def should_execute(self, opportunity: Opportunity) -> bool:
         """Check if opportunity is funding arbitrage with good rate / 좋은 펀딩 비율 확인."""
@@ -135,6 +116,35 @@ class FundingRateStrategy(AutoTradingStrategy):
         )
 
 
+@lru_cache(maxsize=128)
+def make_strategy(
+    name: str,
+    min_spread_bps: float | None = None,
+    min_expected_pnl_pct: float | None = None,
+    min_funding_rate_apr: float | None = None,
+) -> AutoTradingStrategy:
+    """
+    Build a strategy by name, reusing instances for identical parameters.
+    이름으로 전략 생성 (동일 파라미터는 인스턴스 재사용).
+
+    Raises:
+        ValueError: If the strategy name is unknown
+    """
+    if name == "conservative":
+        return ConservativeStrategy(
+            min_spread_bps=min_spread_bps or 50.0,
+            min_expected_pnl_pct=min_expected_pnl_pct or 0.5,
+        )
+    if name == "aggressive":
+        return AggressiveStrategy(
+            min_spread_bps=min_spread_bps or 20.0,
+            min_expected_pnl_pct=min_expected_pnl_pct or 0.2,
+        )
+    if name == "funding_rate":
+        return FundingRateStrategy(min_funding_rate_apr=min_funding_rate_apr or 10.0)
+    raise ValueError(f"Unknown strategy: {name}")
+
+
 class AutoTrader:
     """
     Automated trading service that executes opportunities based on strategy.
@@ -148,6 +158,7 @@ class AutoTrader:
         strategy: AutoTradingStrategy,
         check_interval: int = 10,
         dry_run: bool = True,
+        strategy_name: str = "unknown",
     ):
         """
         Initialize auto trader.
@@ -158,10 +169,12 @@ class AutoTrader:
             strategy: Trading strategy to use
             check_interval: Seconds between opportunity checks
             dry_run: If True, only simulate trades
+            strategy_name: Strategy identifier reported in status responses
         """
         self.opportunity_engine = opportunity_engine
         self.user_id = user_id
         self.strategy = strategy
+        self.strategy_name = strategy_name
         self.check_interval = check_interval
         self.dry_run = dry_run
         self._running = False
@@ -307,6 +320,7 @@ class AutoTraderManager:
         strategy: AutoTradingStrategy,
         check_interval: int = 10,
         dry_run: bool = True,
+        strategy_name: str = "unknown",
     ) -> None:
         """
         Start auto trader for a user.
@@ -317,6 +331,7 @@ class AutoTraderManager:
             strategy: Trading strategy
             check_interval: Check interval in seconds
             dry_run: Simulation mode
+            strategy_name: Strategy identifier (conservative, aggressive, funding_rate)
         """
         if user_id in self._traders:
             logger.warning(
@@ -332,6 +347,7 @@ class AutoTraderManager:
             strategy=strategy,
             check_interval=check_interval,
             dry_run=dry_run,
+            strategy_name=strategy_name,
         )
         trader.start()
         self._traders[user_id] = trader
@@ -5,13 +5,41 @@ import logging
 from typing import Any
 
 import ccxt
+import orjson
 from ccxt.base.exchange import Exchange
 
 from app.auth.encryption import decrypt_api_key
+from app.connectors.deposit_status import get_deposit_checker
 from app.models.db_models import ExchangeCredential
 
 logger = logging.getLogger(__name__)
 
+# Error codes meaning the asset's deposits/withdrawals are suspended, per exchange,
+# as (response code field, codes). ccxt raises ExchangeError("<id> <raw body>").
+# 거래소별 자산 입출금 중단 오류 코드 (응답 코드 필드, 코드). ccxt 메시지는 "<id> <원본 응답>".
+SUSPENSION_ERROR_CODES: dict[str, tuple[str, frozenset[int]]] = {
+    "binance": ("code", frozenset({-4026})),
+    "bybit": ("retCode", frozenset({131228})),
+}
+
+
+def _error_code(exc: Exception, field: str) -> int | None:
+    """Numeric code from the JSON body ccxt appends to the message / ccxt 메시지의 응답 코드 추출."""
+    _, _, body = str(exc).partition(" ")
+    try:
+        payload = orjson.loads(body)
+        return int(payload[field])
+    except (ValueError, TypeError, KeyError):
+        return None
+
+
+def _is_suspension_error(exchange_id: str, exc: Exception) -> bool:
+    spec = SUSPENSION_ERROR_CODES.get(exchange_id)
+    if spec is None:
+        return False
+    field, codes = spec
+    return _error_code(exc, field) in codes
+
 
 class ExchangeClientFactory:
     """Factory for creating exchange clients / 거래소 클라이언트 팩토리."""
@@ -170,6 +198,10 @@ class ExchangeClientFactory:
             raise
         except ccxt.ExchangeError as exc:
             logger.error("Exchange error on %s: %s", exchange.id, exc)
+            if _is_suspension_error(exchange.id, exc):
+                # Stop surfacing opportunities on this asset before the next status refresh
+                # 다음 상태 갱신 전이라도 해당 자산의 기회 노출 중단
+                get_deposit_checker().mark_disabled(exchange.id, symbol.replace("_", "/").split("/")[0])
             raise
         except Exception as exc:
             logger.exception("Unexpected error submitting order to %s: %s", exchange.id, exc)
@@ -4,20 +4,64 @@ import asyncio
 import itertools
 import logging
 import uuid
-from collections import defaultdict
-from datetime import datetime
+from collections import defaultdict, deque
+from datetime import datetime, timezone
 from typing import Awaitable, Sequence
 
 from app.connectors.base import MarketConnector
 from app.connectors.perp_base import PerpConnector
 from app.connectors.deposit_status import get_deposit_checker
-from app.core.config import get_settings
-from app.models.opportunity import MarketQuote, Opportunity, OpportunityLeg, OpportunityType
+from app.core.config import get_engine_settings, get_settings
+from app.models.opportunity import (
+    MarketQuote,
+    Opportunity,
+    OpportunityLeg,
+    OpportunityListAdapter,
+    OpportunityType,
+)
 from app.models.market_data import FundingRate, PerpMarketData
 
 logger = logging.getLogger(__name__)
 
 
+class OpportunitySubscription:
+    """
+    Single-consumer mailbox of pre-serialized opportunity snapshots.
+    단일 소비자용 (직렬화된) 기회 스냅샷 우편함.
+
+    The producer appends to a bounded deque and resolves a future; the consumer
+    wakes once per burst and takes only the newest snapshot.
+    """
+
+    __slots__ = ("_pending", "_waiter")
+
+    def __init__(self, max_pending: int = 5) -> None:
+        self._pending: deque[str] = deque(maxlen=max_pending)
+        self._waiter: asyncio.Future[None] | None = None
+
+    @property
+    def backlogged(self) -> bool:
+        """True once the consumer has fallen a full buffer behind / 소비자가 버퍼만큼 뒤처졌는지 여부."""
+        return len(self._pending) == self._pending.maxlen
+
+    def push(self, message: str) -> None:
+        self._pending.append(message)
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+
+    async def next(self) -> str:
+        """Wait for and return the newest pending snapshot / 최신 스냅샷 대기 후 반환."""
+        while not self._pending:
+            self._waiter = asyncio.get_running_loop().create_future()
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+        latest = self._pending[-1]
+        self._pending.clear()
+        return latest
+
+
 class OpportunityEngine:
     """Continuously ingests market data and generates arbitrage opportunities. / 마켓 데이터를 연속으로 수집해 아비트리지 기회를 생성합니다."""
 
@@ -26,13 +70,17 @@ class OpportunityEngine:
         # Separate perp connectors for funding rate collection
         self._perp_connectors = [c for c in connectors if isinstance(c, PerpConnector)]
         self._settings = get_settings()
+        # Loop-hot thresholds as plain slots / 루프에서 자주 읽는 임계값
+        self._limits = get_engine_settings()
         self._tether_curve: list[tuple[float, float]] = sorted(
             [tuple(point) for point in self._settings.tether_bot_curve],
             key=lambda item: item[0],
         )
         self._tether_equity = self._settings.tether_total_equity_usd
         self._latest: list[Opportunity] = []
-        self._listeners: list[asyncio.Queue[list[Opportunity]]] = []
+        self._latest_message = "[]"
+        self._by_id: dict[str, Opportunity] = {}
+        self._listeners: set[OpportunitySubscription] = set()
         self._task: asyncio.Task[None] | None = None
         self._stop_event = asyncio.Event()
         self._deposit_checker = get_deposit_checker()
@@ -40,21 +88,34 @@ class OpportunityEngine:
     def latest(self) -> list[Opportunity]:
         return self._latest
 
-    def subscribe(self) -> "asyncio.Queue[list[Opportunity]]":
-        queue: asyncio.Queue[list[Opportunity]] = asyncio.Queue(maxsize=5)
-        self._listeners.append(queue)
-        return queue
+    def latest_message(self) -> str:
+        """Latest snapshot as a JSON text frame, encoded once per tick / 틱당 한 번 인코딩된 최신 스냅샷 JSON."""
+        return self._latest_message
 
-    def unsubscribe(self, queue: "asyncio.Queue[list[Opportunity]]") -> None:
-        try:
-            self._listeners.remove(queue)
-        except ValueError:
-            pass
+    def get(self, opportunity_id: str) -> Opportunity | None:
+        """Look up a live opportunity by id / ID로 현재 기회 조회."""
+        return self._by_id.get(opportunity_id)
+
+    def subscribe(self) -> OpportunitySubscription:
+        subscription = OpportunitySubscription(max_pending=5)
+        self._listeners.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: OpportunitySubscription) -> None:
+        # Dropping the reference frees its buffered snapshots / 참조 해제로 버퍼도 함께 해제
+        self._listeners.discard(subscription)
 
     async def start(self) -> None:
         if self._task and not self._task.done():
             return
         self._stop_event.clear()
+        if self._settings.enable_book_streams:
+            # WebSocket book feeds replace REST depth polling where available
+            # 지원 거래소는 웹소켓 호가 스트림으로 REST 폴링 대체
+            for connector in self._connectors:
+                start_stream = getattr(connector, "start_stream", None)
+                if start_stream:
+                    await start_stream()
         self._task = asyncio.create_task(self._run_loop(), name="opportunity-engine")
 
     async def stop(self) -> None:
@@ -94,22 +155,26 @@ class OpportunityEngine:
                 continue
 
     async def _tick(self) -> None:
+        # Order matters: perp connectors may reuse the books their own fetch_quotes
+        # produced earlier in this tick (e.g. EdgeX) / 순서 유지: 무기한 커넥터는 이번 틱의 호가를 재사용
         quotes = await self._gather_quotes()
         perp_data = await self._gather_perp_data()
+        # One snapshot time for every opportunity in this tick / 틱 단위 단일 타임스탬프
+        now = datetime.now(timezone.utc)
 
         # Kimchi premium strategy - enabled for hot coin opportunities
         # 김치프리미엄 전략 - 급등 코인 기회 포착용 활성화
-        opportunities = self._generate_kimchi_premium(quotes, perp_data)
+        opportunities = self._generate_kimchi_premium(quotes, perp_data, now)
 
         # Disabled other spot strategies - require asset ownership or margin/loan capability
         # 기타 현물 전략 비활성화 - 자산 보유 또는 대출/마진 기능 필요
-        # opportunities.extend(self._generate_spot_cross(quotes))
-        # opportunities.extend(self._generate_spot_perp_basis(quotes, perp_data))
+        # opportunities.extend(self._generate_spot_cross(quotes, now))
+        # opportunities.extend(self._generate_spot_perp_basis(quotes, perp_data, now))
 
         # Focus on perpetual futures strategies - executable with cash/margin only
         # 무기한 선물 전략에 집중 - 현금/마진만으로 실행 가능
-        opportunities.extend(self._generate_funding_arb(perp_data))
-        opportunities.extend(self._generate_perp_perp_spread(perp_data))
+        opportunities.extend(self._generate_funding_arb(perp_data, now))
+        opportunities.extend(self._generate_perp_perp_spread(perp_data, now))
 
         # Filter out opportunities with blocked deposits/withdrawals
         # 입출금이 막힌 기회는 필터링
@@ -117,14 +182,12 @@ class OpportunityEngine:
 
         # No placeholder opportunities - only show real trading signals
         self._latest = filtered_opportunities
-        for queue in list(self._listeners):
-            if queue.full():
-                # Drop oldest update to keep queue fresh.
-                try:
-                    queue.get_nowait()
-                except asyncio.QueueEmpty:
-                    pass
-            await queue.put(filtered_opportunities)
+        self._by_id = {opp.id: opp for opp in filtered_opportunities}
+        # Serialize once and multicast to every subscriber / 한 번 직렬화 후 모든 구독자에게 전송
+        self._latest_message = OpportunityListAdapter.dump_json(filtered_opportunities).decode()
+        for subscription in self._listeners:
+            # Bounded deque drops the oldest update to keep subscribers fresh.
+            subscription.push(self._latest_message)
 
     async def _gather_quotes(self) -> list[MarketQuote]:
         tasks: list[Awaitable[Sequence[MarketQuote]]] = [
@@ -168,7 +231,7 @@ class OpportunityEngine:
             perp_data.extend(result)
         return perp_data
 
-    def _generate_spot_cross(self, quotes: Sequence[MarketQuote]) -> list[Opportunity]:
+    def _generate_spot_cross(self, quotes: Sequence[MarketQuote], now: datetime) -> list[Opportunity]:
         # Filter out only spot quotes, exclude perp and fx
         spot_quotes = [q for q in quotes if q.venue_type == "spot"]
 
@@ -182,21 +245,21 @@ class OpportunityEngine:
                 spread_bps = self._calculate_spread_bps(left.ask, right.bid)
                 if spread_bps <= 0:
                     continue
-                if spread_bps > self._settings.max_spread_bps:
+                if spread_bps > self._limits.max_spread_bps:
                     continue
                 expected_pnl_pct = spread_bps / 10000 - self._estimate_fees_pct(left, right)
                 if expected_pnl_pct <= 0:
                     continue
-                notional = self._settings.simulated_base_notional
+                notional = self._limits.simulated_base_notional
                 quantity = notional / ((left.ask + right.bid) / 2)
-                opportunity = Opportunity(
+                opportunity = Opportunity.model_construct(
                     id=str(uuid.uuid4()),
                     type=OpportunityType.SPOT_CROSS,
                     symbol=f"{base_asset}/{quote_currency}",
                     spread_bps=round(spread_bps, 3),
                     expected_pnl_pct=round(expected_pnl_pct * 100, 3),
                     notional=round(notional, 2),
-                    timestamp=datetime.utcnow(),
+                    timestamp=now,
                     description=(
                         f"Buy {base_asset}/{quote_currency} on {left.exchange} @{left.ask} / "
                         f"sell on {right.exchange} @{right.bid}"
@@ -204,7 +267,7 @@ class OpportunityEngine:
                         f"{right.exchange}에서 {right.bid}에 매도"
                     ),
                     legs=[
-                        OpportunityLeg(
+                        OpportunityLeg.model_construct(
                             exchange=left.exchange,
                             venue_type=left.venue_type,
                             side="buy",
@@ -212,7 +275,7 @@ class OpportunityEngine:
                             price=left.ask,
                             quantity=round(quantity, 6),
                         ),
-                        OpportunityLeg(
+                        OpportunityLeg.model_construct(
                             exchange=right.exchange,
                             venue_type=right.venue_type,
                             side="sell",
@@ -225,7 +288,9 @@ class OpportunityEngine:
                 opportunities.append(opportunity)
         return sorted(opportunities, key=lambda opp: opp.expected_pnl_pct, reverse=True)
 
-    def _generate_kimchi_premium(self, quotes: Sequence[MarketQuote], perp_data: Sequence[PerpMarketData]) -> list[Opportunity]:
+    def _generate_kimchi_premium(
+        self, quotes: Sequence[MarketQuote], perp_data: Sequence[PerpMarketData], now: datetime
+    ) -> list[Opportunity]:
         fx_quotes = [q for q in quotes if q.base_asset == "USD" and q.quote_currency == "KRW"]
         if not fx_quotes:
             return []
@@ -281,21 +346,21 @@ class OpportunityEngine:
                 krw_mid_usd = krw_quote.mid_price / fx_mid
                 premium_pct = (krw_mid_usd - global_mid) / global_mid
                 spread_bps = premium_pct * 10000
-                notional = self._settings.simulated_base_notional
+                notional = self._limits.simulated_base_notional
                 quantity = notional / global_mid if global_mid else 0
                 if quantity <= 0:
                     continue
 
                 # Check deviation from average
                 deviation = abs((premium_pct * 100) - avg_premium)
-                if deviation < self._settings.kimchi_deviation_threshold_pct:
+                if deviation < self._limits.kimchi_deviation_threshold_pct:
                     continue
 
                 allocation_fraction = self._evaluate_allocation(premium_pct * 100)
                 allocation_pct = allocation_fraction * 100
 
                 # Filter out low-allocation opportunities (noise)
-                if allocation_pct < self._settings.min_kimchi_allocation_pct:
+                if allocation_pct < self._limits.min_kimchi_allocation_pct:
                     continue
 
                 recommended_notional = allocation_fraction * self._tether_equity
@@ -352,14 +417,14 @@ class OpportunityEngine:
                 if funding_rate_24h is not None:
                     metadata["funding_rate_24h_pct"] = round(funding_rate_24h * 100, 4)
 
-                opportunity = Opportunity(
+                opportunity = Opportunity.model_construct(
                     id=str(uuid.uuid4()),
                     type=OpportunityType.KIMCHI_PREMIUM,
                     symbol=f"{asset}/KRW{krw_venue_label} vs {asset}/{global_quote.quote_currency}{global_venue_label}",
                     spread_bps=round(spread_bps, 3),
                     expected_pnl_pct=round(premium_pct * 100, 3),
                     notional=round(notional, 2),
-                    timestamp=datetime.utcnow(),
+                    timestamp=now,
                     description=description,
                     legs=legs,
                     metadata=metadata,
@@ -376,7 +441,7 @@ class OpportunityEngine:
         premium_pct: float,
     ) -> list[OpportunityLeg]:
         if premium_pct >= 0:
-            global_leg = OpportunityLeg(
+            global_leg = OpportunityLeg.model_construct(
                 exchange=global_quote.exchange,
                 venue_type=global_quote.venue_type,
                 side="buy",
@@ -384,7 +449,7 @@ class OpportunityEngine:
                 price=global_quote.ask,
                 quantity=round(quantity, 6),
             )
-            krw_leg = OpportunityLeg(
+            krw_leg = OpportunityLeg.model_construct(
                 exchange=krw_quote.exchange,
                 venue_type=krw_quote.venue_type,
                 side="sell",
@@ -393,7 +458,7 @@ class OpportunityEngine:
                 quantity=round(quantity, 6),
             )
         else:
-            global_leg = OpportunityLeg(
+            global_leg = OpportunityLeg.model_construct(
                 exchange=global_quote.exchange,
                 venue_type=global_quote.venue_type,
                 side="sell",
@@ -401,7 +466,7 @@ class OpportunityEngine:
                 price=global_quote.bid,
                 quantity=round(quantity, 6),
             )
-            krw_leg = OpportunityLeg(
+            krw_leg = OpportunityLeg.model_construct(
                 exchange=krw_quote.exchange,
                 venue_type=krw_quote.venue_type,
                 side="buy",
@@ -411,7 +476,7 @@ class OpportunityEngine:
             )
         return [global_leg, krw_leg]
 
-    def _generate_funding_arb(self, perp_data: Sequence[PerpMarketData]) -> list[Opportunity]:
+    def _generate_funding_arb(self, perp_data: Sequence[PerpMarketData], now: datetime) -> list[Opportunity]:
         """Generate funding rate arbitrage opportunities / 펀딩비 차익거래 기회 생성.
 
         Delta-neutral strategy: long on exchange with negative funding, short on exchange with positive funding.
@@ -463,20 +528,20 @@ class OpportunityEngine:
 
                     # Only consider if expected PnL exceeds minimum threshold after fees
                     # 수수료 차감 후 최소 수익률 기준 충족하는 경우만
-                    if expected_pnl_pct <= (self._settings.min_profit_pct / 100):
+                    if expected_pnl_pct <= (self._limits.min_profit_pct / 100):
                         continue
 
-                    notional = self._settings.simulated_base_notional
+                    notional = self._limits.simulated_base_notional
                     quantity = notional / long_perp.mark_price
 
-                    opportunity = Opportunity(
+                    opportunity = Opportunity.model_construct(
                         id=str(uuid.uuid4()),
                         type=OpportunityType.FUNDING_ARB,
                         symbol=f"{asset}/USDT:USDT",
                         spread_bps=round(funding_diff_8h * 10000, 3),
                         expected_pnl_pct=round(expected_pnl_pct, 3),
                         notional=round(notional, 2),
-                        timestamp=datetime.utcnow(),
+                        timestamp=now,
                         description=(
                             f"Funding arb: Long {long_perp.exchange} @{long_perp.funding_rate_8h*100:.4f}%/8H, "
                             f"Short {short_perp.exchange} @{short_perp.funding_rate_8h*100:.4f}%/8H / "
@@ -484,7 +549,7 @@ class OpportunityEngine:
                             f"{short_perp.exchange} 숏 {short_perp.funding_rate_8h*100:.4f}%/8H"
                         ),
                         legs=[
-                            OpportunityLeg(
+                            OpportunityLeg.model_construct(
                                 exchange=long_perp.exchange,
                                 venue_type="perp",
                                 side="buy",
@@ -492,7 +557,7 @@ class OpportunityEngine:
                                 price=long_perp.ask,
                                 quantity=round(quantity, 6),
                             ),
-                            OpportunityLeg(
+                            OpportunityLeg.model_construct(
                                 exchange=short_perp.exchange,
                                 venue_type="perp",
                                 side="sell",
@@ -517,7 +582,7 @@ class OpportunityEngine:
         return sorted(opportunities, key=lambda opp: opp.expected_pnl_pct, reverse=True)
 
     def _generate_spot_perp_basis(
-        self, quotes: Sequence[MarketQuote], perp_data: Sequence[PerpMarketData]
+        self, quotes: Sequence[MarketQuote], perp_data: Sequence[PerpMarketData], now: datetime
     ) -> list[Opportunity]:
         """Generate spot vs perpetual basis arbitrage opportunities / 현물 vs 무기한 선물 베이시스 차익거래 기회 생성."""
         opportunities: list[Opportunity] = []
@@ -569,24 +634,24 @@ class OpportunityEngine:
                     if expected_pnl_pct <= 0:
                         continue
 
-                    notional = self._settings.simulated_base_notional
+                    notional = self._limits.simulated_base_notional
                     quantity = notional / spot.mid_price
 
-                    opportunity = Opportunity(
+                    opportunity = Opportunity.model_construct(
                         id=str(uuid.uuid4()),
                         type=OpportunityType.SPOT_VS_PERP,
                         symbol=f"{asset}/USDT",
                         spread_bps=round(spread_bps, 3),
                         expected_pnl_pct=round(expected_pnl_pct * 100, 3),
                         notional=round(notional, 2),
-                        timestamp=datetime.utcnow(),
+                        timestamp=now,
                         description=(
                             f"Basis arb: {asset} spot@{spot.mid_price:.2f} vs perp@{perp.mark_price:.2f} "
                             f"({basis_bps:.1f} bps) / 베이시스 차익: {asset} 현물@{spot.mid_price:.2f} vs "
                             f"선물@{perp.mark_price:.2f} ({basis_bps:.1f} bps)"
                         ),
                         legs=[
-                            OpportunityLeg(
+                            OpportunityLeg.model_construct(
                                 exchange=buy_venue.exchange,
                                 venue_type=buy_venue.venue_type,
                                 side="buy",
@@ -594,7 +659,7 @@ class OpportunityEngine:
                                 price=buy_venue.ask if hasattr(buy_venue, "ask") else buy_venue.mark_price,  # type: ignore
                                 quantity=round(quantity, 6),
                             ),
-                            OpportunityLeg(
+                            OpportunityLeg.model_construct(
                                 exchange=sell_venue.exchange,
                                 venue_type=sell_venue.venue_type,
                                 side="sell",
@@ -615,7 +680,7 @@ class OpportunityEngine:
 
         return sorted(opportunities, key=lambda opp: opp.expected_pnl_pct, reverse=True)
 
-    def _generate_perp_perp_spread(self, perp_data: Sequence[PerpMarketData]) -> list[Opportunity]:
+    def _generate_perp_perp_spread(self, perp_data: Sequence[PerpMarketData], now: datetime) -> list[Opportunity]:
         """Generate perpetual vs perpetual spread arbitrage opportunities / 선물 vs 선물 스프레드 차익거래 기회 생성."""
         opportunities: list[Opportunity] = []
         min_oi_usd = 100_000
@@ -638,7 +703,7 @@ class OpportunityEngine:
 
                     if spread_bps <= 0:
                         continue
-                    if spread_bps > self._settings.max_spread_bps:
+                    if spread_bps > self._limits.max_spread_bps:
                         continue
 
                     # Consider funding rate differential
@@ -647,20 +712,20 @@ class OpportunityEngine:
                     expected_pnl_pct = (spread_bps / 100) - 0.001  # Approximate fees for perp trading
                     # Only consider if expected PnL exceeds minimum threshold after fees
                     # 수수료 차감 후 최소 수익률 기준 충족하는 경우만
-                    if expected_pnl_pct <= (self._settings.min_profit_pct / 100):
+                    if expected_pnl_pct <= (self._limits.min_profit_pct / 100):
                         continue
 
-                    notional = self._settings.simulated_base_notional
+                    notional = self._limits.simulated_base_notional
                     quantity = notional / perp1.mark_price
 
-                    opportunity = Opportunity(
+                    opportunity = Opportunity.model_construct(
                         id=str(uuid.uuid4()),
                         type=OpportunityType.PERP_PERP_SPREAD,
                         symbol=f"{asset}/USDT:USDT",
                         spread_bps=round(spread_bps, 3),
                         expected_pnl_pct=round(expected_pnl_pct * 100, 3),
                         notional=round(notional, 2),
-                        timestamp=datetime.utcnow(),
+                        timestamp=now,
                         description=(
                             f"Perp spread: Buy {perp1.exchange} @{self._format_price(perp1.ask)}, "
                             f"Sell {perp2.exchange} @{self._format_price(perp2.bid)} / "
@@ -668,7 +733,7 @@ class OpportunityEngine:
                             f"{perp2.exchange} 매도 @{self._format_price(perp2.bid)}"
                         ),
                         legs=[
-                            OpportunityLeg(
+                            OpportunityLeg.model_construct(
                                 exchange=perp1.exchange,
                                 venue_type="perp",
                                 side="buy",
@@ -676,7 +741,7 @@ class OpportunityEngine:
                                 price=perp1.ask,
                                 quantity=round(quantity, 6),
                             ),
-                            OpportunityLeg(
+                            OpportunityLeg.model_construct(
                                 exchange=perp2.exchange,
                                 venue_type="perp",
                                 side="sell",
@@ -699,6 +764,12 @@ class OpportunityEngine:
 
     async def _filter_by_deposit_status(self, opportunities: list[Opportunity]) -> list[Opportunity]:
         """Filter out opportunities where deposits/withdrawals are blocked / 입출금이 막힌 기회 필터링."""
+        checker = self._deposit_checker
+        # Refresh each venue at most once per batch / 배치당 거래소별 최대 1회 갱신
+        disabled = {
+            exchange: await checker.get_disabled_symbols(exchange)
+            for exchange in {leg.exchange for opp in opportunities for leg in opp.legs}
+        }
         filtered = []
         for opp in opportunities:
             # Check all legs to see if deposits/withdrawals are enabled
@@ -707,9 +778,9 @@ class OpportunityEngine:
                 exchange = leg.exchange
                 base_asset = leg.symbol.split("/")[0] if "/" in leg.symbol else leg.symbol.split(":")[0]
 
-                # Check deposit/withdrawal status
-                tradeable = await self._deposit_checker.is_trading_enabled(exchange, base_asset)
-                if not tradeable:
+                # Most assets are blocked nowhere; the union check skips the per-venue lookup
+                # 대부분의 자산은 어디서도 막혀 있지 않으므로 합집합으로 먼저 확인
+                if checker.is_any_disabled(base_asset) and base_asset in disabled[exchange]:
                     logger.debug(
                         f"Filtering {opp.type} opportunity {opp.symbol}: "
                         f"{base_asset} deposits/withdrawals disabled on {exchange}"
@@ -755,7 +826,7 @@ class OpportunityEngine:
         return value
 
     def _generate_placeholder_opportunities(self) -> list[Opportunity]:
-        now = datetime.utcnow()
+        now = datetime.now(timezone.utc)
         sample = Opportunity(
             id=str(uuid.uuid4()),
             type=OpportunityType.KIMCHI_PREMIUM,
@@ -834,7 +905,7 @@ class OpportunityEngine:
         return (spread / ask) * 10000
 
     def _estimate_fees_pct(self, left: MarketQuote, right: MarketQuote) -> float:
-        fee_pct = self._settings.simulated_fee_bps / 10000
+        fee_pct = self._limits.simulated_fee_bps / 10000
         # Increase fee estimate for perp venues to reflect funding + taker cost.
         if left.venue_type == "perp":
             fee_pct += 0.0005
@@ -553,7 +553,8 @@ class OrderExecutor:
             legs=[leg.model_dump() for leg in opportunity.legs],
             opportunity_metadata=opportunity.metadata,
             was_executed=was_executed,
-            timestamp=opportunity.timestamp,
+            # Column is naive UTC; asyncpg rejects aware datetimes there / 컬럼은 naive UTC
+            timestamp=opportunity.timestamp.replace(tzinfo=None),
         )
         self.db.add(history)
         await self.db.commit()
@@ -5,9 +5,11 @@ import logging
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import select
+from fastapi import Depends
+from sqlalchemy import RowMapping, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.db.session import get_db
 from app.models.db_models import BalanceSnapshot, ExchangeCredential, Order, OrderStatus, User
 
 logger = logging.getLogger(__name__)
@@ -92,20 +94,34 @@ class PortfolioService:
             "snapshot_count": len(balances),
         }
 
-    async def get_open_orders(self, user_id: int) -> list[Order]:
+    async def get_open_orders(self, user_id: int) -> list[RowMapping]:
         """
         Get all open orders for user.
         사용자의 모든 미체결 주문 조회.
+
+        Returns plain column rows rather than ORM instances.
+        ORM 객체 대신 컬럼 행을 반환.
         """
         result = await self.db.execute(
-            select(Order)
+            select(
+                Order.id,
+                Order.exchange,
+                Order.symbol,
+                Order.side,
+                Order.order_type,
+                Order.quantity,
+                Order.price,
+                Order.filled_quantity,
+                Order.status,
+                Order.created_at,
+            )
             .where(
                 Order.user_id == user_id,
                 Order.status.in_([OrderStatus.PENDING, OrderStatus.SUBMITTED, OrderStatus.PARTIALLY_FILLED]),
             )
             .order_by(Order.created_at.desc())
         )
-        return list(result.scalars().all())
+        return list(result.mappings().all())
 
     async def calculate_pnl(self, user_id: int, start_date: datetime | None = None) -> dict[str, Any]:
         """
@@ -164,3 +180,8 @@ class PortfolioService:
             "pnl": pnl,
             "timestamp": datetime.utcnow().isoformat(),
         }
+
+
+async def get_portfolio_service(db: AsyncSession = Depends(get_db)) -> PortfolioService:
+    """FastAPI dependency providing a request-scoped portfolio service / 요청 단위 포트폴리오 서비스 의존성."""
+    return PortfolioService(db)
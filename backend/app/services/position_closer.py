@@ -7,6 +7,7 @@ from datetime import datetime
 import ccxt
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer_group
 
 from app.models.db_models import (
     ExchangeCredential,
@@ -40,7 +41,9 @@ class PositionCloser:
         """
         # Get all positions marked for closing
         result = await self.db.execute(
-            select(Position).where(Position.status == PositionStatus.CLOSING)
+            select(Position)
+            .where(Position.status == PositionStatus.CLOSING)
+            .options(undefer_group("legs"))
         )
         positions = list(result.scalars().all())
 
@@ -309,10 +312,12 @@ class PositionCloser:
         """
         # Get position
         result = await self.db.execute(
-            select(Position).where(
+            select(Position)
+            .where(
                 Position.id == position_id,
                 Position.user_id == user_id,
             )
+            .options(undefer_group("legs"))
         )
         position = result.scalar_one_or_none()
 
@@ -8,6 +8,7 @@ from typing import Any
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer_group
 
 from app.connectors.connector_factory import ConnectorFactory
 from app.core.config import get_settings
@@ -38,7 +39,9 @@ class PositionMonitor:
         """
         # Get all open positions
         result = await self.db.execute(
-            select(Position).where(Position.status == PositionStatus.OPEN)
+            select(Position)
+            .where(Position.status == PositionStatus.OPEN)
+            .options(undefer_group("legs"))
         )
         positions = list(result.scalars().all())
 
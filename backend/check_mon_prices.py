@@ -1,25 +1,27 @@
 #!/usr/bin/env python3
 """Check MON prices across all exchanges"""
-import asyncio
 from app.connectors.upbit_spot import UpbitSpotConnector
 from app.connectors.bithumb_spot import BithumbSpotConnector
 from app.connectors.binance_perp import BinancePerpConnector
 from app.connectors.bybit_perp import BybitPerpConnector
 from app.connectors.okx_spot import OkxSpotConnector
 from app.connectors.fx_rates import KRWUSDForexConnector
+from app.core.http import create_http_client
+from app.core.runtime import run
 
 
 async def check_mon_prices():
     print("Checking MON prices across exchanges...")
     print("=" * 80)
 
-    # Initialize connectors
-    upbit = UpbitSpotConnector(["MON/USDT"])
-    bithumb = BithumbSpotConnector(["MON/USDT"])
-    okx = OkxSpotConnector(["MON/USDT"])
-    binance_perp = BinancePerpConnector(["MON/USDT"])
-    bybit_perp = BybitPerpConnector(["MON/USDT"])
-    fx = KRWUSDForexConnector()
+    # Initialize connectors on one shared connection pool
+    client = create_http_client()
+    upbit = UpbitSpotConnector(["MON/USDT"], client=client)
+    bithumb = BithumbSpotConnector(["MON/USDT"], client=client)
+    okx = OkxSpotConnector(["MON/USDT"], client=client)
+    binance_perp = BinancePerpConnector(["MON/USDT"], client=client)
+    bybit_perp = BybitPerpConnector(["MON/USDT"], client=client)
+    fx = KRWUSDForexConnector(client=client)
 
     # Fetch quotes
     print("\nFetching quotes...\n")
@@ -116,7 +118,8 @@ async def check_mon_prices():
     await binance_perp.close()
     await bybit_perp.close()
     await fx.close()
+    await client.aclose()
 
 
 if __name__ == "__main__":
-    asyncio.run(check_mon_prices())
+    run(check_mon_prices())
@@ -1,14 +1,15 @@
 #!/usr/bin/env python3
 """Check Upbit MON response directly"""
-import asyncio
-import httpx
+import orjson
+from app.core.http import create_http_client
+from app.core.runtime import run
 
 
 async def check_upbit_mon():
     print("Checking Upbit MON API response...")
     print("=" * 80)
 
-    client = httpx.AsyncClient(timeout=5.0)
+    client = create_http_client(timeout=5.0)
 
     try:
         # Get MON orderbook from Upbit
@@ -20,7 +21,7 @@ async def check_upbit_mon():
         print(f"Response:\n{response.text}\n")
 
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             if data:
                 print(f"Number of markets: {len(data)}")
                 for market in data:
@@ -37,21 +38,18 @@ async def check_upbit_mon():
                 print("Empty response array")
     except Exception as e:
         print(f"Error: {e}")
-    finally:
-        await client.aclose()
 
     print("\n" + "=" * 80)
     print("Now checking Bithumb MON...")
     print("=" * 80)
 
-    client = httpx.AsyncClient(timeout=5.0)
     try:
         response = await client.get("https://api.bithumb.com/public/orderbook/MON_KRW")
         print(f"Status: {response.status_code}")
         print(f"Response:\n{response.text}\n")
 
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             print(f"Status: {data.get('status')}")
             if data.get('data'):
                 print(f"Bids: {len(data['data'].get('bids', []))}")
@@ -67,4 +65,4 @@ async def check_upbit_mon():
 
 
 if __name__ == "__main__":
-    asyncio.run(check_upbit_mon())
+    run(check_upbit_mon())
@@ -2,14 +2,12 @@
 import asyncio
 from datetime import datetime
 
-from passlib.context import CryptContext
 from sqlalchemy import select
 
+from app.auth.password import hash_password
 from app.db.session import AsyncSessionLocal
 from app.models.db_models import User
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 
 async def create_user():
     """Create test user."""
@@ -24,7 +22,7 @@ async def create_user():
             return existing_user
 
         # Create new user
-        hashed_password = pwd_context.hash("testpass123")
+        hashed_password = hash_password("testpass123")
         user = User(
             email="test@example.com",
             hashed_password=hashed_password,
@@ -1,21 +1,23 @@
 #!/usr/bin/env python3
 """Debug MON kimchi premium opportunity generation"""
-import asyncio
 from app.connectors.upbit_spot import UpbitSpotConnector
 from app.connectors.bithumb_spot import BithumbSpotConnector
 from app.connectors.binance_perp import BinancePerpConnector
 from app.connectors.fx_rates import KRWUSDForexConnector
 from app.core.config import get_settings
+from app.core.http import create_http_client
+from app.core.runtime import run
 
 async def main():
     print("=" * 80)
     print("Debugging MON Kimchi Premium Opportunity Generation")
     print("=" * 80)
 
-    # Initialize connectors
-    upbit = UpbitSpotConnector(["MON/USDT"])
-    binance_perp = BinancePerpConnector(["MON/USDT"])
-    fx = KRWUSDForexConnector()
+    # Initialize connectors on one shared connection pool
+    client = create_http_client()
+    upbit = UpbitSpotConnector(["MON/USDT"], client=client)
+    binance_perp = BinancePerpConnector(["MON/USDT"], client=client)
+    fx = KRWUSDForexConnector(client=client)
 
     # Fetch data
     print("\nFetching market data...")
@@ -46,8 +48,9 @@ async def main():
     await upbit.close()
     await binance_perp.close()
     await fx.close()
+    await client.aclose()
 
     print("\n" + "=" * 80)
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
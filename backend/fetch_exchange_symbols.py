@@ -2,52 +2,52 @@
 """Fetch supported symbols from all exchanges."""
 import asyncio
 import httpx
+from app.core.http import create_http_client
+from app.core.runtime import run
 
-async def fetch_binance():
-    async with httpx.AsyncClient() as client:
-        resp = await client.get('https://api.binance.com/api/v3/exchangeInfo')
-        data = resp.json()
-        symbols = set()
-        for s in data['symbols']:
-            if s['status'] == 'TRADING' and s['quoteAsset'] == 'USDT':
-                symbols.add(s['baseAsset'])
-        return symbols
+async def fetch_binance(client: httpx.AsyncClient):
+    resp = await client.get('https://api.binance.com/api/v3/exchangeInfo')
+    data = resp.json()
+    symbols = set()
+    for s in data['symbols']:
+        if s['status'] == 'TRADING' and s['quoteAsset'] == 'USDT':
+            symbols.add(s['baseAsset'])
+    return symbols
 
-async def fetch_okx():
-    async with httpx.AsyncClient() as client:
-        resp = await client.get('https://www.okx.com/api/v5/public/instruments?instType=SPOT')
-        data = resp.json()
-        symbols = set()
-        for inst in data.get('data', []):
-            if inst['quoteCcy'] == 'USDT' and inst['state'] == 'live':
-                symbols.add(inst['baseCcy'])
-        return symbols
+async def fetch_okx(client: httpx.AsyncClient):
+    resp = await client.get('https://www.okx.com/api/v5/public/instruments?instType=SPOT')
+    data = resp.json()
+    symbols = set()
+    for inst in data.get('data', []):
+        if inst['quoteCcy'] == 'USDT' and inst['state'] == 'live':
+            symbols.add(inst['baseCcy'])
+    return symbols
 
-async def fetch_upbit():
-    async with httpx.AsyncClient() as client:
-        resp = await client.get('https://api.upbit.com/v1/market/all')
-        data = resp.json()
-        symbols = set()
-        for market in data:
-            if market['market'].startswith('KRW-'):
-                symbols.add(market['market'].replace('KRW-', ''))
-        return symbols
+async def fetch_upbit(client: httpx.AsyncClient):
+    resp = await client.get('https://api.upbit.com/v1/market/all')
+    data = resp.json()
+    symbols = set()
+    for market in data:
+        if market['market'].startswith('KRW-'):
+            symbols.add(market['market'].replace('KRW-', ''))
+    return symbols
 
-async def fetch_bithumb():
-    async with httpx.AsyncClient() as client:
-        resp = await client.get('https://api.bithumb.com/public/ticker/ALL_KRW')
-        data = resp.json()
-        symbols = set()
-        for k in data.get('data', {}).keys():
-            if k != 'date':
-                symbols.add(k)
-        return symbols
+async def fetch_bithumb(client: httpx.AsyncClient):
+    resp = await client.get('https://api.bithumb.com/public/ticker/ALL_KRW')
+    data = resp.json()
+    symbols = set()
+    for k in data.get('data', {}).keys():
+        if k != 'date':
+            symbols.add(k)
+    return symbols
 
 async def main():
-    binance, okx, upbit, bithumb = await asyncio.gather(
-        fetch_binance(), fetch_okx(), fetch_upbit(), fetch_bithumb(),
-        return_exceptions=True
-    )
+    # One pooled HTTP/2 client for every exchange
+    async with create_http_client(timeout=5.0) as client:
+        binance, okx, upbit, bithumb = await asyncio.gather(
+            fetch_binance(client), fetch_okx(client), fetch_upbit(client), fetch_bithumb(client),
+            return_exceptions=True
+        )
 
     print(f"Binance: {len(binance) if not isinstance(binance, Exception) else 'ERROR'}")
     print(f"OKX: {len(okx) if not isinstance(okx, Exception) else 'ERROR'}")
@@ -95,4 +95,4 @@ async def main():
     print(','.join(tradeable_top100))
 
 if __name__ == '__main__':
-    asyncio.run(main())
+    run(main())
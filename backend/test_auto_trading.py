@@ -12,6 +12,8 @@ from app.connectors.fx_rates import KRWUSDForexConnector
 from app.core.config import get_settings
 from app.services.auto_trader import ConservativeStrategy, AggressiveStrategy
 from app.services.opportunity_engine import OpportunityEngine
+from app.core.http import create_http_client
+from app.core.runtime import run
 
 
 async def main():
@@ -23,12 +25,14 @@ async def main():
 
     # Initialize connectors
     print("\n커넥터 초기화 중...")
+    # One shared connection pool for every connector / 모든 커넥터가 커넥션 풀 공유
+    client = create_http_client()
     connectors = [
-        KRWUSDForexConnector(),
-        BinanceSpotConnector(settings.trading_symbols),
-        UpbitSpotConnector(settings.trading_symbols),
-        BithumbSpotConnector(settings.trading_symbols),
-        BinancePerpConnector(settings.trading_symbols),
+        KRWUSDForexConnector(client=client),
+        BinanceSpotConnector(settings.trading_symbols, client=client),
+        UpbitSpotConnector(settings.trading_symbols, client=client),
+        BithumbSpotConnector(settings.trading_symbols, client=client),
+        BinancePerpConnector(settings.trading_symbols, client=client),
     ]
 
     # Create opportunity engine
@@ -50,6 +54,7 @@ async def main():
         for connector in connectors:
             if hasattr(connector, 'close'):
                 await connector.close()
+        await client.aclose()
         return
 
     # Print all opportunities first
@@ -138,6 +143,7 @@ async def main():
     for connector in connectors:
         if hasattr(connector, 'close'):
             await connector.close()
+    await client.aclose()
 
     print("\n" + "=" * 80)
     print("결론:")
@@ -156,7 +162,7 @@ async def main():
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        run(main())
     except KeyboardInterrupt:
         print("\n\n중단됨")
         sys.exit(0)
@@ -3,6 +3,7 @@
 import asyncio
 from app.services.opportunity_engine import OpportunityEngine
 from app.core.config import get_settings
+from app.core.runtime import run
 
 
 async def main():
@@ -81,6 +82,6 @@ async def main():
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        run(main())
     except KeyboardInterrupt:
         print("\n\n중단됨")
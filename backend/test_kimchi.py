@@ -1,6 +1,5 @@
 #!/usr/bin/env python3
 """Test script to debug kimchi premium generation"""
-import asyncio
 import sys
 from collections import defaultdict
 
@@ -8,6 +7,8 @@ from app.connectors.binance_spot import BinanceSpotConnector
 from app.connectors.upbit_spot import UpbitSpotConnector
 from app.connectors.fx_rates import KRWUSDForexConnector
 from app.core.config import get_settings
+from app.core.http import create_http_client
+from app.core.runtime import run
 
 
 async def main():
@@ -17,10 +18,11 @@ async def main():
     print("KIMCHI PREMIUM DEBUG TEST")
     print("=" * 60)
 
-    # Initialize connectors
-    fx_conn = KRWUSDForexConnector()
-    binance = BinanceSpotConnector(settings.trading_symbols)
-    upbit = UpbitSpotConnector(settings.trading_symbols)
+    # Initialize connectors on one shared connection pool
+    client = create_http_client()
+    fx_conn = KRWUSDForexConnector(client=client)
+    binance = BinanceSpotConnector(settings.trading_symbols, client=client)
+    upbit = UpbitSpotConnector(settings.trading_symbols, client=client)
 
     # Fetch quotes
     print("\n1. Fetching FX rate...")
@@ -30,6 +32,7 @@ async def main():
         print(f"   USD/KRW rate: {fx_rate:.2f}")
     else:
         print("   ERROR: No FX quotes!")
+        await client.aclose()
         return
 
     print("\n2. Fetching Binance spot quotes...")
@@ -100,6 +103,7 @@ async def main():
     await fx_conn.close()
     await binance.close()
     await upbit.close()
+    await client.aclose()
 
 
 def evaluate_allocation(premium_pct: float, curve: list) -> float:
@@ -135,7 +139,7 @@ def clamp(value: float) -> float:
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        run(main())
     except KeyboardInterrupt:
         print("\n\nInterrupted by user")
         sys.exit(0)